@@ -15,7 +15,7 @@ from bokeh.command.util import build_single_handler_applications
 
 from ..auth import OAuthProvider
 from ..config import config
-from ..io.rest import REST_PROVIDERS
+from ..io.rest import REST_PROVIDERS, metrics_endpoint, shared_session_info
 from ..io.reload import record_modules, watch
 from ..io.server import INDEX_HTML, get_static_routes
 from ..io.state import state
@@ -108,6 +108,11 @@ class Serve(_BkServe):
             action  = 'store_true',
             help    = "Whether to serve session info on the REST API"
         )),
+        ('--rest-metrics', dict(
+            action  = 'store_true',
+            help    = ("Whether to collect runtime metrics and serve them in the "
+                       "Prometheus text format on the REST API")
+        )),
         ('--session-history', dict(
             action  = 'store',
             type    = int,
@@ -121,6 +126,18 @@ class Serve(_BkServe):
         ('--autoreload', dict(
             action  = 'store_true',
             help    = "Whether to autoreload source when script changes."
+        )),
+        ('--num-threads', dict(
+            action  = 'store',
+            type    = int,
+            help    = "Whether to start a thread pool which events are dispatched to.",
+            default = None
+        )),
+        ('--session-pool', dict(
+            action  = 'store',
+            type    = int,
+            help    = "The number of pre-rendered sessions to keep ready for each application.",
+            default = 0
         ))
     )
 
@@ -160,6 +177,11 @@ class Serve(_BkServe):
         elif args.rest_provider is not None:
             raise ValueError("rest-provider %r not recognized." % args.rest_provider)
 
+        if args.autoreload and args.num_procs != 1:
+            raise ValueError(
+                "--autoreload cannot be combined with --num-procs, "
+                "autoreloading is only supported with a single process."
+            )
         config.autoreload = args.autoreload
 
         if config.autoreload:
@@ -173,12 +195,22 @@ class Serve(_BkServe):
                 for app in applications.values():
                     app.create_document()
 
+        if args.num_threads is not None:
+            config.nthreads = args.num_threads
+
+        config.session_pool = args.session_pool
+
         config.session_history = args.session_history
         if args.rest_session_info:
+            if args.num_procs != 1:
+                patterns.extend(shared_session_info('rest'))
             pattern = REST_PROVIDERS['param'](files, 'rest')
             patterns.extend(pattern)
             state.publish('session_info', state, ['session_info'])
 
+        if args.rest_metrics:
+            patterns.extend(metrics_endpoint('rest'))
+
         if args.oauth_provider:
             config.oauth_provider = args.oauth_provider
             if config.oauth_key and args.oauth_key:
@@ -83,6 +83,39 @@ class _config(_base_config):
     autoreload = param.Boolean(default=False, doc="""
         Whether to autoreload server when script changes.""")
 
+    batch_latency = param.Integer(default=0, bounds=(0, None), doc="""
+        Maximum latency in milliseconds by which model updates on a
+        server session may be delayed so that they can be batched
+        and sent to the frontend in a single message. By default
+        updates are batched until the next tick of the event loop.""")
+
+    cache_max_items = param.Integer(default=None, bounds=(1, None), doc="""
+        Maximum number of values memoized by state.as_cached, once
+        exceeded the least recently used values are evicted.""")
+
+    cache_max_bytes = param.Integer(default=None, bounds=(1, None), doc="""
+        Maximum total size in bytes of the values memoized by
+        state.as_cached, once exceeded the least recently used values
+        are evicted.""")
+
+    nthreads = param.Integer(default=None, bounds=(0, None), doc="""
+        When set to a non-None value a thread pool will be started
+        on which user callbacks triggered by frontend events and
+        periodic callbacks are executed, ensuring that a slow callback
+        does not block other sessions on the server. Model updates
+        resulting from these callbacks are scheduled back onto the
+        event loop. If set to 0 the number of threads is determined
+        automatically.""")
+
+    session_pool = param.Integer(default=0, bounds=(0, None), doc="""
+        The number of pre-rendered sessions to keep ready for each
+        application served by the server. Pooled documents are built
+        in the background without a request, so the pool is disabled
+        for applications which access the request arguments, cookies
+        or headers while rendering or which declare session creation
+        hooks. Requests with query arguments, OAuth and autoreload
+        always bypass the pool.""")
+
     loading_spinner = param.Selector(default='arcs', objects=[
         'arc', 'arcs', 'bar', 'dots', 'petal'], doc="""
         Loading indicator to use when component loading parameter is set.""")
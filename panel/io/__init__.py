@@ -8,7 +8,7 @@ import sys
 
 from ..config import config
 
-from .callbacks import PeriodicCallback # noqa
+from .callbacks import PeriodicCallback, PeriodicFeed # noqa
 from .embed import embed_state # noqa
 from .state import state # noqa
 from .model import add_to_doc, remove_root, diff # noqa
@@ -2,12 +2,23 @@
 Defines callbacks to be executed on a thread or by scheduling it
 on a running bokeh server.
 """
+import asyncio
+import inspect
+import logging
+import math
 import time
+
+from functools import partial
+
 import param
 
-from ..util import edit_readonly
+from tornado.ioloop import IOLoop
+
+from .metrics import metrics
 from .state import state
 
+log = logging.getLogger(__name__)
+
 
 class PeriodicCallback(param.Parameterized):
     """
@@ -44,6 +55,7 @@ class PeriodicCallback(param.Parameterized):
         self._cb = None
         self._updating = False
         self._doc = None
+        self._future = None
 
     @param.depends('running', watch=True)
     def _start(self):
@@ -64,20 +76,39 @@ class PeriodicCallback(param.Parameterized):
             self.start()
 
     def _periodic_callback(self):
-        with edit_readonly(state):
-            state.busy = True
+        thread_pool = state._get_thread_pool() if self._doc else None
+        if thread_pool is None:
+            self._exec_callback()
+        elif self._future is None or self._future.done():
+            # Skip the tick if the previous execution is still running
+            self._future = thread_pool.submit(self._threaded_callback)
+
+    def _threaded_callback(self):
+        doc = self._doc
+        try:
+            state.curdoc = doc
+            self._exec_callback(stop=partial(doc.add_next_tick_callback, self.stop))
+        except Exception:
+            log.exception("Periodic callback failed on thread pool.")
+        finally:
+            state.curdoc = None
+
+    def _exec_callback(self, stop=None):
+        state._set_busy(True)
         try:
-            self.callback()
+            with metrics.time_callback(self, self._doc):
+                self.callback()
         finally:
-            with edit_readonly(state):
-                state.busy = False
+            state._set_busy(False)
         self._counter += 1
+        stop = stop or self.stop
         if self.timeout is not None:
             dt = (time.time() - self._start_time) * 1000
             if dt > self.timeout:
-                self.stop()
+                stop()
+                return
         if self._counter == self.count:
-            self.stop()
+            stop()
 
     @property
     def counter(self):
@@ -124,3 +155,203 @@ class PeriodicCallback(param.Parameterized):
         else:
             self._cb.stop()
         self._cb = None
+
+
+class PeriodicFeed(param.Parameterized):
+    """
+    A PeriodicFeed runs a single producer on a fixed schedule and
+    delivers the latest result to all subscribers, which may belong
+    to any number of sessions. Unlike a PeriodicCallback the feed is
+    not tied to a document, so a data source polled by many sessions
+    is only queried once per period.
+
+    The schedule compensates for drift, i.e. ticks are aligned to the
+    start time rather than to the end of the previous execution, and
+    a tick is skipped if the previous execution is still running. The
+    producer may be a coroutine function; regular functions run on
+    the thread pool if config.nthreads is set.
+    """
+
+    producer = param.Callable(doc="""
+        The callable (or coroutine function) producing the next value
+        of the feed.""")
+
+    period = param.Integer(default=500, bounds=(1, None), doc="""
+        Period in milliseconds at which the producer is executed.""")
+
+    running = param.Boolean(default=False, doc="""
+        Toggles whether the feed is currently running.""")
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._counter = 0
+        self._skipped = 0
+        self._value = None
+        self._last_updated = None
+        self._subscribers = []
+        self._docs = set()
+        self._handle = None
+        self._loop = None
+        self._next = None
+        self._future = None
+        self._updating = False
+
+    @param.depends('running', watch=True)
+    def _toggle(self):
+        if self._updating:
+            return
+        if self.running:
+            self.start()
+        else:
+            self.stop()
+
+    @param.depends('period', watch=True)
+    def _update_period(self):
+        if self._handle is not None:
+            self.stop()
+            self.start()
+
+    def _schedule(self):
+        period = self.period / 1000.
+        now = self._loop.time()
+        self._next += period
+        if self._next <= now:
+            # Skip ticks missed while the event loop was blocked
+            self._next += period * math.ceil((now - self._next) / period)
+        self._handle = self._loop.call_at(self._next, self._tick)
+
+    def _tick(self):
+        self._schedule()
+        if self._future is not None and not self._future.done():
+            # Skip the tick if the previous execution is still running
+            self._skipped += 1
+            return
+        self._future = asyncio.ensure_future(self._produce())
+
+    async def _produce(self):
+        try:
+            if inspect.iscoroutinefunction(self.producer):
+                value = await self.producer()
+            else:
+                thread_pool = state._get_thread_pool()
+                if thread_pool is None:
+                    value = self.producer()
+                else:
+                    value = await self._loop.run_in_executor(thread_pool, self.producer)
+        except Exception:
+            log.exception("Periodic feed producer failed.")
+            return
+        self._counter += 1
+        self._value = value
+        self._last_updated = time.time()
+        for doc, callback in list(self._subscribers):
+            self._deliver(doc, callback, value)
+
+    def _deliver(self, doc, callback, value):
+        if doc is None:
+            try:
+                callback(value)
+            except Exception:
+                log.exception("Periodic feed subscriber failed.")
+        else:
+            doc.add_next_tick_callback(partial(callback, value))
+
+    def _session_destroyed(self, session_context):
+        doc = session_context._document
+        self._docs.discard(doc)
+        self._subscribers = [
+            (d, cb) for d, cb in self._subscribers if d is not doc
+        ]
+        if not self._subscribers:
+            self.stop()
+
+    @property
+    def counter(self):
+        """
+        Returns the number of times the producer has been executed.
+        """
+        return self._counter
+
+    @property
+    def value(self):
+        """
+        Returns the most recent value produced by the feed.
+        """
+        return self._value
+
+    @property
+    def last_updated(self):
+        """
+        Returns the timestamp at which the latest value was produced.
+        """
+        return self._last_updated
+
+    def subscribe(self, callback):
+        """
+        Subscribes a callback to the feed, which will be called with
+        every new value and immediately with the latest value if one
+        is available. When subscribed from a server session the
+        callback is scheduled on the session's document and removed
+        automatically when the session is destroyed. Starts the feed
+        if it is not already running.
+
+        Arguments
+        ---------
+        callback: callable
+          Callable accepting the latest value of the feed.
+        """
+        doc = state.curdoc if state.curdoc and state.curdoc.session_context else None
+        self._subscribers.append((doc, callback))
+        if doc is not None and doc not in self._docs:
+            self._docs.add(doc)
+            doc.on_session_destroyed(self._session_destroyed)
+        if self._last_updated is not None:
+            self._deliver(doc, callback, self._value)
+        if self._handle is None:
+            self.start()
+
+    def unsubscribe(self, callback):
+        """
+        Removes a callback from the subscribers, stopping the feed if
+        no subscribers remain.
+
+        Arguments
+        ---------
+        callback: callable
+          The callable previously passed to subscribe.
+        """
+        self._subscribers = [
+            (doc, cb) for doc, cb in self._subscribers if cb != callback
+        ]
+        if not self._subscribers and self._handle is not None:
+            self.stop()
+
+    def start(self):
+        """
+        Starts running the feed, executing the producer immediately.
+        """
+        if self._handle is not None:
+            raise RuntimeError('Periodic feed has already started.')
+        if not self.running:
+            try:
+                self._updating = True
+                self.running = True
+            finally:
+                self._updating = False
+        self._loop = IOLoop.current()
+        self._next = self._loop.time()
+        self._handle = self._loop.call_at(self._next, self._tick)
+
+    def stop(self):
+        """
+        Stops running the feed.
+        """
+        if self.running:
+            try:
+                self._updating = True
+                self.running = False
+            finally:
+                self._updating = False
+        if self._handle is not None:
+            self._loop.remove_timeout(self._handle)
+        self._handle = None
@@ -2,10 +2,14 @@
 Various utilities for recording and embedding state in a rendered app.
 """
 import os
+import gzip
+import hashlib
 import json
+import multiprocessing
 import uuid
 import param
 import sys
+import threading
 
 from collections import defaultdict
 from contextlib import contextmanager
@@ -57,6 +61,190 @@ def record_events(doc):
             'content': msg.content_json}
 
 
+def _set_values(values, key):
+    """
+    Sets the widget values to the supplied key, ignoring errors.
+    """
+    for (ws, _, _, _), k in zip(values, key):
+        try:
+            for w in ws:
+                w.value = k
+        except Exception:
+            pass
+
+
+def record_states(values, doc, keys, prepare=None):
+    """
+    Sets the widget values to each key in turn and records the events
+    generated by each state.
+
+    Arguments
+    ---------
+    values: list
+      List of tuples of the widgets, widget models, widget values and
+      getter for each embedded widget.
+    doc: bokeh.document.Document
+      The Document to record the events on.
+    keys: iterable
+      The widget values defining the states to record.
+    prepare: tuple or None
+      The state preceding the first key, which the widgets are set to
+      before recording so each state is recorded relative to the state
+      preceding it in the cross product.
+
+    Returns
+    -------
+    List of tuples of the state path and the recorded events, where
+    the events are None if the state could not be set.
+    """
+    from ..config import config
+
+    models = [m for v in values for m in v[1]]
+    if prepare is not None:
+        with always_changed(config.safe_embed):
+            _set_values(values, prepare)
+        doc._held_events = []
+
+    results = []
+    for key in keys:
+        path = []
+        skip = False
+        for i, k in enumerate(key):
+            ws, m, _, g = values[i]
+            try:
+                with always_changed(config.safe_embed):
+                    for w in ws:
+                        w.value = k
+            except Exception:
+                skip = True
+                break
+            path.append(g(m[0]))
+        if skip:
+            doc._held_events = []
+            results.append((tuple(path), None))
+            continue
+
+        # Drop events originating from widgets being varied
+        doc._held_events = [e for e in doc._held_events if e.model not in models]
+        results.append((tuple(path), record_events(doc)))
+    return results
+
+
+def dedupe_events(results, interned=None):
+    """
+    Ensures states with identical event payloads share a single
+    payload, ignoring the header which only differs in the message
+    id.
+    """
+    interned = {} if interned is None else interned
+    deduped = []
+    for path, events in results:
+        if events is not None:
+            events = interned.setdefault((events['metadata'], events['content']), events)
+        deduped.append((path, events))
+    return deduped
+
+
+# State inherited by the forked worker processes exploring the states
+_EXPLORE = None
+
+
+def _init_worker():
+    # Generate globally unique ids for models created while exploring
+    # the states so they do not clash across workers.
+    os.environ['BOKEH_SIMPLE_IDS'] = 'no'
+
+
+def _live_threads():
+    """
+    Returns the threads other than the current one which would not
+    survive a fork, ignoring the tqdm progress monitor.
+    """
+    from tqdm import tqdm
+    monitor = getattr(tqdm, 'monitor', None)
+    return [
+        thread for thread in threading.enumerate()
+        if thread is not threading.current_thread() and thread is not monitor
+    ]
+
+
+def _explore_chunk(bounds):
+    start, end = bounds
+    values, doc, cross_product = _EXPLORE
+    prepare = cross_product[start-1] if start else None
+    results = record_states(values, doc, cross_product[start:end], prepare)
+    return dedupe_events(results)
+
+
+def explore_states(values, doc, cross_product, processes=1, progress=True):
+    """
+    Records the events for each state in the cross product of widget
+    values, optionally partitioning the states across a pool of
+    forked worker processes.
+
+    Forking only copies the current thread, so locks held by other
+    threads at the time of the fork are never released in the
+    workers. Exploration therefore falls back to a single process if
+    non-daemon threads (e.g. a threaded server or a thread pool) are
+    running and warns if daemon threads are running.
+
+    Returns
+    -------
+    List of tuples of the state path and the recorded events.
+    """
+    global _EXPLORE
+    from tqdm import tqdm
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        param.main.warning('Parallel embedding requires the fork start method, '
+                           'which is not available on this platform. Falling '
+                           'back to exploring states in a single process.')
+        processes = 1
+    threads = _live_threads() if processes > 1 else []
+    if any(not thread.daemon for thread in threads):
+        param.main.warning(
+            'Parallel embedding forks the current process, which may '
+            'deadlock the worker processes while other threads are '
+            'running (%s). Falling back to exploring states in a single '
+            'process.' % ', '.join(t.name for t in threads if not t.daemon)
+        )
+        processes = 1
+    elif threads:
+        param.main.warning(
+            'Parallel embedding forks the current process while daemon '
+            'threads are running (%s), the worker processes may deadlock '
+            'if these threads hold any locks.' % ', '.join(t.name for t in threads)
+        )
+    processes = min(processes, len(cross_product))
+
+    if processes <= 1:
+        keys = tqdm(cross_product, leave=False, file=sys.stdout) if progress else cross_product
+        return dedupe_events(record_states(values, doc, keys))
+
+    nchunks = min(len(cross_product), processes*4)
+    size = -(-len(cross_product) // nchunks)
+    chunks = [(i, min(i+size, len(cross_product))) for i in range(0, len(cross_product), size)]
+    bar = tqdm(total=len(cross_product), leave=False, file=sys.stdout) if progress else None
+
+    doc._held_events = []
+    _EXPLORE = (values, doc, cross_product)
+    results, interned = [], {}
+    try:
+        context = multiprocessing.get_context('fork')
+        with context.Pool(processes, initializer=_init_worker) as pool:
+            for (start, end), chunk in zip(chunks, pool.imap(_explore_chunk, chunks)):
+                results.extend(dedupe_events(chunk, interned))
+                if bar is not None:
+                    bar.update(end-start)
+    finally:
+        _EXPLORE = None
+        if bar is not None:
+            bar.close()
+    return results
+
+
 def save_dict(state, key=(), depth=0, max_depth=None, save_path='', load_path=None):
     filename_dict = {}
     for k, v in state.items():
@@ -79,6 +267,47 @@ def save_dict(state, key=(), depth=0, max_depth=None, save_path='', load_path=No
     return filename_dict
 
 
+def save_packed(state, max_depth=None, filename='states.bin', save_path='',
+                load_path=None, compress=False):
+    """
+    Packs the recorded states into a single content-addressed blob
+    file, storing identical payloads only once. Returns the state
+    dictionary with each payload replaced by the [offset, length] of
+    its slice in the blob along with the path or URL of the blob.
+    """
+    filepath = os.path.join(save_path, filename)
+    directory = os.path.dirname(filepath)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    slices = {}
+    with open(filepath, 'wb') as f:
+        def pack(state, depth):
+            index = {}
+            for k, v in state.items():
+                if depth < max_depth:
+                    index[k] = pack(v, depth+1)
+                    continue
+                # The header only differs in the message id
+                digest = hashlib.sha256(
+                    (v['metadata'] + v['content']).encode('utf-8')
+                ).hexdigest()
+                if digest not in slices:
+                    data = json.dumps(v).encode('utf-8')
+                    if compress:
+                        data = gzip.compress(data, mtime=0)
+                    slices[digest] = [f.tell(), len(data)]
+                    f.write(data)
+                index[k] = slices[digest]
+            return index
+        index = pack(state, 0)
+
+    refpath = filepath
+    if load_path:
+        refpath = os.path.join(load_path, filename)
+    return index, refpath
+
+
 def get_watchers(reactive):
     return [w for pwatchers in reactive._param_watchers.values()
             for awatchers in pwatchers.values() for w in awatchers]
@@ -174,7 +403,8 @@ def links_to_jslinks(model, widget):
 
 def embed_state(panel, model, doc, max_states=1000, max_opts=3,
                 json=False, json_prefix='', save_path='./',
-                load_path=None, progress=True, states={}):
+                load_path=None, progress=True, states={}, processes=1,
+                packed=False, compress=False):
     """
     Embeds the state of the application on a State model which allows
     exporting a static version of an app. This works by finding all
@@ -207,9 +437,20 @@ def embed_state(panel, model, doc, max_states=1000, max_opts=3,
       Whether to report progress
     states: dict (default={})
       A dictionary specifying the widget values to embed for each widget
+    processes: int (default=1)
+      The number of processes to explore the states with. The worker
+      processes are forked from the current process, which is only
+      supported on platforms providing the fork start method. Since
+      forking a process with other live threads may deadlock the
+      workers, the states are explored serially if non-daemon threads
+      are running. If None the number of CPUs is used.
+    packed: boolean (default=False)
+      Whether to export the data to a single packed file storing
+      identical states only once, instead of one json file per state.
+      Only applies if json=True.
+    compress: boolean (default=False)
+      Whether to gzip compress the states in the packed file.
     """
-    from tqdm import tqdm
-
     from ..config import config
     from ..layout import Panel
     from ..links import Link
@@ -322,29 +563,19 @@ def embed_state(panel, model, doc, max_states=1000, max_opts=3,
     nested_dict = lambda: defaultdict(nested_dict)
     state_dict = nested_dict()
     changes = False
-    for key in (tqdm(cross_product, leave=False, file=sys.stdout) if progress else cross_product):
+    for path, events in explore_states(values, doc, cross_product, processes, progress):
         sub_dict = state_dict
-        skip = False
-        for i, k in enumerate(key):
-            ws, m, _, g = values[i]
-            try:
-                with always_changed(config.safe_embed):
-                    for w in ws:
-                        w.value = k
-            except Exception:
-                skip = True
-                break
-            sub_dict = sub_dict[g(m[0])]
-        if skip:
-            doc._held_events = []
+        for k in path[:-1]:
+            sub_dict = sub_dict[k]
+        if events is None:
+            if path:
+                sub_dict[path[-1]]
             continue
-
-        # Drop events originating from widgets being varied
-        models = [m for v in values for m in v[1]]
-        doc._held_events = [e for e in doc._held_events if e.model not in models]
-        events = record_events(doc)
         changes |= events['content'] != '{}'
-        if events:
+        if path:
+            # Identical payloads are shared between states
+            sub_dict[path[-1]] = events
+        else:
             sub_dict.update(events)
 
     if not changes:
@@ -357,7 +588,14 @@ def embed_state(panel, model, doc, max_states=1000, max_opts=3,
         except Exception:
             pass
 
-    if json:
+    blob = None
+    if json and packed and values:
+        filename = '_'.join([json_prefix, uuid.uuid4().hex]) + '.bin'
+        state_dict, blob = save_packed(
+            state_dict, max_depth=len(values)-1, filename=filename,
+            save_path=save_path, load_path=load_path, compress=compress
+        )
+    elif json:
         random_dir = '_'.join([json_prefix, uuid.uuid4().hex])
         save_path = os.path.join(save_path, random_dir)
         if load_path is not None:
@@ -366,6 +604,7 @@ def embed_state(panel, model, doc, max_states=1000, max_opts=3,
                                save_path=save_path, load_path=load_path)
 
     state_model.update(json=json, state=state_dict, values=init_vals,
-                       widgets={m[0].ref['id']: i for i, (_, m, _, _) in enumerate(values)})
+                       widgets={m[0].ref['id']: i for i, (_, m, _, _) in enumerate(values)},
+                       blob=blob, compression='gzip' if blob and compress else None)
     doc.add_root(state_model)
     return state_model
@@ -0,0 +1,337 @@
+"""
+Collects runtime metrics of a Panel server, e.g. callback latencies,
+render times and the volume of messages sent to the frontend, and
+renders them in the Prometheus text exposition format.
+"""
+import threading
+import time
+
+from contextlib import contextmanager
+
+from bokeh.server.callbacks import NextTickCallback
+from tornado.ioloop import IOLoop
+
+from .state import state
+
+#: Default histogram buckets (in seconds)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    items = ','.join(
+        '%s="%s"' % (k, str(v).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'))
+        for k, v in labels
+    )
+    return '{%s}' % items
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class Metric:
+    """
+    Baseclass for a metric which holds one value per combination of
+    label values.
+    """
+
+    kind = None
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple(zip(self.labels, labels))
+
+    def remove(self, *labels):
+        with self._lock:
+            self._values.pop(self._key(labels), None)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, k, v) for k, v in self._values.items()]
+
+    def render(self):
+        lines = [
+            '# HELP %s %s' % (self.name, self.documentation),
+            '# TYPE %s %s' % (self.name, self.kind)
+        ]
+        for name, labels, value in self.samples():
+            lines.append('%s%s %s' % (name, _format_labels(labels), _format_value(value)))
+        return lines
+
+
+class Counter(Metric):
+    """
+    A monotonically increasing value.
+    """
+
+    kind = 'counter'
+
+    def inc(self, amount=1, *labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """
+    A value which may go up and down. If a function is supplied the
+    gauge is evaluated lazily whenever the metrics are collected.
+    """
+
+    kind = 'gauge'
+
+    def __init__(self, name, documentation, labels=(), function=None):
+        super().__init__(name, documentation, labels)
+        self.function = function
+
+    def set(self, value, *labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self):
+        if self.function is not None:
+            try:
+                self.set(self.function())
+            except Exception:
+                pass
+        return super().samples()
+
+
+class Histogram(Metric):
+    """
+    Counts observations in cumulative buckets and tracks their sum.
+    """
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value, *labels):
+        key = self._key(labels)
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = [[0]*len(self.buckets), 0, 0]
+            counts, _, _ = entry = self._values[key]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self):
+        samples = []
+        for name, labels, (counts, total, count) in super().samples():
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                samples.append((name+'_bucket', labels+(('le', _format_value(bound)),), cumulative))
+            samples.append((name+'_sum', labels, total))
+            samples.append((name+'_count', labels, count))
+        return samples
+
+
+class Metrics:
+    """
+    Registry of the runtime metrics collected by a Panel server.
+    Collection is disabled until the metrics endpoint is served, at
+    which point components start recording their callback and render
+    times and the server starts monitoring the event loop lag.
+
+    Since metrics are collected per process a server launched with
+    multiple processes reports the metrics of the process handling
+    the request.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # Handles of the pending event loop probes indexed by loop
+        self._lag_probes = {}
+        self.callback_duration = Histogram(
+            'panel_callback_duration_seconds',
+            'Time taken to process callbacks triggered by frontend events '
+            'and periodic callbacks by component type.', ['component']
+        )
+        self.app_callback_duration = Histogram(
+            'panel_app_callback_duration_seconds',
+            'Time taken to process callbacks in sessions by application.', ['app']
+        )
+        self.render_duration = Histogram(
+            'panel_render_duration_seconds',
+            'Time taken to render a component into a session.', ['component']
+        )
+        self.patch_messages = Counter(
+            'panel_patch_doc_messages_total',
+            'Number of PATCH-DOC messages sent to the frontend.'
+        )
+        self.patch_bytes = Counter(
+            'panel_patch_doc_bytes_total',
+            'Number of bytes of PATCH-DOC messages sent to the frontend.'
+        )
+        self.loop_lag = Gauge(
+            'panel_event_loop_lag_seconds',
+            'Delay in scheduling the most recent event loop probe.'
+        )
+        self.loop_lag_duration = Histogram(
+            'panel_event_loop_lag_duration_seconds',
+            'Distribution of the delays in scheduling event loop probes.'
+        )
+        self.live_sessions = Gauge(
+            'panel_live_sessions', 'Number of live sessions.',
+            function=lambda: len(self._documents())
+        )
+        self.live_models = Gauge(
+            'panel_live_models', 'Number of Bokeh models in live sessions.',
+            function=lambda: sum(len(doc._all_models) for doc in self._documents())
+        )
+        self.next_tick_callbacks = Gauge(
+            'panel_next_tick_callbacks',
+            'Number of pending next-tick callbacks in live sessions.',
+            function=self._pending_next_tick
+        )
+        self.pending_updates = Gauge(
+            'panel_pending_updates',
+            'Number of model updates waiting for the session to be unlocked.',
+            function=lambda: sum(len(cbs) for cbs in list(state._pending_updates.values()))
+        )
+        self._metrics = [
+            self.callback_duration, self.app_callback_duration,
+            self.render_duration, self.patch_messages, self.patch_bytes,
+            self.loop_lag, self.loop_lag_duration, self.live_sessions,
+            self.live_models, self.next_tick_callbacks, self.pending_updates
+        ]
+
+    def _documents(self):
+        docs = []
+        for view in list(state._views.values()):
+            doc = view[2]
+            if doc.session_context and doc not in docs:
+                docs.append(doc)
+        return docs
+
+    def _pending_next_tick(self):
+        return sum(
+            isinstance(cb, NextTickCallback)
+            for doc in self._documents() for cb in doc.session_callbacks
+        )
+
+    def _record_session(self, doc, duration):
+        session_context = getattr(doc, 'session_context', None)
+        if session_context is None:
+            return
+        server_context = getattr(session_context, 'server_context', None)
+        app_context = getattr(server_context, 'application_context', None)
+        self.app_callback_duration.observe(duration, getattr(app_context, 'url', None) or '/')
+        info = state.session_info['sessions'].get(session_context.id)
+        if info is not None:
+            info['callbacks'] = info.get('callbacks', 0) + 1
+            info['callback_time'] = info.get('callback_time', 0) + duration
+
+    @contextmanager
+    def time_callback(self, obj, doc=None):
+        """
+        Records the time taken to process a callback on the supplied
+        object by component type and, if the Document belongs to a
+        session, by the application serving the session.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.callback_duration.observe(duration, type(obj).__name__)
+            if doc is not None:
+                self._record_session(doc, duration)
+
+    @contextmanager
+    def time_render(self, obj):
+        """
+        Records the time taken to render the supplied object.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.render_duration.observe(time.perf_counter() - start, type(obj).__name__)
+
+    def record_message(self, msg):
+        """
+        Records a PATCH-DOC message sent to the frontend.
+        """
+        if not self.enabled:
+            return
+        nbytes = len(msg.header_json) + len(msg.metadata_json) + len(msg.content_json)
+        for _, payload in msg.buffers:
+            nbytes += getattr(payload, 'nbytes', None) or len(payload)
+        self.patch_messages.inc()
+        self.patch_bytes.inc(nbytes)
+
+    def monitor_loop(self, interval=1):
+        """
+        Periodically probes the current event loop, recording the
+        delay between the time a probe was scheduled for and the time
+        it actually ran.
+
+        Arguments
+        ---------
+        interval: float
+          The interval between probes in seconds.
+        """
+        loop = IOLoop.current()
+        if loop in self._lag_probes:
+            return
+
+        def probe(expected):
+            now = loop.time()
+            lag = max(now-expected, 0)
+            self.loop_lag.set(lag)
+            self.loop_lag_duration.observe(lag)
+            self._lag_probes[loop] = loop.call_at(now+interval, probe, now+interval)
+
+        start = loop.time()+interval
+        self._lag_probes[loop] = loop.call_at(start, probe, start)
+
+    def stop(self):
+        """
+        Stops probing the current event loop and disables the
+        collection of metrics, e.g. when the server is stopped.
+        """
+        loop = IOLoop.current()
+        handle = self._lag_probes.pop(loop, None)
+        if handle is not None:
+            loop.remove_timeout(handle)
+        self.enabled = False
+
+    def render(self):
+        """
+        Returns the current metrics in the Prometheus text format.
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
@@ -11,6 +11,8 @@ from bokeh.protocol import Protocol
 
 from .state import state
 
+_protocol = Protocol()
+
 #---------------------------------------------------------------------
 # Public API
 #---------------------------------------------------------------------
@@ -29,7 +31,7 @@ def diff(doc, binary=True, events=None):
         if (hasattr(e, 'hint') and isinstance(e.hint, ColumnDataChangedEvent)
             and e.hint.cols is not None):
             e.hint.cols = None
-    msg = Protocol().create("PATCH-DOC", events, use_buffers=binary)
+    msg = _protocol.create("PATCH-DOC", events, use_buffers=binary)
     doc._held_events = [e for e in doc._held_events if e not in events]
     return msg
 
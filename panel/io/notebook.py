@@ -53,6 +53,24 @@ def _jupyter_server_extension_paths():
     return [{"module": "panel.io.jupyter_server_extension"}]
 
 
+def _pack_message(msg):
+    """
+    Packs a bokeh protocol message into the data, metadata and
+    buffers of a single comm message. The JSON content is sent as is
+    while the header, metadata and buffer headers are stored on the
+    comm metadata so that binary buffers can be sent as raw bytes
+    alongside the content in the same frame.
+    """
+    metadata = {
+        'msg_type': 'packed',
+        'header': msg.header_json,
+        'metadata': msg.metadata_json,
+        'buffers': [json.dumps(header) for header, _ in msg.buffers]
+    }
+    buffers = [payload for _, payload in msg.buffers]
+    return msg.content_json, metadata, buffers
+
+
 def push(doc, comm, binary=True):
     """
     Pushes events stored on the document across the provided comm.
@@ -60,12 +78,8 @@ def push(doc, comm, binary=True):
     msg = diff(doc, binary=binary)
     if msg is None:
         return
-    comm.send(msg.header_json)
-    comm.send(msg.metadata_json)
-    comm.send(msg.content_json)
-    for header, payload in msg.buffers:
-        comm.send(json.dumps(header))
-        comm.send(buffers=[payload])
+    data, metadata, buffers = _pack_message(msg)
+    comm.send(data, metadata=metadata, buffers=buffers)
 
 
 def push_on_root(ref):
@@ -291,7 +305,7 @@ def show_server(panel, notebook_url, port):
 
 def show_embed(panel, max_states=1000, max_opts=3, json=False,
                json_prefix='', save_path='./', load_path=None,
-               progress=True, states={}):
+               progress=True, states={}, processes=1):
     """
     Renders a static version of a panel in a notebook by evaluating
     the set of states defined by the widgets in the model. Note
@@ -316,6 +330,10 @@ def show_embed(panel, max_states=1000, max_opts=3, json=False,
       Whether to report progress
     states: dict (default={})
       A dictionary specifying the widget values to embed for each widget
+    processes: int (default=1)
+      The number of processes to explore the states with, falls
+      back to a single process if other non-daemon threads are
+      running since forking them may deadlock the workers
     """
     from IPython.display import publish_display_data
     from ..config import config
@@ -326,7 +344,7 @@ def show_embed(panel, max_states=1000, max_opts=3, json=False,
         model = panel.get_root(doc, comm)
         embed_state(panel, model, doc, max_states, max_opts,
                     json, json_prefix, save_path, load_path, progress,
-                    states)
+                    states, processes)
     publish_display_data(*render_model(model))
 
 
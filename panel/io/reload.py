@@ -1,17 +1,38 @@
+import ctypes
+import ctypes.util
 import fnmatch
+import logging
 import os
+import struct
 import sys
+import threading
 import types
 
 from contextlib import contextmanager
 from functools import partial
+from weakref import WeakSet
+
+from tornado.ioloop import IOLoop
 
-from .callbacks import PeriodicCallback
 from .state import state
 
+log = logging.getLogger('panel.io.reload')
+
 _watched_files = set()
 _modules = set()
-_callbacks = {}
+_sessions = WeakSet()
+
+# File watchers indexed by the IOLoop of the server they belong to
+_watchers = {}
+
+# inotify flags, see inotify(7)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+IN_WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
 
 # List of paths to ignore
 DEFAULT_FOLDER_BLACKLIST = [
@@ -59,14 +80,43 @@ def file_is_in_folder_glob(filepath, folderpath_glob):
     file_dir = os.path.dirname(filepath) + "/"
     return fnmatch.fnmatch(file_dir, folderpath_glob)
 
+def start_watcher():
+    """
+    Starts the file watcher of the server running on the current
+    IOLoop if it is not running yet.
+    """
+    loop = IOLoop.current()
+    watcher = _watchers.get(loop)
+    if watcher is None:
+        watcher = _watchers[loop] = _FileWatcher()
+        watcher.start()
+    return watcher
+
+def stop_watcher():
+    """
+    Stops the file watcher of the server running on the current
+    IOLoop, e.g. when the server is stopped.
+    """
+    watcher = _watchers.pop(IOLoop.current(), None)
+    if watcher is not None:
+        watcher.stop()
+
 def autoreload_watcher():
     """
-    Installs a periodic callback which checks for changes in watched
-    files and sys.modules.
+    Registers the current session with the file watcher of the
+    server, starting the watcher if it is not running yet. The
+    session is reloaded whenever a watched file or a module it
+    depends on changes.
     """
-    cb = partial(_reload_on_update, {})
-    _callbacks[state.curdoc] = pcb = PeriodicCallback(callback=cb)
-    pcb.start()
+    doc = state.curdoc
+    watcher = _watchers.get(IOLoop.current())
+    if watcher is None:
+        start_watcher()
+    else:
+        watcher.sync()
+    if doc is not None and doc not in _sessions:
+        _sessions.add(doc)
+        doc.on_session_destroyed(_session_destroyed)
 
 def watch(filename):
     """
@@ -74,7 +124,7 @@ def watch(filename):
 
     All imported modules are watched by default.
     """
-    _watched_files.add(filename)
+    _watched_files.add(os.path.abspath(filename))
 
 @contextmanager
 def record_modules():
@@ -109,44 +159,255 @@ def record_modules():
         except Exception:
             continue
 
-def _reload(module=None):
-    if module is not None:
-        for module in _modules:
-            del sys.modules[module]
-    if state.curdoc in _callbacks:
-        _callbacks[state.curdoc].stop()
-        del _callbacks[state.curdoc]
-    if state.location:
-        state.location.reload = True
-
-def _check_file(modify_times, path, module=None):
+def _session_destroyed(session_context):
+    _sessions.discard(session_context._document)
+
+def _module_path(module):
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    if path.endswith(".pyc") or path.endswith(".pyo"):
+        path = path[:-1]
+    return os.path.abspath(path)
+
+def _module_paths():
+    """
+    Returns a dictionary mapping from the paths of the watched modules
+    to the module names.
+    """
+    paths = {}
+    for module_name in list(_modules):
+        # Some modules play games with sys.modules (e.g. email/__init__.py
+        # in the standard library), and occasionally this can cause strange
+        # failures in getattr.  Just ignore anything that's not an ordinary
+        # module.
+        module = sys.modules.get(module_name)
+        if not isinstance(module, types.ModuleType):
+            continue
+        path = _module_path(module)
+        if path:
+            paths[path] = module_name
+    return paths
+
+def _dependencies(module):
+    """
+    Returns the names of the watched modules referenced in the
+    namespace of the supplied module.
+    """
+    deps = set()
+    for value in list(vars(module).values()):
+        if isinstance(value, types.ModuleType):
+            name = value.__name__
+        else:
+            name = getattr(value, '__module__', None)
+        if isinstance(name, str) and name in _modules and name != module.__name__:
+            deps.add(name)
+    return deps
+
+def _dependents(module_names):
+    """
+    Returns the supplied module names along with the names of all
+    watched modules which (transitively) depend on them.
+    """
+    graph = {}
+    for name in _modules:
+        module = sys.modules.get(name)
+        if isinstance(module, types.ModuleType):
+            graph[name] = _dependencies(module)
+    stale = set(module_names)
+    while True:
+        new = {name for name, deps in graph.items() if name not in stale and deps & stale}
+        if not new:
+            return stale
+        stale |= new
+
+def _affected(doc, changed, stale):
+    """
+    Whether the session for the supplied Document has to be reloaded
+    given the changed file paths and the stale module names.
+    """
+    modules = list(getattr(doc, '_modules', []))
+    if not modules:
+        return True
+    for module in modules:
+        if _module_path(module) in changed or _dependencies(module) & stale:
+            return True
+    return False
+
+def _reload(doc):
+    location = state._locations.get(doc)
+    if location is not None:
+        location.reload = True
+
+def _reload_sessions(changed):
+    """
+    Removes the stale modules from sys.modules and reloads all sessions
+    affected by a change to the supplied files.
+    """
+    stale = _dependents({
+        module for path, module in _module_paths().items() if path in changed
+    })
+    affected = [doc for doc in list(_sessions) if _affected(doc, changed, stale)]
+    for module in stale:
+        sys.modules.pop(module, None)
+    for doc in affected:
+        _sessions.discard(doc)
+        if doc.session_context:
+            doc.add_next_tick_callback(partial(_reload, doc))
+        else:
+            _reload(doc)
+
+def _check_file(modify_times, path):
+    """
+    Records the modification time of the file and returns whether it
+    changed since it was last checked.
+    """
     try:
         modified = os.stat(path).st_mtime
     except Exception:
-        return
+        return False
     if path not in modify_times:
         modify_times[path] = modified
-        return
+        return False
     if modify_times[path] != modified:
-        _reload(module)
         modify_times[path] = modified
+        return True
+    return False
 
 def _reload_on_update(modify_times):
-    for module_name in _modules:
-        # Some modules play games with sys.modules (e.g. email/__init__.py
-        # in the standard library), and occasionally this can cause strange
-        # failures in getattr.  Just ignore anything that's not an ordinary
-        # module.
-        if not module_name in sys.modules:
-            continue
-        module = sys.modules[module_name]
-        if not isinstance(module, types.ModuleType):
-            continue
-        path = getattr(module, "__file__", None)
-        if not path:
-            continue
-        if path.endswith(".pyc") or path.endswith(".pyo"):
-            path = path[:-1]
-        _check_file(modify_times, path, module_name)
-    for path in _watched_files:
-        _check_file(modify_times, path)
+    """
+    Checks all watched files and modules once, reloading the affected
+    sessions if any of them changed.
+    """
+    paths = set(_module_paths()) | _watched_files
+    changed = {path for path in paths if _check_file(modify_times, path)}
+    if changed:
+        _reload_sessions(changed)
+    return changed
+
+def _libc_inotify():
+    """
+    Returns the C library if it supports inotify, otherwise None.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (AttributeError, OSError):
+        return None
+    return libc
+
+
+class _FileWatcher:
+    """
+    Server-wide watcher checking the watched files and modules for
+    changes. Uses inotify where available and otherwise falls back to
+    a single thread polling the modification times. The watched paths
+    and their modification times are shared with the polling thread
+    and are therefore guarded by a lock.
+    """
+
+    interval = 0.5
+
+    def __init__(self):
+        self._loop = IOLoop.current()
+        self._modify_times = {}
+        self._paths = set()
+        self._fd = None
+        self._dirs = {}
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def start(self):
+        libc = _libc_inotify()
+        if libc is not None:
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                self._libc, self._fd = libc, fd
+        self.sync()
+        if self._fd is None:
+            self._thread = threading.Thread(
+                target=self._poll, name='panel-autoreload', daemon=True
+            )
+            self._thread.start()
+        else:
+            self._loop.add_handler(self._fd, self._on_events, IOLoop.READ)
+
+    def stop(self):
+        self._stopped.set()
+        if self._fd is not None:
+            self._loop.remove_handler(self._fd)
+            os.close(self._fd)
+            self._fd = None
+            self._dirs.clear()
+        if self._thread is not None:
+            self._thread.join(self.interval*2)
+            self._thread = None
+
+    def sync(self):
+        """
+        Records the modification times of newly watched files and
+        starts watching their directories.
+        """
+        paths = set(_module_paths()) | _watched_files
+        with self._lock:
+            for path in paths - self._paths:
+                _check_file(self._modify_times, path)
+            self._paths = paths
+        if self._fd is None:
+            return
+        for directory in {os.path.dirname(path) for path in paths}:
+            if directory in self._dirs.values():
+                continue
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), IN_WATCH_MASK
+            )
+            if wd >= 0:
+                self._dirs[wd] = directory
+
+    def _changed(self, paths=None):
+        """
+        Returns the watched paths (optionally restricted to the
+        supplied paths) which changed since they were last checked.
+        """
+        with self._lock:
+            paths = self._paths if paths is None else paths & self._paths
+            return {path for path in paths if _check_file(self._modify_times, path)}
+
+    def _poll(self):
+        while not self._stopped.wait(self.interval):
+            changed = self._changed()
+            if changed:
+                self._loop.add_callback(self._notify, changed)
+
+    def _on_events(self, fd, events):
+        paths = set()
+        while True:
+            try:
+                buf = os.read(fd, 65536)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, _, _, length = struct.unpack_from('iIII', buf, offset)
+                name = buf[offset+16:offset+16+length].rstrip(b'\0')
+                offset += 16 + length
+                if wd in self._dirs and name:
+                    paths.add(os.path.join(self._dirs[wd], os.fsdecode(name)))
+        changed = self._changed(paths)
+        if changed:
+            self._notify(changed)
+
+    def _notify(self, changed):
+        if self._stopped.is_set():
+            return
+        try:
+            _reload_sessions(changed)
+        except Exception:
+            log.exception('Failed to reload sessions after file change.')
+        self.sync()
@@ -3,6 +3,8 @@ Patches bokeh resources to make it easy to add external JS and CSS
 resources via the panel.config object.
 """
 import glob
+import gzip
+import hashlib
 import json
 import os
 
@@ -16,11 +18,17 @@ from bokeh.embed.bundle import (
     bundle_models
 )
 
+from bokeh.model import Model
 from bokeh.resources import Resources as BkResources
 from jinja2 import Environment, Markup, FileSystemLoader
 
 from ..util import url_path
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 
 with open(Path(__file__).parent.parent / 'package.json') as f:
     package_json = json.load(f)
@@ -52,11 +60,118 @@ LOCAL_DIST = "static/extensions/panel/"
 
 extension_dirs['panel'] = str(DIST_DIR)
 
+# File extensions of assets which are worth compressing
+COMPRESSIBLE = ('.css', '.js', '.json', '.map', '.svg', '.html', '.txt')
+
+
+class Asset:
+    """
+    The contents of a static asset along with its content hash and
+    lazily computed precompressed variants.
+    """
+
+    __slots__ = ('path', 'mtime', 'content', 'hash', '_text', '_encodings')
+
+    def __init__(self, path, mtime, content):
+        self.path = path
+        self.mtime = mtime
+        self.content = content
+        self.hash = hashlib.md5(content).hexdigest()
+        self._text = None
+        self._encodings = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = self.content.decode('utf-8')
+        return self._text
+
+    @property
+    def encodings(self):
+        """
+        Mapping from content encoding to the compressed content,
+        containing only the encodings which reduce the asset size.
+        """
+        if self._encodings is None:
+            encodings = {}
+            if brotli is not None:
+                encodings['br'] = brotli.compress(self.content)
+            encodings['gzip'] = gzip.compress(self.content, compresslevel=9, mtime=0)
+            self._encodings = {
+                enc: data for enc, data in encodings.items()
+                if len(data) < len(self.content)
+            }
+        return self._encodings
+
+
+class AssetCache:
+    """
+    Caches static assets read from disk, invalidating an entry
+    whenever the modification time of the file changes.
+    """
+
+    def __init__(self):
+        self._assets = {}
+        self._globs = {}
+
+    def get(self, path):
+        """
+        Returns the Asset for the supplied path or None if the file
+        does not exist.
+        """
+        path = str(path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._assets.pop(path, None)
+            return None
+        asset = self._assets.get(path)
+        if asset is None or asset.mtime != mtime:
+            with open(path, 'rb') as f:
+                asset = Asset(path, mtime, f.read())
+            self._assets[path] = asset
+        return asset
+
+    def glob(self, directory, pattern):
+        """
+        Returns the sorted list of files in the directory matching the
+        pattern, rescanning only when the directory is modified.
+        """
+        directory = str(directory)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+        key = (directory, pattern)
+        cached = self._globs.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, sorted(glob.glob(os.path.join(directory, pattern))))
+            self._globs[key] = cached
+        return list(cached[1])
+
+    def versioned(self, url, path):
+        """
+        Appends the content hash of the asset at the supplied path to
+        the URL so it can be cached indefinitely by the browser.
+        """
+        asset = self.get(path)
+        if asset is None or '?' in url:
+            return url
+        return f'{url}?v={asset.hash}'
+
+
+assets = AssetCache()
+
+# LRU cache of the computed js_files keyed by the Resources
+# configuration and the registered models
+_JS_FILES = OrderedDict()
+_JS_FILES_SIZE = 16
+
 
 def loading_css():
     from ..config import config
-    with open(ASSETS_DIR / f'{config.loading_spinner}_spinner.svg', encoding='utf-8') as f:
-        svg = f.read().replace('\n', '').format(color=config.loading_color)
+    svg = assets.get(ASSETS_DIR / f'{config.loading_spinner}_spinner.svg').text
+    svg = svg.replace('\n', '').format(color=config.loading_color)
     b64 = b64encode(svg.encode('utf-8')).decode('utf-8')
     return f"""
     .bk.pn-loading.{config.loading_spinner}:before {{
@@ -74,7 +189,10 @@ def bundled_files(model, file_type='javascript'):
         filepath = url_path(url)
         test_filepath = filepath.split('?')[0]
         if RESOURCE_MODE == 'server' and os.path.isfile(os.path.join(bdir, test_filepath)):
-            files.append(f'static/extensions/panel/bundled/{name}/{filepath}')
+            files.append(assets.versioned(
+                f'static/extensions/panel/bundled/{name}/{filepath}',
+                os.path.join(bdir, test_filepath)
+            ))
         else:
             files.append(url)
     return files
@@ -137,19 +255,14 @@ class Resources(BkResources):
         from ..config import config
         raw = super(Resources, self).css_raw
         for cssf in config.css_files:
-            if not os.path.isfile(cssf):
-                continue
-            with open(cssf, encoding='utf-8') as f:
-                css_txt = f.read()
+            asset = assets.get(cssf) if os.path.isfile(cssf) else None
+            if asset is not None and asset.text not in raw:
+                raw.append(asset.text)
+        if self.mode == 'inline':
+            for cssf in assets.glob(DIST_DIR / 'css', '*.css'):
+                css_txt = assets.get(cssf).text
                 if css_txt not in raw:
                     raw.append(css_txt)
-        for cssf in glob.glob(str(DIST_DIR / 'css' / '*.css')):
-            if self.mode != 'inline':
-                break
-            with open(cssf, encoding='utf-8') as f:
-                css_txt = f.read()
-            if css_txt not in raw:
-                raw.append(css_txt)
 
         if config.loading_spinner:
             raw.append(loading_css())
@@ -158,6 +271,23 @@ class Resources(BkResources):
     @property
     def js_files(self):
         from ..config import config
+        key = (
+            self.mode, self.root_url if self.mode == 'server' else None,
+            self.version, self.minified, self.legacy, tuple(self.components('js')),
+            self.path_versioner, tuple(config.js_files.values()),
+            # Models define external resources, so the files change
+            # whenever a model is registered or redefined
+            tuple(map(id, Model.model_class_reverse_map.values()))
+        )
+        if key in _JS_FILES:
+            _JS_FILES.move_to_end(key)
+        else:
+            _JS_FILES[key] = self._js_files(config)
+            if len(_JS_FILES) > _JS_FILES_SIZE:
+                _JS_FILES.popitem(last=False)
+        return list(_JS_FILES[key])
+
+    def _js_files(self, config):
         files = super(Resources, self).js_files
         js_files = files + list(config.js_files.values())
 
@@ -170,10 +300,10 @@ class Resources(BkResources):
         if require_index:
             requirejs = js_files.pop(require_index[0])
             if any('ace' in jsf for jsf in js_files):
-                js_files.append(dist_dir + 'pre_require.js')
+                js_files.append(self._dist_url(dist_dir, 'pre_require.js'))
             js_files.append(requirejs)
             if any('ace' in jsf for jsf in js_files):
-                js_files.append(dist_dir + 'post_require.js')
+                js_files.append(self._dist_url(dist_dir, 'post_require.js'))
         return js_files
 
     @property
@@ -194,12 +324,21 @@ class Resources(BkResources):
             dist_dir = urljoin(self.root_url, LOCAL_DIST)
         else:
             dist_dir = CDN_DIST
-        for cssf in glob.glob(str(DIST_DIR / 'css' / '*.css')):
-            if self.mode == 'inline':
-                break
-            files.append(dist_dir + f'css/{os.path.basename(cssf)}')
+        if self.mode != 'inline':
+            for cssf in assets.glob(DIST_DIR / 'css', '*.css'):
+                files.append(self._dist_url(dist_dir, f'css/{os.path.basename(cssf)}'))
         return files
 
+    def _dist_url(self, dist_dir, path):
+        """
+        Returns the URL of a file in the panel dist directory, adding
+        the content hash when it is served by the panel server.
+        """
+        url = dist_dir + path
+        if self.mode == 'server':
+            url = assets.versioned(url, DIST_DIR / path)
+        return url
+
     @property
     def render_js(self):
         return JS_RESOURCES.render(
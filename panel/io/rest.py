@@ -1,9 +1,13 @@
+import atexit
+import hashlib
 import json
 import os
 import pkg_resources
+import shutil
 import tempfile
 import traceback
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 from urllib.parse import parse_qs
 
@@ -11,8 +15,10 @@ import param
 
 from runpy import run_path
 from tornado import web
+from tornado.ioloop import IOLoop
 from tornado.wsgi import WSGIContainer
 
+from .metrics import metrics
 from .state import state
 
 
@@ -46,39 +52,258 @@ class BaseHandler(web.RequestHandler):
                 }
             }))
 
+class _EndpointCache:
+    """
+    Caches the serialized values of the parameters published on an
+    endpoint along with an ETag derived from them, invalidating the
+    cache whenever one of the parameters changes.
+    """
+
+    def __init__(self, parameterized, parameters):
+        self.parameterized = parameterized
+        self.parameters = parameters
+        self._version = 0
+        self._cached = None
+        self._watcher = parameterized.param.watch(self._invalidate, parameters)
+
+    def _invalidate(self, *events):
+        self._version += 1
+        self._cached = None
+
+    @property
+    def cached(self):
+        return self._cached
+
+    def destroy(self):
+        """
+        Stops invalidating the cache when the parameters change.
+        """
+        self.parameterized.param.unwatch(self._watcher)
+
+    async def evaluate(self, values, executor):
+        """
+        Sets the supplied parameter values and returns the serialized
+        values of the published parameters along with their ETag.
+
+        The parameters are set on the event loop since the published
+        object may be linked to live sessions, only the serialization
+        of a snapshot of the resulting values runs on the executor.
+        """
+        if values:
+            try:
+                self.parameterized.param.set_param(**values)
+            except ValueError as e:
+                raise HTTPError(reason=str(e), status_code=400)
+        cached = self._cached
+        if cached is not None:
+            return cached
+        version = self._version
+        snapshot = ParamHandler.snapshot(self.parameterized, self.parameters)
+        body = await IOLoop.current().run_in_executor(
+            executor, ParamHandler.serialize, self.parameterized, snapshot
+        )
+        cached = (body, '"%s"' % hashlib.md5(body.encode('utf-8')).hexdigest())
+        if version == self._version:
+            self._cached = cached
+        return cached
+
+
 class ParamHandler(BaseHandler):
+    """
+    Serves the parameters published with state.publish.
+
+    A GET request sets the parameters supplied as JSON encoded query
+    arguments and returns the values of all published parameters,
+    tagged with an ETag so unchanged values are answered with a 304.
+
+    A POST request accepts a JSON object or a list of JSON objects
+    mapping from parameter names to values and evaluates them in turn,
+    returning the values of the published parameters after each
+    evaluation. If the request accepts application/x-ndjson the
+    results are streamed as JSON lines and invalid queries are
+    reported inline.
+
+    Parameters are set on the event loop, while the serialization of
+    the resulting values runs on a thread pool to avoid blocking the
+    event loop.
+    """
+
+    _caches = {}
+
+    _executor = None
 
     def __init__(self, app, request, **kwargs):
         self.root = kwargs.pop('root', None)
         super().__init__(app, request, **kwargs)
 
     @classmethod
-    def serialize(cls, parameterized, parameters):
-        values = {p: getattr(parameterized, p) for p in parameters}
-        return parameterized.param.serialize_parameters(values)
+    def snapshot(cls, parameterized, parameters):
+        return {p: parameterized.param.get_value_generator(p) for p in parameters}
 
     @classmethod
-    def deserialize(cls, parameterized, parameters):
+    def serialize(cls, parameterized, values):
+        serializer = param.Parameter._serializers['json']
+        return serializer.dumps({
+            p: parameterized.param[p].serialize(v) for p, v in values.items()
+        })
+
+    @classmethod
+    def deserialize(cls, parameterized, parameters, decoded=False):
+        if not isinstance(parameters, dict):
+            raise HTTPError(reason="Queries must be JSON objects.", status_code=400)
         for p in parameters:
             if p not in parameterized.param:
                 reason = f"'{p}' query parameter not recognized."
                 raise HTTPError(reason=reason, status_code=400)
-        return {p: parameterized.param.deserialize_value(p, v)
-                for p, v in parameters.items()}
+        try:
+            if decoded:
+                return {p: parameterized.param[p].deserialize(v)
+                        for p, v in parameters.items()}
+            return {p: parameterized.param.deserialize_value(p, v)
+                    for p, v in parameters.items()}
+        except Exception as e:
+            raise HTTPError(reason=f"Could not deserialize query: {e}", status_code=400)
 
-    async def get(self):
+    @classmethod
+    def _get_executor(cls):
+        executor = state._get_thread_pool()
+        if executor is not None:
+            return executor
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(thread_name_prefix='panel-rest')
+        return cls._executor
+
+    def _get_cache(self):
         path = self.request.path
         endpoint = path[path.index(self.root)+len(self.root):]
         parameterized, parameters, _ = state._rest_endpoints.get(
             endpoint, (None, None, None)
         )
         if not parameterized:
+            return None
+        cache = self._caches.get(endpoint)
+        if cache is None or cache.parameterized is not parameterized[0]:
+            if cache is not None:
+                cache.destroy()
+            cache = self._caches[endpoint] = _EndpointCache(parameterized[0], parameters)
+        return cache
+
+    async def _evaluate(self, cache, values):
+        if not values and cache.cached is not None:
+            return cache.cached
+        return await cache.evaluate(values, self._get_executor())
+
+    async def get(self):
+        cache = self._get_cache()
+        if cache is None:
+            return
+        args = {k: v[-1] for k, v in parse_qs(self.request.query).items()}
+        params = self.deserialize(cache.parameterized, args)
+        body, etag = await self._evaluate(cache, params)
+        self.set_header('Content-Type', 'application/json')
+        self.set_header('Etag', etag)
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        self.write(body)
+
+    async def post(self):
+        cache = self._get_cache()
+        if cache is None:
             return
-        args = parse_qs(self.request.query)
-        params = self.deserialize(parameterized[0], args)
-        parameterized[0].param.set_param(**params)
+        try:
+            queries = json.loads(self.request.body or b'{}')
+        except ValueError:
+            raise HTTPError(reason="Request body is not valid JSON.", status_code=400)
+        batched = isinstance(queries, list)
+        queries = queries if batched else [queries]
+
+        if 'application/x-ndjson' in self.request.headers.get('Accept', ''):
+            self.set_header('Content-Type', 'application/x-ndjson')
+            for query in queries:
+                try:
+                    params = self.deserialize(cache.parameterized, query, decoded=True)
+                    body, _ = await self._evaluate(cache, params)
+                except HTTPError as e:
+                    body = json.dumps({'error': {'code': e.status_code, 'message': e.reason}})
+                self.write(body+'\n')
+                await self.flush()
+            return
+
+        queries = [self.deserialize(cache.parameterized, q, decoded=True) for q in queries]
+        results = [(await self._evaluate(cache, params))[0] for params in queries]
+        self.set_header('Content-Type', 'application/json')
+        self.write('[%s]' % ','.join(results) if batched else results[0])
+
+
+class SessionInfoHandler(BaseHandler):
+    """
+    Serves the session_info aggregated across all worker processes
+    when the server shards sessions across multiple processes.
+    """
+
+    async def get(self):
         self.set_header('Content-Type', 'application/json')
-        self.write(self.serialize(parameterized[0], parameters))
+        self.write(json.dumps({'session_info': state._collect_session_info()}))
+
+
+def _remove_session_info_dir(path, pid):
+    # The forked worker processes inherit the atexit hook, only the
+    # process which created the directory may remove it
+    if os.getpid() == pid:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def shared_session_info(endpoint):
+    """
+    Sets up a directory for worker processes to publish their
+    session_info to and returns a route serving the aggregated
+    session_info. Must be called before the worker processes are
+    forked.
+
+    Arguments
+    ---------
+    endpoint: str
+      The endpoint the REST API is served on
+
+    Returns
+    -------
+    A Tornado routing pattern containing the route and handler
+    """
+    if state._session_info_dir is None:
+        path = tempfile.mkdtemp(prefix='panel_session_info_')
+        atexit.register(_remove_session_info_dir, path, os.getpid())
+        state._session_info_dir = path
+    return [(r"^/%s/session_info/?$" % endpoint.strip('/'), SessionInfoHandler)]
+
+
+class MetricsHandler(BaseHandler):
+    """
+    Serves the runtime metrics of the server in the Prometheus text
+    exposition format.
+    """
+
+    async def get(self):
+        self.set_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.write(metrics.render())
+
+
+def metrics_endpoint(endpoint):
+    """
+    Enables the collection of runtime metrics and returns a route
+    serving them in the Prometheus text exposition format.
+
+    Arguments
+    ---------
+    endpoint: str
+      The endpoint the REST API is served on
+
+    Returns
+    -------
+    A Tornado routing pattern containing the route and handler
+    """
+    metrics.enabled = True
+    return [(r"^/%s/metrics/?$" % endpoint.strip('/'), MetricsHandler)]
 
 
 def build_tranquilize_application(files):
@@ -107,7 +107,8 @@ def file_html(models, resources, title=None, template=BASE_TEMPLATE,
 def save(panel, filename, title=None, resources=None, template=None,
          template_variables=None, embed=False, max_states=1000,
          max_opts=3, embed_json=False, json_prefix='', save_path='./',
-         load_path=None, progress=True, embed_states={}):
+         load_path=None, progress=True, embed_states={},
+         embed_processes=1, embed_packed=False, embed_compress=False):
     """
     Saves Panel objects to file.
 
@@ -143,6 +144,15 @@ def save(panel, filename, title=None, resources=None, template=None,
       Whether to report progress
     embed_states: dict (default={})
       A dictionary specifying the widget values to embed for each widget
+    embed_processes: int (default=1)
+      The number of processes to explore the embedded states with,
+      falls back to a single process if other non-daemon threads are
+      running since forking them may deadlock the workers
+    embed_packed: boolean (default=False)
+      Whether to export the data to a single packed file storing
+      identical states only once (requires embed_json=True)
+    embed_compress: boolean (default=False)
+      Whether to gzip compress the states in the packed file
     """
     from ..pane import PaneBase
     from ..template import Template
@@ -169,7 +179,8 @@ def save(panel, filename, title=None, resources=None, template=None,
             if embed:
                 embed_state(
                     panel, model, doc, max_states, max_opts, embed_json,
-                    json_prefix, save_path, load_path, progress, embed_states
+                    json_prefix, save_path, load_path, progress, embed_states,
+                    embed_processes, embed_packed, embed_compress
                 )
             else:
                 add_to_doc(model, doc, True)
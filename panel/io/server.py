@@ -2,8 +2,11 @@
 Utilities for creating bokeh Server instances.
 """
 import datetime as dt
+import asyncio
 import html
 import inspect
+import json
+import logging
 import os
 import pathlib
 import signal
@@ -12,7 +15,7 @@ import traceback
 import threading
 import uuid
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from contextlib import contextmanager
 from functools import partial, wraps
 from types import FunctionType, MethodType
@@ -25,30 +28,50 @@ import bokeh.command.util
 # Bokeh imports
 from bokeh.application import Application as BkApplication
 from bokeh.application.handlers.code import CodeHandler
+from bokeh.application.handlers.document_lifecycle import DocumentLifecycleHandler
 from bokeh.application.handlers.function import FunctionHandler
+from bokeh.application.handlers.handler import Handler
 from bokeh.command.util import build_single_handler_application
 from bokeh.core.templates import AUTOLOAD_JS
-from bokeh.document.events import ModelChangedEvent
-from bokeh.embed.bundle import Script
+from bokeh.core.json_encoder import serialize_json
+from bokeh.document import Document
+from bokeh.document.events import (
+    ColumnsPatchedEvent, ColumnsStreamedEvent, ModelChangedEvent
+)
+from bokeh.embed.bundle import Script, extension_dirs
 from bokeh.embed.elements import html_page_for_render_items, script_for_render_items
 from bokeh.embed.util import RenderItem
 from bokeh.io import curdoc
+from bokeh.protocol.messages.patch_doc import (
+    patch_doc as PatchDocMessage, process_document_events
+)
+from bokeh.server.connection import ServerConnection
+from bokeh.server.contexts import ApplicationContext, BokehSessionContext, _RequestProxy
 from bokeh.server.server import Server
-from bokeh.server.urls import per_app_patterns
+from bokeh.server.session import ServerSession
+from bokeh.server.urls import per_app_patterns, toplevel_patterns
 from bokeh.server.views.autoload_js_handler import AutoloadJsHandler as BkAutoloadJsHandler
 from bokeh.server.views.doc_handler import DocHandler as BkDocHandler
+from bokeh.server.views.multi_root_static_handler import MultiRootStaticHandler
+from bokeh.util.token import generate_session_id, get_token_payload
 
 # Tornado imports
+from tornado import gen
 from tornado.ioloop import IOLoop
 from tornado.websocket import WebSocketHandler
 from tornado.web import RequestHandler, StaticFileHandler, authenticated
 from tornado.wsgi import WSGIContainer
 
 # Internal imports
-from .reload import autoreload_watcher
-from .resources import BASE_TEMPLATE, Resources, bundle_resources
+from .metrics import metrics
+from .reload import autoreload_watcher, start_watcher, stop_watcher
+from .resources import (
+    BASE_TEMPLATE, COMPRESSIBLE, Resources, assets, bundle_resources
+)
 from .state import state
 
+log = logging.getLogger('panel.io.server')
+
 #---------------------------------------------------------------------
 # Private API
 #---------------------------------------------------------------------
@@ -108,6 +131,21 @@ def async_execute(func):
 
 param.parameterized.async_executor = async_execute
 
+class _SharedData(dict):
+    """
+    A stream or patch payload which is sent to the models of multiple
+    sessions. The JSON encoding of the payload is computed once and
+    shared by all PATCH-DOC messages containing it.
+    """
+
+    _json = None
+
+    @property
+    def json(self):
+        if self._json is None:
+            self._json = serialize_json(dict(self))
+        return self._json
+
 def _initialize_session_info(session_context):
     from ..config import config
     session_id = session_context.id
@@ -127,6 +165,7 @@ def _initialize_session_info(session_context):
         'ended': None,
         'user_agent': session_context.request.headers.get('User-Agent')
     }
+    state._publish_session_info()
 
 state.on_session_created(_initialize_session_info)
 
@@ -166,8 +205,263 @@ class Application(BkApplication):
             cb(session_context)
         await super().on_session_created(session_context)
 
+    def on_server_loaded(self, server_context):
+        from ..config import config
+        super().on_server_loaded(server_context)
+        if metrics.enabled:
+            metrics.monitor_loop()
+        if config.autoreload:
+            start_watcher()
+        if config.session_pool and not config.autoreload:
+            app_context = server_context.application_context
+            pool = _SessionPool(app_context, config.session_pool)
+            if pool.enabled:
+                _session_pools[app_context] = pool
+                IOLoop.current().add_callback(pool.fill)
+
+    def on_server_unloaded(self, server_context):
+        pool = _session_pools.pop(server_context.application_context, None)
+        if pool is not None:
+            pool.destroy()
+        state._stop_feeds(IOLoop.current())
+        stop_watcher()
+        if metrics.enabled:
+            metrics.stop()
+        super().on_server_unloaded(server_context)
+
 bokeh.command.util.Application = Application
 
+# Patch ApplicationContext to hand out pre-rendered sessions
+
+# Pools of pre-rendered sessions indexed by ApplicationContext
+_session_pools = {}
+
+class _PooledRequest(object):
+    """
+    Stands in for the request of a session rendered into the session
+    pool. Since the document is rendered before the request arrives
+    any access disables the pool for the application.
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    def __getattr__(self, attr):
+        self._pool.disable('accessed the request while rendering')
+        return {} if attr in ('arguments', 'cookies', 'headers') else None
+
+
+class _SessionPool(object):
+    """
+    A pool of documents pre-rendered for an application, which are
+    handed to new sessions whose request cannot affect the rendered
+    output. Applications declaring session creation hooks are never
+    pooled since Bokeh runs the hooks before rendering the document.
+    """
+
+    def __init__(self, app_context, size):
+        self.app_context = app_context
+        self.size = size
+        self.docs = deque()
+        self.enabled = not self._has_session_hooks()
+        self._filling = False
+
+    def _has_session_hooks(self):
+        if any(cb is not _initialize_session_info for cb in state._on_session_created):
+            return True
+        return any(
+            type(h).on_session_created is not Handler.on_session_created
+            for h in self.app_context.application.handlers
+            if not isinstance(h, DocumentLifecycleHandler)
+        )
+
+    def disable(self, reason):
+        if self.enabled:
+            log.info(
+                "Application at %r %s, disabling the session pool.",
+                self.app_context.url, reason
+            )
+        self.enabled = False
+
+    def poolable(self, request):
+        """
+        Whether a session for the supplied request may be served from
+        the pool, i.e. the request does not carry any information that
+        could affect how the application is rendered.
+        """
+        from ..config import config
+        if self._has_session_hooks():
+            self.disable('declares session creation hooks')
+        if not self.enabled or not self.docs or config.oauth_provider:
+            return False
+        if request is None:
+            return True
+        return not any(
+            not arg.startswith('bokeh-') for arg in request.arguments
+        )
+
+    async def fill(self):
+        """
+        Replenishes the pool, yielding to the event loop between
+        documents and waiting while other sessions are being created.
+        """
+        if self._filling:
+            return
+        app_context = self.app_context
+        self._filling = True
+        try:
+            while self.enabled and len(self.docs) < self.size:
+                while app_context._pending_sessions:
+                    await asyncio.sleep(0.1)
+                await asyncio.sleep(0)
+                if not self.enabled:
+                    break
+                doc = Document()
+                session_context = BokehSessionContext(
+                    generate_session_id(), app_context.server_context, doc,
+                    logout_url=app_context._logout_url
+                )
+                session_context._request = _PooledRequest(self)
+                doc._session_context = session_context
+                app_context.application.initialize_document(doc)
+                if any(getattr(h, 'failed', False) for h in app_context.application.handlers):
+                    self.disable('failed to render')
+                if self.enabled:
+                    self.docs.append((doc, session_context))
+                else:
+                    self._discard(doc, session_context)
+        finally:
+            self._filling = False
+
+    def take(self):
+        return self.docs.popleft()
+
+    def _discard(self, doc, session_context):
+        callbacks = doc.session_destroyed_callbacks
+        doc.session_destroyed_callbacks = set()
+        for callback in callbacks:
+            try:
+                callback(session_context)
+            except Exception as e:
+                log.warning("Error cleaning up pooled session %r", e)
+        doc.delete_modules()
+
+    def destroy(self):
+        """
+        Cleans up all pre-rendered documents and stops refilling.
+        """
+        self.enabled = False
+        while self.docs:
+            self._discard(*self.docs.popleft())
+
+_create_session_if_needed = ApplicationContext.create_session_if_needed
+
+async def create_session_if_needed(self, session_id, request=None, token=None):
+    pool = _session_pools.get(self)
+    if (pool is None or not session_id or session_id in self._sessions or
+        session_id in self._pending_sessions or not pool.poolable(request)):
+        return await _create_session_if_needed(self, session_id, request, token)
+
+    # Mirrors ApplicationContext.create_session_if_needed except
+    # that the document was already initialized by the pool
+    future = self._pending_sessions[session_id] = gen.Future()
+    doc, session_context = pool.take()
+    session_context._id = session_id
+    if request is not None:
+        payload = get_token_payload(token) if token else {}
+        session_context._request = _RequestProxy(
+            request, cookies=payload.get('cookies'),
+            headers=payload.get('headers')
+        )
+    session_context._token = token
+
+    try:
+        await self._application.on_session_created(session_context)
+    except Exception as e:
+        log.error("Failed to run session creation hooks %r", e, exc_info=True)
+    init_doc(doc)
+
+    session = ServerSession(session_id, doc, io_loop=self._loop, token=token)
+    del self._pending_sessions[session_id]
+    self._sessions[session_id] = session
+    session_context._set_session(session)
+    self._session_contexts[session_id] = session_context
+    future.set_result(session)
+    IOLoop.current().add_callback(pool.fill)
+    return session
+
+ApplicationContext.create_session_if_needed = create_session_if_needed
+
+class _SharedPatchDocMessage(PatchDocMessage):
+    """
+    A PATCH-DOC message whose content was encoded from a payload
+    shared by the models of multiple sessions.
+    """
+
+    def __init__(self, content_json):
+        super().__init__(PatchDocMessage.create_header(), {}, {})
+        self._shared_content_json = content_json
+
+    @property
+    def content_json(self):
+        return self._shared_content_json
+
+
+def _shared_event_json(event):
+    """
+    Returns the JSON encoding of a stream or patch event whose payload
+    is shared between sessions or None for any other event.
+    """
+    hint = getattr(event, 'hint', None)
+    if isinstance(hint, ColumnsStreamedEvent) and isinstance(hint.data, _SharedData):
+        patch = '"data":%s,"kind":"ColumnsStreamed","rollover":%s' % (
+            hint.data.json, serialize_json(hint.rollover)
+        )
+    elif isinstance(hint, ColumnsPatchedEvent) and isinstance(hint.patches, _SharedData):
+        patch = '"kind":"ColumnsPatched","patches":%s' % hint.patches.json
+    else:
+        return None
+    return '{"column_source":%s,%s}' % (serialize_json(hint.column_source.ref), patch)
+
+
+def _patch_message(protocol, events):
+    """
+    Creates a PATCH-DOC message for the supplied events, reusing the
+    encoding of stream and patch payloads shared between sessions.
+    The remaining events are encoded as usual and the shared payloads
+    are spliced into the message content in order. All PATCH-DOC
+    messages sent to the frontend are created here, so the message is
+    also recorded in the metrics.
+    """
+    shared = [_shared_event_json(event) for event in events]
+    if not any(shared):
+        msg = protocol.create('PATCH-DOC', events)
+        metrics.record_message(msg)
+        return msg
+    others = [event for event, fragment in zip(events, shared) if fragment is None]
+    references, buffers, encoded = '[]', [], []
+    if others:
+        patch_json, buffers = process_document_events(others)
+        content = json.loads(patch_json)
+        references = serialize_json(content['references'])
+        encoded = [serialize_json(event) for event in content['events']]
+    encoded = iter(encoded)
+    fragments = [next(encoded) if fragment is None else fragment for fragment in shared]
+    msg = _SharedPatchDocMessage(
+        '{"events":[%s],"references":%s}' % (','.join(fragments), references)
+    )
+    for header, payload in buffers:
+        msg.add_buffer(header, payload)
+    metrics.record_message(msg)
+    return msg
+
+# Patch ServerConnection to reuse the encoding of shared data updates
+def send_patch_document(self, event):
+    msg = _patch_message(self.protocol, [event])
+    return self._socket.send_message(msg)
+
+ServerConnection.send_patch_document = send_patch_document
+
 # Patch Bokeh DocHandler URL
 class DocHandler(BkDocHandler):
 
@@ -219,6 +513,62 @@ class AutoloadJsHandler(BkAutoloadJsHandler):
 
 per_app_patterns[3] = (r'/autoload.js', AutoloadJsHandler)
 
+# Patch Bokeh extension handler to serve cached and precompressed assets
+class ExtensionStaticHandler(MultiRootStaticHandler):
+    """
+    Serves the static assets of Bokeh extensions from memory, using
+    the precompressed variant matching the Accept-Encoding of the
+    request. Requests for content-hashed URLs are marked as immutable
+    so browsers never revalidate them.
+    """
+
+    def set_extra_headers(self, path):
+        if 'v' in self.request.arguments:
+            self.set_header(
+                'Cache-Control', f'public, max-age={self.CACHE_MAX_AGE}, immutable'
+            )
+
+    def _accepted_encodings(self):
+        accepted = set()
+        for value in self.request.headers.get('Accept-Encoding', '').split(','):
+            encoding, *params = [v.strip() for v in value.split(';')]
+            if 'q=0' not in params:
+                accepted.add(encoding)
+        return accepted
+
+    async def get(self, path, include_body=True):
+        if not path.endswith(COMPRESSIBLE) or self.request.headers.get('Range'):
+            return await super().get(path, include_body)
+        self.path = self.parse_url_path(path)
+        absolute_path = self.get_absolute_path(self.root, self.path)
+        self.absolute_path = self.validate_absolute_path(self.root, absolute_path)
+        if self.absolute_path is None:
+            return
+        asset = assets.get(self.absolute_path)
+        if asset is None:
+            return await super().get(path, include_body)
+
+        accepted, encodings = self._accepted_encodings(), asset.encodings
+        encoding = next((e for e in ('br', 'gzip') if e in accepted and e in encodings), None)
+        content = asset.content if encoding is None else encodings[encoding]
+
+        self.set_header('Content-Type', self.get_content_type())
+        self.set_header('Vary', 'Accept-Encoding')
+        self.set_header('Etag', f'"{asset.hash}-{encoding}"' if encoding else f'"{asset.hash}"')
+        self.set_extra_headers(self.path)
+        if encoding:
+            self.set_header('Content-Encoding', encoding)
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        self.set_header('Content-Length', len(content))
+        if include_body:
+            self.write(content)
+
+toplevel_patterns[1] = (
+    r'/static/extensions/(.*)', ExtensionStaticHandler, dict(root=extension_dirs)
+)
+
 def modify_document(self, doc):
     from bokeh.io.doc import set_curdoc as bk_set_curdoc
     from ..config import config
@@ -301,6 +651,7 @@ def init_doc(doc):
     sessions[session_id].update({
         'started': dt.datetime.now().timestamp()
     })
+    state._publish_session_info()
     doc.on_event('document_ready', state._init_session)
     return doc
 
@@ -364,18 +715,23 @@ def unlocked():
             if hasattr(socket, 'write_lock') and socket.write_lock._block._value == 0:
                 state._locks.add(socket)
             locked = socket in state._locks
+            patch_events = []
             for event in curdoc._held_events:
                 if (isinstance(event, ModelChangedEvent) and event not in old_events
                     and hasattr(socket, 'write_message') and not locked):
-                    msg = conn.protocol.create('PATCH-DOC', [event])
-                    WebSocketHandler.write_message(socket, msg.header_json)
-                    WebSocketHandler.write_message(socket, msg.metadata_json)
-                    WebSocketHandler.write_message(socket, msg.content_json)
-                    for header, payload in msg._buffers:
-                        WebSocketHandler.write_message(socket, header)
-                        WebSocketHandler.write_message(socket, payload, binary=True)
+                    patch_events.append(event)
                 elif event not in events:
                     events.append(event)
+            if not patch_events:
+                continue
+            # Send all changes in a single PATCH-DOC message
+            msg = _patch_message(conn.protocol, patch_events)
+            WebSocketHandler.write_message(socket, msg.header_json)
+            WebSocketHandler.write_message(socket, msg.metadata_json)
+            WebSocketHandler.write_message(socket, msg.content_json)
+            for header, payload in msg.buffers:
+                WebSocketHandler.write_message(socket, header)
+                WebSocketHandler.write_message(socket, payload, binary=True)
         curdoc._held_events = events
     finally:
         if not hold:
@@ -488,7 +844,8 @@ def get_server(panel, port=0, address=None, websocket_origin=None,
                verbose=False, location=True, static_dirs={},
                oauth_provider=None, oauth_key=None, oauth_secret=None,
                oauth_extra_params={}, cookie_secret=None,
-               oauth_encryption_key=None, session_history=None, **kwargs):
+               oauth_encryption_key=None, session_history=None, metrics=False,
+               **kwargs):
     """
     Returns a Server instance with this panel attached as the root
     app.
@@ -543,7 +900,12 @@ def get_server(panel, port=0, address=None, websocket_origin=None,
       The amount of session history to accumulate. If set to non-zero
       and non-None value will launch a REST endpoint at
       /rest/session_info, which returns information about the session
-      history.
+      history. When the server is launched with num_procs other than 1
+      the session info is aggregated across all worker processes.
+    metrics: boolean (optional, default=False)
+      Whether to collect runtime metrics, e.g. callback latencies and
+      event loop lag, and serve them in the Prometheus text format at
+      /rest/metrics.
     kwargs: dict
       Additional keyword arguments to pass to Server instance.
 
@@ -553,7 +915,7 @@ def get_server(panel, port=0, address=None, websocket_origin=None,
       Bokeh Server instance running this panel
     """
     from ..config import config
-    from .rest import REST_PROVIDERS
+    from .rest import REST_PROVIDERS, metrics_endpoint, shared_session_info
 
     server_id = kwargs.pop('server_id', uuid.uuid4().hex)
     kwargs['extra_patterns'] = extra_patterns = kwargs.get('extra_patterns', [])
@@ -599,9 +961,13 @@ def get_server(panel, port=0, address=None, websocket_origin=None,
     if session_history is not None:
         config.session_history = session_history
     if config.session_history != 0:
+        if kwargs.get('num_procs', 1) != 1:
+            extra_patterns.extend(shared_session_info('rest'))
         pattern = REST_PROVIDERS['param']([], 'rest')
         extra_patterns.extend(pattern)
         state.publish('session_info', state, ['session_info'])
+    if metrics:
+        extra_patterns.extend(metrics_endpoint('rest'))
 
     opts = dict(kwargs)
     if loop:
@@ -1,22 +1,33 @@
 """
 Various utilities for recording and embedding state in a rendered app.
 """
+import asyncio
 import datetime as dt
+import inspect
 import json
+import logging
+import os
+import sys
 import threading
+import time
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import partial
 from weakref import WeakKeyDictionary, WeakSet
 from urllib.parse import urljoin
 
 import param
 
-from bokeh.document import Document
 from bokeh.io import curdoc as _curdoc
 from pyviz_comms import CommManager as _CommManager
+from tornado.ioloop import IOLoop
 from tornado.web import decode_signed_value
 
-from ..util import base64url_decode
+from ..util import base64url_decode, edit_readonly
+
+log = logging.getLogger(__name__)
 
 
 class _state(param.Parameterized):
@@ -50,15 +61,23 @@ class _state(param.Parameterized):
     webdriver = param.Parameter(default=None, doc="""
       Selenium webdriver used to export bokeh models to pngs.""")
 
-    _curdoc = param.ClassSelector(class_=Document, doc="""
-        The bokeh Document for which a server event is currently being
-        processed.""")
+    # The bokeh Document for which a server event is currently being
+    # processed, local to the current thread or asyncio task
+    _curdoc = ContextVar('curdoc', default=None)
 
     # Whether to hold comm events
     _hold = False
 
-    # Used to ensure that events are not scheduled from the wrong thread
-    _thread_id = None
+    # Used to ensure that events are not scheduled from the wrong
+    # thread, local to the current thread or asyncio task
+    _thread_id_ = ContextVar('thread_id', default=None)
+
+    # Number of callbacks currently being processed across all threads
+    _busy_counter = 0
+    _busy_lock = threading.RLock()
+
+    # Thread pool user callbacks are executed on if config.nthreads is set
+    _thread_pool = None
 
     _comm_manager = _CommManager
 
@@ -80,6 +99,10 @@ class _state(param.Parameterized):
 
     # Dictionary of callbacks to be triggered on app load
     _onload = WeakKeyDictionary()
+
+    # Model updates waiting to be dispatched in a batch, indexed by document
+    _pending_updates = WeakKeyDictionary()
+    _pending_lock = threading.Lock()
     _on_session_created = []
 
     # Stores a set of locked Websockets, reset after every change event
@@ -91,6 +114,23 @@ class _state(param.Parameterized):
     # Endpoints
     _rest_endpoints = {}
 
+    # Directory shared by worker processes to publish their session_info
+    _session_info_dir = None
+
+    # Minimum interval (in seconds) between writes of the session_info
+    _session_info_interval = 1
+    _session_info_pending = False
+
+    # Bookkeeping for values memoized by as_cached
+    _cache_lock = threading.RLock()
+    _cache_entries = OrderedDict() # LRU ordered key -> (expiry, nbytes)
+    _cache_bytes = 0
+    _cache_pending = {}
+    _cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    # Periodic feeds shared across sessions indexed by key
+    _feeds = {}
+
     def __repr__(self):
         server_info = []
         for server, panel, docs in self._servers.values():
@@ -101,11 +141,39 @@ class _state(param.Parameterized):
             return "state(servers=[])"
         return "state(servers=[\n  {}\n])".format(",\n  ".join(server_info))
 
+    def _get_thread_pool(self):
+        """
+        Returns the thread pool user callbacks should be executed on,
+        starting it if necessary, or None if config.nthreads is unset.
+        """
+        from ..config import config
+        if config.nthreads is None:
+            return None
+        if self._thread_pool is None:
+            threads = config.nthreads or None
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=threads, thread_name_prefix='panel-callback'
+            )
+        return self._thread_pool
+
     def _unblocked(self, doc):
         thread = threading.current_thread()
         thread_id = thread.ident if thread else None
         return doc is self.curdoc and self._thread_id == thread_id
 
+    def _set_busy(self, busy):
+        """
+        Marks the start (busy=True) or end (busy=False) of a callback.
+        Since callbacks may run concurrently on a thread pool the busy
+        state is only cleared once all callbacks have completed.
+        """
+        with self._busy_lock:
+            self._busy_counter += 1 if busy else -1
+            busy = self._busy_counter > 0
+            if busy != self.busy:
+                with edit_readonly(self):
+                    self.busy = busy
+
     @param.depends('busy', watch=True)
     def _update_busy(self):
         for indicator in self._indicators:
@@ -122,6 +190,186 @@ class _state(param.Parameterized):
         session_info.update({
             'rendered': dt.datetime.now().timestamp()
         })
+        self._publish_session_info()
+
+    def _publish_session_info(self):
+        """
+        Writes the session_info of this process to the directory shared
+        with the other worker processes, if one is configured. When
+        called on an event loop, writes are throttled and the file is
+        written on an executor thread so the loop is not blocked.
+        """
+        if self._session_info_dir is None or self._session_info_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_session_info(json.dumps(self.session_info))
+            return
+        self._session_info_pending = True
+        loop.call_later(self._session_info_interval, self._flush_session_info, loop)
+
+    def _flush_session_info(self, loop):
+        self._session_info_pending = False
+        if self._session_info_dir is None:
+            return
+        # Serialize on the loop, which owns the session_info
+        content = json.dumps(self.session_info)
+        loop.run_in_executor(None, self._write_session_info, content)
+
+    def _write_session_info(self, content):
+        path = os.path.join(self._session_info_dir, '%d.json' % os.getpid())
+        tmp_path = path + '.tmp'
+        try:
+            # Recreate the directory in case it was removed
+            os.makedirs(self._session_info_dir, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            log.warning("Could not publish session info to %s", path)
+
+    @staticmethod
+    def _pid_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def _collect_session_info(self):
+        """
+        Returns the session_info aggregated across all worker processes
+        sharing the session info directory. Sessions recreated on a
+        different worker are only counted once and the files of worker
+        processes which are no longer alive are removed.
+        """
+        if self._session_info_dir is None:
+            return self.session_info
+        infos = {os.getpid(): self.session_info}
+        try:
+            filenames = os.listdir(self._session_info_dir)
+        except FileNotFoundError:
+            filenames = []
+        for filename in filenames:
+            pid, ext = os.path.splitext(filename)
+            if ext != '.json' or not pid.isdigit() or int(pid) in infos:
+                continue
+            path = os.path.join(self._session_info_dir, filename)
+            if not self._pid_alive(int(pid)):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            try:
+                with open(path) as f:
+                    infos[int(pid)] = json.load(f)
+            except (OSError, ValueError):
+                continue
+        total, live, sessions = 0, 0, {}
+        for pid in sorted(infos):
+            info = infos[pid]
+            total += info['total']
+            live += info['live']
+            for session_id, session in info['sessions'].items():
+                if session_id in sessions:
+                    total -= 1
+                    if session.get('rendered') is None:
+                        continue
+                sessions[session_id] = session
+        sessions = OrderedDict(sorted(sessions.items(), key=lambda s: s[1]['launched']))
+        return {'total': total, 'live': live, 'sessions': sessions}
+
+    @staticmethod
+    def _cache_nbytes(value):
+        if hasattr(value, 'memory_usage'):
+            usage = value.memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, 'sum') else usage)
+        elif hasattr(value, 'nbytes'):
+            return int(value.nbytes)
+        return sys.getsizeof(value)
+
+    def _cache_lookup(self, key):
+        """
+        Looks up a memoized value, returning a tuple of a boolean
+        indicating whether the lookup was a hit and the value. Must
+        be called while holding the cache lock.
+        """
+        if key not in self.cache:
+            if key in self._cache_entries:
+                # Value was removed from the cache directly
+                self._cache_evict(key)
+            return False, None
+        entry = self._cache_entries.get(key)
+        if entry is not None:
+            expiry, _ = entry
+            if expiry is not None and expiry <= time.monotonic():
+                self._cache_evict(key)
+                self._cache_stats['expirations'] += 1
+                return False, None
+            self._cache_entries.move_to_end(key)
+        self._cache_stats['hits'] += 1
+        return True, self.cache[key]
+
+    def _cache_store(self, key, value, ttl):
+        from ..config import config
+        with self._cache_lock:
+            self._cache_evict(key)
+            nbytes = self._cache_nbytes(value) if config.cache_max_bytes else 0
+            expiry = None if ttl is None else time.monotonic() + ttl
+            self.cache[key] = value
+            self._cache_entries[key] = (expiry, nbytes)
+            self._cache_bytes += nbytes
+            while len(self._cache_entries) > 1 and (
+                (config.cache_max_items and len(self._cache_entries) > config.cache_max_items) or
+                (config.cache_max_bytes and self._cache_bytes > config.cache_max_bytes)):
+                self._cache_evict(next(iter(self._cache_entries)))
+                self._cache_stats['evictions'] += 1
+
+    def _cache_evict(self, key):
+        _, nbytes = self._cache_entries.pop(key, (None, 0))
+        self._cache_bytes -= nbytes
+        self.cache.pop(key, None)
+
+    @staticmethod
+    def _on_event_loop():
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    async def _as_cached_async(self, key, fn, ttl, kwargs):
+        with self._cache_lock:
+            hit, value = self._cache_lookup(key)
+            if hit:
+                return value
+            self._cache_stats['misses'] += 1
+            future = self._cache_pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._cache_pending[key] = asyncio.get_event_loop().create_future()
+        if not owner:
+            return await asyncio.shield(future)
+        try:
+            value = await fn(**kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception() # Avoid warning if there are no waiters
+            raise
+        else:
+            self._cache_store(key, value, ttl)
+            future.set_result(value)
+        finally:
+            with self._cache_lock:
+                self._cache_pending.pop(key, None)
+        return value
 
     def _get_callback(self, endpoint):
         _updating = {}
@@ -154,16 +402,78 @@ class _state(param.Parameterized):
         for cb in self._onload.pop(self.curdoc, []):
             cb()
 
+    def _schedule_update(self, doc, callback):
+        """
+        Schedules a callback which updates models on a server
+        Document. All callbacks scheduled on the same Document before
+        the batch is dispatched are executed together, ensuring the
+        resulting model changes are sent in a single message.
+        """
+        from ..config import config
+        with self._pending_lock:
+            if doc not in self._pending_updates:
+                self._pending_updates[doc] = []
+                dispatch = partial(self._dispatch_updates, doc)
+                if config.batch_latency:
+                    schedule = partial(doc.add_timeout_callback, dispatch, config.batch_latency)
+                else:
+                    schedule = partial(doc.add_next_tick_callback, dispatch)
+                loop = self._doc_loop(doc)
+                if loop is None or IOLoop.current(instance=False) is loop:
+                    schedule()
+                else:
+                    # Bokeh temporarily replaces its global curdoc while
+                    # adding a callback, so never add it from a thread
+                    # running concurrently with the event loop
+                    loop.add_callback(schedule)
+            self._pending_updates[doc].append(callback)
+
+    @staticmethod
+    def _doc_loop(doc):
+        """
+        Returns the IOLoop of the server the Document is served on.
+        """
+        session_context = doc.session_context
+        server_context = getattr(session_context, 'server_context', None)
+        app_context = getattr(server_context, 'application_context', None)
+        return getattr(app_context, 'io_loop', None)
+
+    def _dispatch_updates(self, doc):
+        from .server import unlocked
+        with self._pending_lock:
+            callbacks = self._pending_updates.pop(doc, [])
+        curdoc = self._curdoc.get()
+        self.curdoc = doc
+        try:
+            with unlocked():
+                for cb in callbacks:
+                    try:
+                        cb()
+                    except Exception:
+                        log.exception("Failed to apply model update.")
+        finally:
+            self.curdoc = curdoc
+
     #----------------------------------------------------------------
     # Public Methods
     #----------------------------------------------------------------
 
-    def as_cached(self, key, fn, **kwargs):
+    def as_cached(self, key, fn, *, cache_ttl=None, **kwargs):
         """
         Caches the return value of a function, memoizing on the given
         key and supplied keyword arguments.
 
-        Note: Keyword arguments must be hashable.
+        Values are evicted in least recently used order once the
+        config.cache_max_items or config.cache_max_bytes limits are
+        exceeded. Concurrent calls for the same key, e.g. from
+        multiple sessions, wait for the first computation instead of
+        repeating it. Calls made on a thread running an event loop
+        never block waiting for a computation on another thread and
+        compute the value themselves instead. If fn is a coroutine
+        function an awaitable is returned.
+
+        Note: Keyword arguments must be hashable and are all passed
+        to fn except for cache_ttl.
 
         Arguments
         ---------
@@ -171,6 +481,8 @@ class _state(param.Parameterized):
           The key to cache the return value under.
         fn: (callable)
           The function or callable whose return value will be cached.
+        cache_ttl: (int)
+          The number of seconds the return value remains valid for.
         **kwargs: dict
           Additional keyword arguments to supply to the function,
           which will be memoized over as well.
@@ -181,11 +493,60 @@ class _state(param.Parameterized):
         the cache.
         """
         key = (key,)+tuple((k, v) for k, v in sorted(kwargs.items()))
-        if key in self.cache:
-            ret = self.cache.get(key)
-        else:
-            ret = self.cache[key] = fn(**kwargs)
-        return ret
+        if inspect.iscoroutinefunction(fn):
+            return self._as_cached_async(key, fn, cache_ttl, kwargs)
+
+        thread_id = threading.get_ident()
+        with self._cache_lock:
+            hit, value = self._cache_lookup(key)
+            if hit:
+                return value
+            self._cache_stats['misses'] += 1
+            pending = self._cache_pending.get(key)
+            if pending is None:
+                event = threading.Event()
+                self._cache_pending[key] = (event, thread_id)
+
+        if pending is not None and pending[1] != thread_id:
+            if self._on_event_loop():
+                # Blocking would stall all sessions served by the loop
+                value = fn(**kwargs)
+                self._cache_store(key, value, cache_ttl)
+                return value
+            pending[0].wait()
+            with self._cache_lock:
+                if key in self.cache:
+                    return self.cache[key]
+            # The first computation failed, compute it here instead
+            return self.as_cached(key[0], fn, cache_ttl=cache_ttl, **kwargs)
+        elif pending is not None:
+            # Recursive call from the thread computing the value
+            return fn(**kwargs)
+
+        try:
+            value = fn(**kwargs)
+            self._cache_store(key, value, cache_ttl)
+        finally:
+            with self._cache_lock:
+                self._cache_pending.pop(key, None)
+            event.set()
+        return value
+
+    def cache_info(self):
+        """
+        Returns statistics about the values memoized by as_cached.
+
+        Returns
+        -------
+        A dictionary of hits, misses, evictions and expirations
+        along with the current number of items and their total size
+        in bytes (only tracked if config.cache_max_bytes is set).
+        """
+        with self._cache_lock:
+            return dict(
+                self._cache_stats, items=len(self._cache_entries),
+                bytes=self._cache_bytes
+            )
 
     def add_periodic_callback(self, callback, period=500, count=None,
                               timeout=None, start=True):
@@ -219,6 +580,47 @@ class _state(param.Parameterized):
             cb.start()
         return cb
 
+    def add_periodic_feed(self, key, producer, period=500):
+        """
+        Returns a PeriodicFeed shared by all sessions, which executes
+        the producer once per period and delivers the latest value to
+        all subscribers. If a feed with the same key already exists it
+        is returned instead, ensuring that the producer is only run
+        once no matter how many sessions subscribe to it.
+
+        Arguments
+        ---------
+        key: hashable
+          The key identifying the feed.
+        producer: callable
+          Callable (or coroutine function) producing the next value.
+        period: int
+          Interval in milliseconds at which the producer is executed.
+
+        Returns
+        -------
+        Return a PeriodicFeed object with subscribe and unsubscribe
+        methods.
+        """
+        from .callbacks import PeriodicFeed
+
+        if key not in self._feeds:
+            self._feeds[key] = PeriodicFeed(producer=producer, period=period)
+        return self._feeds[key]
+
+    def _stop_feeds(self, loop=None):
+        """
+        Stops the periodic feeds and removes them from the state. If
+        a loop is supplied only the feeds running on it are stopped.
+        """
+        for key, feed in list(self._feeds.items()):
+            if loop is not None and feed._loop is not loop:
+                continue
+            feed.stop()
+            feed._subscribers = []
+            feed._docs.clear()
+            del self._feeds[key]
+
     def kill_all_servers(self):
         """Stop all servers and clear them from the current state."""
         for server_id in self._servers:
@@ -227,6 +629,7 @@ class _state(param.Parameterized):
             except AssertionError:  # can't stop a server twice
                 pass
         self._servers = {}
+        self._stop_feeds()
 
     def onload(self, callback):
         """
@@ -314,14 +717,23 @@ class _state(param.Parameterized):
 
     @property
     def curdoc(self):
-        if self._curdoc:
-            return self._curdoc
+        curdoc = self._curdoc.get()
+        if curdoc:
+            return curdoc
         elif _curdoc().session_context:
             return _curdoc()
 
     @curdoc.setter
     def curdoc(self, doc):
-        self._curdoc = doc
+        self._curdoc.set(doc)
+
+    @property
+    def _thread_id(self):
+        return self._thread_id_.get()
+
+    @_thread_id.setter
+    def _thread_id(self, thread_id):
+        self._thread_id_.set(thread_id)
 
     @property
     def cookies(self):
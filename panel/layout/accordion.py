@@ -14,12 +14,21 @@ class Accordion(NamedListPanel):
     active = param.List(default=[], doc="""
         List of indexes of active cards.""")
 
+    dynamic = param.Boolean(default=False, doc="""
+        Dynamically populate only the active cards.""")
+
     header_color = param.String(doc="""
         A valid CSS color to apply to the expand button.""")
 
     header_background = param.String(doc="""
         A valid CSS color for the header background.""")
 
+    max_rendered = param.Integer(default=1, bounds=(1, None), allow_None=True, doc="""
+        When dynamic, the maximum number of cards to keep rendered. The
+        active cards are always rendered, beyond that the least recently
+        shown cards are released first. If None all cards are retained
+        once they have been shown.""")
+
     toggle = param.Boolean(default=False, doc="""
         Whether to toggle between active cards or allow multiple cards""")
 
@@ -27,7 +36,8 @@ class Accordion(NamedListPanel):
     
     _rename = {'active': None, 'active_header_background': None,
                'header_background': None, 'objects': 'children',
-               'dynamic': None, 'toggle': None, 'header_color': None}
+               'dynamic': None, 'toggle': None, 'header_color': None,
+               'max_rendered': None}
 
     _toggle = """
     for (var child of accordion.children) {
@@ -39,7 +49,8 @@ class Accordion(NamedListPanel):
 
     _synced_properties = [
         'active_header_background', 'header_background', 'width',
-        'sizing_mode', 'width_policy', 'height_policy', 'header_color'
+        'sizing_mode', 'width_policy', 'height_policy', 'header_color',
+        'dynamic'
     ]
 
     def __init__(self, *objects, **params):
@@ -47,6 +58,7 @@ class Accordion(NamedListPanel):
         self._updating_active = False
         self.param.watch(self._update_active, ['active'])
         self.param.watch(self._update_cards, self._synced_properties)
+        self.param.watch(self._update_rendered, ['active', 'dynamic', 'max_rendered'])
 
     def _get_objects(self, model, old_objects, doc, root, comm=None):
         """
@@ -64,8 +76,9 @@ class Accordion(NamedListPanel):
             pane = panel(pane, name=name)
             self.objects[i] = pane
 
+        current_ids = {id(obj) for obj in self.objects}
         for obj in old_objects:
-            if obj not in self.objects:
+            if id(obj) not in current_ids:
                 self._panels[id(obj)]._cleanup(root)
 
         params = {k: v for k, v in self.param.get_param_values()
@@ -99,6 +112,7 @@ class Accordion(NamedListPanel):
             new_models.append(panel)
         self._update_cards()
         self._update_active()
+        self._update_rendered()
         return new_models
 
     def _cleanup(self, root):
@@ -142,6 +156,15 @@ class Accordion(NamedListPanel):
         finally:
             self._updating_active = False
 
+    def _update_rendered(self, *events):
+        if not self.dynamic:
+            return
+        visible = [id(self.objects[i]) for i in self.active if i < len(self)]
+        retained = self._retained(visible)
+        for pane in self.objects:
+            if id(pane) in self._panels and id(pane) not in retained:
+                self._panels[id(pane)]._release()
+
     def _update_cards(self, *events):
         params = {k: v for k, v in self.param.get_param_values()
                   if k in self._synced_properties}
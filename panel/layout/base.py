@@ -3,6 +3,8 @@ Defines Layout classes which may be used to arrange panes and widgets
 in flexible ways to build complex dashboards.
 """
 from collections import defaultdict, namedtuple
+from contextvars import ContextVar
+from functools import partial
 
 import param
 
@@ -12,10 +14,40 @@ from ..io.model import hold
 from ..io.state import state
 from ..reactive import Reactive
 from ..util import param_name, param_reprs
+from ..viewable import Viewable
 
 _row = namedtuple("row", ["children"])
 _col = namedtuple("col", ["children"])
 
+# Viewables whose models changed during the current batched update
+_batch_changed = ContextVar('batch_changed', default=None)
+
+
+def _update_batched(root, changed, update=None):
+    """
+    Applies a model update to a view, collecting the Viewables whose
+    models changed. Updates nested inside another batched update add
+    to the outer batch, while the outermost update preprocesses the
+    view once with all changes in the batch.
+    """
+    batch = _batch_changed.get()
+    if batch is not None:
+        if update is not None:
+            update()
+        batch.extend(changed)
+        return
+    batch = []
+    token = _batch_changed.set(batch)
+    try:
+        if update is not None:
+            update()
+        batch.extend(changed)
+    finally:
+        _batch_changed.reset(token)
+    ref = root.ref['id']
+    if ref in state._views:
+        state._views[ref][0]._preprocess(root, batch)
+
 
 class Panel(Reactive):
     """
@@ -30,8 +62,6 @@ class Panel(Reactive):
 
     _linked_props = []
 
-    _batch_update = False
-
     def __repr__(self, depth=0, max_depth=10):
         if depth > max_depth:
             return '...'
@@ -57,23 +87,24 @@ class Panel(Reactive):
 
     def _update_model(self, events, msg, root, model, doc, comm=None):
         msg = dict(msg)
+        changed = []
         if self._rename['objects'] in msg:
             old = events['objects'].old
+            ref = root.ref['id']
+            # Objects whose model was (re)created for this root
+            old_models = {
+                id(obj): obj._models.get(ref, (None,))[0]
+                for obj in (old.values() if isinstance(old, dict) else old)
+            }
             msg[self._rename['objects']] = self._get_objects(model, old, doc, root, comm)
+            changed = [
+                obj for obj in self if ref in obj._models and
+                obj._models[ref][0] is not old_models.get(id(obj))
+            ]
 
+        update = partial(super()._update_model, events, msg, root, model, doc, comm)
         with hold(doc):
-            update = Panel._batch_update
-            Panel._batch_update = True
-            try:
-                super()._update_model(events, msg, root, model, doc, comm)
-                if update:
-                    return
-                from ..io import state
-                ref = root.ref['id']
-                if ref in state._views:
-                    state._views[ref][0]._preprocess(root)
-            finally:
-                Panel._batch_update = update
+            _update_batched(root, changed, update)
 
     #----------------------------------------------------------------
     # Model API
@@ -87,17 +118,22 @@ class Panel(Reactive):
         from ..pane.base import panel, RerenderError
         new_models = []
         for i, pane in enumerate(self.objects):
-            pane = panel(pane)
-            self.objects[i] = pane
+            if not isinstance(pane, Viewable):
+                self.objects[i] = panel(pane)
 
+        # Match old and new objects by identity to avoid quadratic lookups
+        current_ids = {id(obj) for obj in self.objects}
+        old_ids = set()
         for obj in old_objects:
-            if obj not in self.objects:
+            old_ids.add(id(obj))
+            if id(obj) not in current_ids:
                 obj._cleanup(root)
 
+        ref = root.ref['id']
         current_objects = list(self.objects)
         for i, pane in enumerate(self.objects):
-            if pane in old_objects:
-                child, _ = pane._models[root.ref['id']]
+            if id(pane) in old_ids and ref in pane._models:
+                child, _ = pane._models[ref]
             else:
                 try:
                     child = pane._get_model(doc, root, model, comm)
@@ -398,6 +434,7 @@ class NamedListPanel(ListPanel):
         objects, self._names = self._to_objects_and_names(items)
         super().__init__(*objects, **params)
         self._panels = defaultdict(dict)
+        self._shown = []
         self.param.watch(self._update_names, 'objects')
         # ALERT: Ensure that name update happens first, should be
         #        replaced by watch precedence support in param
@@ -437,6 +474,29 @@ class NamedListPanel(ListPanel):
     def _update_active(self, *events):
         pass
 
+    def _retained(self, visible):
+        """
+        Records the currently visible objects as the most recently shown
+        and returns the ids of the objects whose rendered models should
+        be retained when rendering dynamically.
+
+        Arguments
+        ---------
+        visible: list(int)
+          The ids of the currently visible objects
+
+        Returns
+        -------
+        retained: set(int)
+        """
+        current = {id(obj) for obj in self.objects}
+        hidden = [i for i in self._shown if i in current and i not in visible]
+        self._shown = hidden + list(visible)
+        if self.max_rendered is None:
+            return set(self._shown)
+        n = max(self.max_rendered - len(visible), 0)
+        return set(visible) | set(hidden[len(hidden)-n:] if n else [])
+
     #----------------------------------------------------------------
     # Public API
     #----------------------------------------------------------------
@@ -25,6 +25,10 @@ class Card(Column):
     css_classes = param.List(['card'], doc="""
         CSS classes to apply to the overall Card.""")
 
+    dynamic = param.Boolean(default=False, doc="""
+        Whether to defer rendering the contents of a collapsed Card
+        until it is first expanded.""")
+
     header = param.Parameter(doc="""
         A Panel component to display in the header bar of the Card.
         Will override the given title if defined.""")
@@ -51,19 +55,39 @@ class Card(Column):
     
     _linked_props = ['collapsed']
 
-    _rename = dict(Column._rename, title=None, header=None, title_css_classes=None)
+    _rename = dict(Column._rename, title=None, header=None,
+                   title_css_classes=None, dynamic=None)
 
     def __init__(self, *objects, **params):
         self._header_layout = Row(css_classes=['card-header-row'],
                                   sizing_mode='stretch_width')
         super().__init__(*objects, **params)
         self._header = None
+        self._rendered = set()
         self.param.watch(self._update_header, ['title', 'header', 'title_css_classes'])
+        self.param.watch(self._update_dynamic, ['collapsed', 'dynamic'])
         self._update_header()
 
     def _cleanup(self, root):
         super()._cleanup(root)
         self._header_layout._cleanup(root)
+        self._rendered.discard(root.ref['id'])
+
+    def _update_dynamic(self, *events):
+        if self.dynamic and self.collapsed:
+            return
+        if any(ref not in self._rendered for ref in self._models):
+            self.param.trigger('objects')
+
+    def _release(self):
+        """
+        Releases the rendered contents of a collapsed dynamic Card,
+        which will be rendered again when it is next expanded.
+        """
+        if not (self.dynamic and self.collapsed and self._rendered):
+            return
+        self._rendered.clear()
+        self.param.trigger('objects')
 
     def _process_param_change(self, params):
         scroll = params.pop('scroll', None)
@@ -99,5 +123,10 @@ class Card(Column):
             header = self._header_layout._models[ref][0]
         else:
             header = self._header_layout._get_model(doc, root, model, comm)
+        if self.dynamic and self.collapsed and ref not in self._rendered:
+            for obj in old_objects:
+                obj._cleanup(root)
+            return [header]
+        self._rendered.add(ref)
         objects = super()._get_objects(model, old_objects, doc, root, comm)
         return [header]+objects
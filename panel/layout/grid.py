@@ -3,7 +3,7 @@ Layout components to lay out objects in a grid.
 """
 import math
 
-from collections import OrderedDict, namedtuple
+from collections import OrderedDict, defaultdict, namedtuple
 from functools import partial
 
 import numpy as np
@@ -12,7 +12,7 @@ import param
 from bokeh.models import Box as BkBox, GridBox as BkGridBox
 
 from ..io.model import hold
-from .base import _col, _row, ListPanel, Panel
+from .base import _col, _row, _update_batched, ListPanel, Panel
 
 
 
@@ -34,6 +34,11 @@ class GridBox(ListPanel):
 
     _source_transforms = {'scroll': None, 'objects': None}
 
+    # LRU cache of grid positions indexed by number of objects, nrows and ncols
+    _positions = OrderedDict()
+
+    _positions_size = 64
+
     @classmethod
     def _flatten_grid(cls, layout, nrows=None, ncols=None):
         Item = namedtuple("Item", ["layout", "r0", "c0", "r1", "c1"])
@@ -126,44 +131,61 @@ class GridBox(ListPanel):
             layout = traverse(children)
         return cls._flatten_grid(layout, nrows, ncols)
 
+    @classmethod
+    def _get_positions(cls, n, nrows=None, ncols=None):
+        """
+        Returns the (row, col, height, width) of each of n objects laid
+        out in the grid. The positions only depend on the number of
+        objects and the shape of the grid, so they are cached.
+        """
+        key = (n, nrows, ncols)
+        if not n:
+            return []
+        elif key in cls._positions:
+            cls._positions.move_to_end(key)
+            return cls._positions[key]
+        children = cls._get_children(list(range(1, n+1)), nrows, ncols)
+        positions = [None] * n
+        for (i, r, c, h, w) in children:
+            positions[i-1] = (r, c, h, w)
+        cls._positions[key] = positions
+        while len(cls._positions) > cls._positions_size:
+            cls._positions.popitem(last=False)
+        return positions
+
+    def _layout_children(self, objects):
+        positions = self._get_positions(len(objects), self.nrows, self.ncols)
+        return [(obj,)+pos for obj, pos in zip(objects, positions)]
+
     def _get_model(self, doc, root=None, parent=None, comm=None):
         model = self._bokeh_model()
         if root is None:
             root = model
         objects = self._get_objects(model, [], doc, root, comm)
         properties = self._process_param_change(self._init_params())
-        properties['children'] = self._get_children(objects, self.nrows, self.ncols)
+        properties['children'] = self._layout_children(objects)
         model.update(**properties)
         self._models[root.ref['id']] = (model, parent)
         self._link_props(model, self._linked_props, doc, root, comm)
         return model
 
     def _update_model(self, events, msg, root, model, doc, comm=None):
-        from ..io import state
-
         msg = dict(msg)
+        changed = []
         if self._rename['objects'] in msg or 'ncols' in msg or 'nrows' in msg:
             if 'objects' in events:
                 old = events['objects'].old
             else:
                 old = self.objects
+            old_ids = {id(obj) for obj in old}
             objects = self._get_objects(model, old, doc, root, comm)
-            children = self._get_children(objects, self.nrows, self.ncols)
-            msg[self._rename['objects']] = children
+            msg[self._rename['objects']] = self._layout_children(objects)
+            changed = [obj for obj in self.objects if id(obj) not in old_ids]
 
+        msg = {k: v for k, v in msg.items() if k not in ('nrows', 'ncols')}
+        update = partial(super(Panel, self)._update_model, events, msg, root, model, doc, comm)
         with hold(doc):
-            msg = {k: v for k, v in msg.items() if k not in ('nrows', 'ncols')}
-            update = Panel._batch_update
-            Panel._batch_update = True
-            try:
-                super(Panel, self)._update_model(events, msg, root, model, doc, comm)
-                if update:
-                    return
-                ref = root.ref['id']
-                if ref in state._views:
-                    state._views[ref][0]._preprocess(root)
-            finally:
-                Panel._batch_update = update
+            _update_batched(root, changed, update)
 
 
 class GridSpec(Panel):
@@ -195,6 +217,11 @@ class GridSpec(Panel):
             params['objects'] = OrderedDict()
         super().__init__(**params)
         self._updating = False
+        # Geometry of each cell indexed by key, valid for _geometry_key
+        self._geometry = {}
+        self._geometry_key = None
+        # Child model and properties last applied to each object by root
+        self._applied = defaultdict(dict)
         self._update_nrows()
         self._update_ncols()
         self._update_grid_size()
@@ -229,58 +256,88 @@ class GridSpec(Panel):
                 params['min_height'] = params['height']
         return params
 
-    def _get_objects(self, model, old_objects, doc, root, comm=None):
-        from ..pane.base import RerenderError
-
-        if self.ncols:
-            width = int(float(self.width)/self.ncols)
+    def _cell_geometry(self, key):
+        """
+        Returns the (row, col, height, width) of the cell at the given
+        key and the sizing properties to apply to its object. Cached
+        until the shape, size or sizing_mode of the grid changes.
+        """
+        signature = (self.ncols, self.nrows, self.width, self.height, self.sizing_mode)
+        if signature != self._geometry_key:
+            self._geometry = {}
+            self._geometry_key = signature
+        elif key in self._geometry:
+            return self._geometry[key]
+
+        width = int(float(self.width)/self.ncols) if self.ncols else 0
+        height = int(float(self.height)/self.nrows) if self.nrows else 0
+
+        y0, x0, y1, x1 = key
+        x0 = 0 if x0 is None else x0
+        x1 = (self.ncols) if x1 is None else x1
+        y0 = 0 if y0 is None else y0
+        y1 = (self.nrows) if y1 is None else y1
+        r, c, h, w = (y0, x0, y1-y0, x1-x0)
+
+        if self.sizing_mode in ['fixed', None]:
+            properties = {'width': w*width, 'height': h*height}
         else:
-            width = 0
+            properties = {'sizing_mode': self.sizing_mode}
+            if 'width' in self.sizing_mode:
+                properties['height'] = h*height
+            elif 'height' in self.sizing_mode:
+                properties['width'] = w*width
+        geometry = self._geometry[key] = ((r, c, h, w), properties)
+        return geometry
 
-        if self.nrows:
-            height = int(float(self.height)/self.nrows)
-        else:
-            height = 0
+    def _get_objects(self, model, old_objects, doc, root, comm=None):
+        from ..pane.base import RerenderError
 
         current_objects = list(self.objects.values())
         if isinstance(old_objects, dict):
             old_objects = list(old_objects.values())
 
+        ref = root.ref['id']
+        applied = self._applied[ref]
+        current_ids = {id(obj) for obj in current_objects}
+        old_ids = set()
         for old in old_objects:
-            if old not in current_objects:
+            old_ids.add(id(old))
+            if id(old) not in current_ids:
                 old._cleanup(root)
+                applied.pop(id(old), None)
 
         children = []
-        for i, ((y0, x0, y1, x1), obj) in enumerate(self.objects.items()):
-            x0 = 0 if x0 is None else x0
-            x1 = (self.ncols) if x1 is None else x1
-            y0 = 0 if y0 is None else y0
-            y1 = (self.nrows) if y1 is None else y1
-            r, c, h, w = (y0, x0, y1-y0, x1-x0)
-
-            if self.sizing_mode in ['fixed', None]:
-                properties = {'width': w*width, 'height': h*height}
-            else:
-                properties = {'sizing_mode': self.sizing_mode}
-                if 'width' in self.sizing_mode:
-                    properties['height'] = h*height
-                elif 'height' in self.sizing_mode:
-                    properties['width'] = w*width
-            obj.param.set_param(**{k: v for k, v in properties.items()
-                                   if not obj.param[k].readonly})
-
-            if obj in old_objects:
-                child, _ = obj._models[root.ref['id']]
+        for i, (key, obj) in enumerate(self.objects.items()):
+            (r, c, h, w), properties = self._cell_geometry(key)
+
+            # Only update cells which were added, moved or resized
+            reuse = id(obj) in old_ids and ref in obj._models
+            previous = applied.get(id(obj))
+            writable = {k: v for k, v in properties.items()
+                        if not obj.param[k].readonly}
+            # Sizing changed on the object itself also invalidates the cell
+            unchanged = (
+                previous is not None and previous[1] == properties and
+                all(getattr(obj, k) == v for k, v in writable.items())
+            )
+            if not (reuse and unchanged):
+                obj.param.set_param(**writable)
+
+            if reuse:
+                child, _ = obj._models[ref]
             else:
                 try:
                     child = obj._get_model(doc, root, model, comm)
                 except RerenderError:
                     return self._get_objects(model, current_objects[:i], doc, root, comm)
 
-            if isinstance(child, BkBox) and len(child.children) == 1:
-                child.children[0].update(**properties)
-            else:
-                child.update(**properties)
+            if not (unchanged and previous[0] is child):
+                if isinstance(child, BkBox) and len(child.children) == 1:
+                    child.children[0].update(**properties)
+                else:
+                    child.update(**properties)
+                applied[id(obj)] = (child, properties)
             children.append((child, r, c, h, w))
         return children
 
@@ -309,6 +366,7 @@ class GridSpec(Panel):
 
     def _cleanup(self, root):
         super()._cleanup(root)
+        self._applied.pop(root.ref['id'], None)
         for p in self.objects.values():
             p._cleanup(root)
 
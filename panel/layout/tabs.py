@@ -22,6 +22,12 @@ class Tabs(NamedListPanel):
     dynamic = param.Boolean(default=False, doc="""
         Dynamically populate only the active tab.""")
 
+    max_rendered = param.Integer(default=1, bounds=(1, None), allow_None=True, doc="""
+        When dynamic, the maximum number of tabs to keep rendered. The
+        active tab is always rendered, beyond that the least recently
+        shown tabs are released first. If None all tabs are retained
+        once they have been shown.""")
+
     tabs_location = param.ObjectSelector(
         default='above', objects=['above', 'below', 'left', 'right'], doc="""
         The location of the tabs relative to the tab contents.""")
@@ -42,14 +48,15 @@ class Tabs(NamedListPanel):
 
     _manual_params = ['closable']
 
-    _rename = {'name': None, 'objects': 'tabs', 'dynamic': None}
+    _rename = {'name': None, 'objects': 'tabs', 'dynamic': None,
+               'max_rendered': None}
 
-    _source_transforms = {'dynamic': None, 'objects': None}
+    _source_transforms = {'dynamic': None, 'max_rendered': None, 'objects': None}
 
     def __init__(self, *objects, **params):
         super().__init__(*objects, **params)
         self.param.active.bounds = (0, len(self)-1)
-        self.param.watch(self._update_active, ['dynamic', 'active'])
+        self.param.watch(self._update_active, ['dynamic', 'active', 'max_rendered'])
 
     def _update_names(self, event):
         self.param.active.bounds = (0, len(event.new)-1)
@@ -100,7 +107,7 @@ class Tabs(NamedListPanel):
 
     def _update_active(self, *events):
         for event in events:
-            if event.name == 'dynamic' or (self.dynamic and event.name == 'active'):
+            if event.name == 'dynamic' or (self.dynamic and event.name in ('active', 'max_rendered')):
                 self.param.trigger('objects')
                 return
 
@@ -130,21 +137,30 @@ class Tabs(NamedListPanel):
             pane = panel(pane, name=name)
             self.objects[i] = pane
 
+        current_ids = {id(obj) for obj in self.objects}
+        old_ids = set()
         for obj in old_objects:
-            if obj not in self.objects:
+            old_ids.add(id(obj))
+            if id(obj) not in current_ids:
                 obj._cleanup(root)
 
+        if self.dynamic and 0 <= self.active < len(self):
+            retained = self._retained([id(self.objects[self.active])])
+        else:
+            retained = set()
+
         current_objects = list(self)
         panels = self._panels[root.ref['id']]
         for i, (name, pane) in enumerate(zip(self._names, self)):
-            hidden = self.dynamic and i != self.active
-            if (pane in old_objects and id(pane) in panels and
-                ((hidden and isinstance(panels[id(pane)].child, BkSpacer)) or
-                 (not hidden and not isinstance(panels[id(pane)].child, BkSpacer)))):
+            hidden = self.dynamic and id(pane) not in retained
+            rendered = id(pane) in panels and not isinstance(panels[id(pane)].child, BkSpacer)
+            if id(pane) in old_ids and id(pane) in panels and hidden != rendered:
                 panel = panels[id(pane)]
                 new_models.append(panel)
                 continue
-            elif self.dynamic and i != self.active:
+            elif hidden:
+                if rendered:
+                    pane._cleanup(root)
                 child = BkSpacer(**{k: v for k, v in pane.param.get_param_values()
                                     if k in Layoutable.param and v is not None})
             else:
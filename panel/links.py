@@ -33,6 +33,9 @@ class Callback(param.Parameterized):
     # Mapping from a source id to a Link instance
     registry = weakref.WeakKeyDictionary()
 
+    # Mapping from the id of a target to the Link instances targeting it
+    _target_registry = {}
+
     # Mapping to define callbacks by backend and Link type.
     # e.g. Callback._callbacks[Link] = Callback
     _callbacks = {}
@@ -81,42 +84,82 @@ class Callback(param.Parameterized):
         return self._source() if self._source else None
 
     @classmethod
-    def _process_callbacks(cls, root_view, root_model):
+    def _process_callbacks(cls, root_view, root_model, changed=None):
         if not root_model:
             return
 
-        linkable = root_view.select(Viewable)
-        linkable += root_model.select({'type' : BkModel})
-
-        if not linkable:
+        ref = root_model.ref['id']
+        if changed is not None and 'holoviews' in sys.modules:
+            from .pane.holoviews import HoloViews
+            if any(c.select(HoloViews) for c in changed):
+                changed = None
+
+        if changed is None:
+            # Look up links from or to the objects in the root, which
+            # avoids scanning the links registered by other roots
+            objs = root_view.select(Viewable) + list(root_model.select({'type': BkModel}))
+            candidates = {}
+            for o in objs:
+                for link in cls._links_for(o):
+                    candidates[id(link)] = link
+            candidates = list(candidates.values())
+        else:
+            # Look up links from or to the objects in the changed subtrees
+            candidates = {}
+            for obj in changed:
+                for viewable in obj.select(Viewable):
+                    objs = [viewable]
+                    if ref in viewable._models:
+                        objs += viewable._models[ref][0].select({'type': BkModel})
+                    for o in objs:
+                        for link in cls._links_for(o):
+                            candidates[id(link)] = link
+            candidates = list(candidates.values())
+
+        if not candidates:
             return
 
-        found = [(link, src, getattr(link, 'target', None)) for src in linkable
-                 for link in cls.registry.get(src, [])
-                 if not link._requires_target or link.target in linkable]
+        model_ids = None
+        def in_root(obj):
+            nonlocal model_ids
+            if isinstance(obj, Viewable):
+                return ref in obj._models
+            elif isinstance(obj, BkModel):
+                if model_ids is None:
+                    model_ids = {m.id for m in root_model.select({'type': BkModel})}
+                return obj.id in model_ids
+            return False
+
+        links, found = [], []
+        for link in candidates:
+            src = link.source
+            if src is None or not in_root(src):
+                continue
+            links.append(link)
+            tgt = getattr(link, 'target', None)
+            if not link._requires_target or in_root(tgt):
+                found.append((link, src, tgt))
 
         arg_overrides = {}
-        if 'holoviews' in sys.modules:
+        if links and 'holoviews' in sys.modules:
             from .pane.holoviews import HoloViews, generate_panel_bokeh_map
 
             hv_views = root_view.select(HoloViews)
-            map_hve_bk = generate_panel_bokeh_map(root_model, hv_views)
-            for src in linkable:
-                for link in cls.registry.get(src, []):
-                    if hasattr(link, 'target'):
-                        for tgt in map_hve_bk.get(link.target, []):
-                            found.append((link, src, tgt))
-                    arg_overrides[id(link)] = {}
-                    for k, v in link.args.items():
-                        # Not all args are hashable
-                        try:
-                            hv_objs = map_hve_bk.get(v, [])
-                        except Exception:
-                            continue
-                        for tgt in hv_objs:
-                            arg_overrides[id(link)][k] = tgt
+            map_hve_bk = generate_panel_bokeh_map(root_model, hv_views) if hv_views else {}
+            for link in (links if map_hve_bk else []):
+                if hasattr(link, 'target'):
+                    for tgt in map_hve_bk.get(link.target, []):
+                        found.append((link, link.source, tgt))
+                arg_overrides[id(link)] = {}
+                for k, v in link.args.items():
+                    # Not all args are hashable
+                    try:
+                        hv_objs = map_hve_bk.get(v, [])
+                    except Exception:
+                        continue
+                    for tgt in hv_objs:
+                        arg_overrides[id(link)][k] = tgt
 
-        ref = root_model.ref['id']
         callbacks = []
         for link, src, tgt in found:
             cb = cls._callbacks[type(link)]
@@ -129,6 +172,17 @@ class Callback(param.Parameterized):
                                 arg_overrides=overrides))
         return callbacks
 
+    @classmethod
+    def _links_for(cls, obj):
+        """
+        Returns all registered links with the object as source or target.
+        """
+        links = list(cls.registry.get(obj, []))
+        for link in cls._target_registry.get(id(obj), []):
+            if link.target is obj and link not in links:
+                links.append(link)
+        return links
+
 
 class Link(Callback):
     """
@@ -165,6 +219,22 @@ class Link(Callback):
     def target(self):
         return self._target() if self._target else None
 
+    def init(self):
+        """
+        Registers the Link and indexes it by its target
+        """
+        super().init()
+        target = self.target
+        if target is None or self not in self.registry.get(self.source, []):
+            return
+        key = id(target)
+        if key not in self._target_registry:
+            self._target_registry[key] = []
+            weakref.finalize(target, self._target_registry.pop, key, None)
+        links = self._target_registry[key]
+        if self not in links:
+            links.append(self)
+
     def link(self):
         """
         Registers the Link
@@ -188,7 +258,10 @@ class Link(Callback):
         """
         Unregisters the Link
         """
-        links = self.registry.get(self.source)
+        links = self.registry.get(self.source, [])
+        if self in links:
+            links.pop(links.index(self))
+        links = self._target_registry.get(id(self.target), [])
         if self in links:
             links.pop(links.index(self))
 
@@ -119,7 +119,15 @@ export class CommManager extends Model {
       if (plot == null)
         return
 
-      if ((buffers != undefined) && (buffers.length > 0))
+      if (metadata.msg_type == "packed") {
+        this._receiver.consume(metadata.header)
+        this._receiver.consume(metadata.metadata)
+        this._receiver.consume(content)
+        for (let i = 0; i < metadata.buffers.length; i++) {
+          this._receiver.consume(metadata.buffers[i])
+          this._receiver.consume(buffers[i].buffer)
+        }
+      } else if ((buffers != undefined) && (buffers.length > 0))
         this._receiver.consume(buffers[0].buffer)
       else
         this._receiver.consume(content)
@@ -1,4 +1,4 @@
-from bokeh.core.properties import Bool, Dict, Any, List
+from bokeh.core.properties import Bool, Dict, Any, List, Nullable, String
 from bokeh.models import Model
 
 
@@ -6,6 +6,12 @@ class State(Model):
 
     json = Bool(False, help="Whether the values point to json files")
 
+    blob = Nullable(String, help="""
+        Path or URL of the packed file the values point into as
+        [offset, length] slices""")
+
+    compression = Nullable(String, help="Compression of the slices in the packed file")
+
     state = Dict(Any, Any, help="Contains the recorded state")
 
     widgets = Dict(Any, Any)
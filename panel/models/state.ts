@@ -16,6 +16,15 @@ function get_json(file: string, callback: any): void {
   xobj.send(null);
 }
 
+async function decompress(buffer: ArrayBuffer, compression: string | null): Promise<string> {
+  if (compression == null)
+    return new TextDecoder().decode(buffer)
+  const stream = new Blob([buffer]).stream().pipeThrough(
+    new (window as any).DecompressionStream(compression)
+  )
+  return await new Response(stream).text()
+}
+
 export class StateView extends View {
   model: State
 
@@ -27,6 +36,8 @@ export namespace State {
   export type Attrs = p.AttrsOf<Props>
 
   export type Props = Model.Props & {
+    blob: p.Property<string | null>
+    compression: p.Property<string | null>
     json: p.Property<boolean>
     state: p.Property<object>
     values: p.Property<any[]>
@@ -40,11 +51,13 @@ export class State extends Model {
   properties: State.Props
   _receiver: Receiver
   _cache: {[key: string]: string}
+  _buffer: ArrayBuffer | null
 
   constructor(attrs?: Partial<State.Attrs>) {
     super(attrs)
     this._receiver = new Receiver()
     this._cache = {}
+    this._buffer = null
   }
 
   apply_state(state: any): void {
@@ -69,6 +82,38 @@ export class State extends Model {
       this.apply_state(this._cache[current])
   }
 
+  async _fetch_slice(offset: number, length: number): Promise<ArrayBuffer> {
+    if (this._buffer != null)
+      return this._buffer.slice(offset, offset+length)
+    const response = await fetch(this.blob as string, {
+      headers: {Range: `bytes=${offset}-${offset+length-1}`}
+    })
+    if (response.status == 206)
+      return await response.arrayBuffer()
+    else if (response.status != 200)
+      throw new Error(`Fetching state slice from ${this.blob} failed with status ${response.status}.`)
+    // The server does not support range requests so keep the whole file
+    const buffer = await response.arrayBuffer()
+    if (buffer.byteLength < offset+length)
+      throw new Error(`State file ${this.blob} is truncated, expected at least ${offset+length} bytes but got ${buffer.byteLength}.`)
+    this._buffer = buffer
+    return buffer.slice(offset, offset+length)
+  }
+
+  async _receive_slice(slice: [number, number]): Promise<void> {
+    const [offset, length] = slice
+    const key = String(offset)
+    const buffer = await this._fetch_slice(offset, length)
+    const state = JSON.parse(await decompress(buffer, this.compression))
+    this._cache[key] = state
+    let current: any = this.state
+    for (const i of this.values) {
+      current = current[i]
+    }
+    if (current[0] === offset)
+      this.apply_state(state)
+  }
+
   set_state(widget: any, value: any): void {
     let values: any[] = copy(this.values)
     const index: any = this.widgets[widget.id]
@@ -78,7 +123,13 @@ export class State extends Model {
       state = state[i]
     }
     this.values = values
-    if (this.json) {
+    if (this.blob != null) {
+      const key = String(state[0])
+      if (this._cache[key])
+        this.apply_state(this._cache[key])
+      else
+        this._receive_slice(state).catch(console.error)
+    } else if (this.json) {
       if (this._cache[state]) {
         this.apply_state(this._cache[state])
       } else {
@@ -94,11 +145,13 @@ export class State extends Model {
   static init_State(): void {
     this.prototype.default_view = StateView
 
-    this.define<State.Props>(({Any, Boolean}) => ({
-      json:    [ Boolean, false ],
-      state:   [ Any,        {} ],
-      widgets: [ Any,        {} ],
-      values:  [ Any,        [] ],
+    this.define<State.Props>(({Any, Boolean, Nullable, String}) => ({
+      blob:        [ Nullable(String),  null ],
+      compression: [ Nullable(String),  null ],
+      json:        [ Boolean,          false ],
+      state:       [ Any,                 {} ],
+      widgets:     [ Any,                 {} ],
+      values:      [ Any,                 [] ],
     }))
   }
 }
@@ -10,6 +10,7 @@ from bokeh.models.layouts import GridBox as _BkGridBox
 
 from ..io import init_doc, push, state, unlocked
 from ..layout import Panel, Row
+from ..layout.base import _update_batched
 from ..links import Link
 from ..models import ReactiveHTML as _BkReactiveHTML
 from ..reactive import Reactive
@@ -102,8 +103,22 @@ class PaneBase(Reactive):
     # List of parameters that trigger a rerender of the Bokeh model
     _rerender_params = ['object']
 
+    # Python types for which the applicable Pane type does not depend
+    # on the value of the object, allowing dispatch to be cached by type
+    _type_dispatch_types = (bool, int, float, complex, type(None))
+
+    # Cache of concrete Pane types and pane types resolved by type,
+    # invalidated whenever a new Pane type is declared
+    _pane_types = None
+    _type_dispatch = {}
+
     __abstract = True
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        PaneBase._pane_types = None
+        PaneBase._type_dispatch.clear()
+
     def __init__(self, object=None, **params):
         applies = self.applies(object, **(params if self._applies_kw else {}))
         if (isinstance(applies, bool) and not applies) and object is not None :
@@ -181,10 +196,7 @@ class PaneBase(Reactive):
                 else:
                     parent.children[index] = new_model
 
-        from ..io import state
-        ref = root.ref['id']
-        if ref in state._views:
-            state._views[ref][0]._preprocess(root)
+        _update_batched(root, [self])
 
     def _update_pane(self, *events):
         for ref, (_, parent) in self._models.items():
@@ -199,7 +211,7 @@ class PaneBase(Reactive):
             else:
                 cb = partial(self._update_object, ref, doc, root, parent, comm)
                 if doc.session_context:
-                    doc.add_next_tick_callback(cb)
+                    state._schedule_update(doc, cb)
                 else:
                     cb()
 
@@ -288,8 +300,14 @@ class PaneBase(Reactive):
         """
         if isinstance(obj, Viewable):
             return type(obj)
+        obj_type = type(obj)
+        cacheable = not kwargs and obj_type in cls._type_dispatch_types
+        if cacheable and obj_type in PaneBase._type_dispatch:
+            return PaneBase._type_dispatch[obj_type]
+        if PaneBase._pane_types is None:
+            PaneBase._pane_types = list(param.concrete_descendents(PaneBase).values())
         descendents = []
-        for p in param.concrete_descendents(PaneBase).values():
+        for p in PaneBase._pane_types:
             if p.priority is None:
                 applies = True
                 try:
@@ -317,6 +335,8 @@ class PaneBase(Reactive):
                     applies = False
             if not applies:
                 continue
+            if cacheable:
+                PaneBase._type_dispatch[obj_type] = pane_type
             return pane_type
         raise TypeError('%s type could not be rendered.' % type(obj).__name__)
 
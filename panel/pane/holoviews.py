@@ -527,11 +527,13 @@ def generate_panel_bokeh_map(root_model, panel_views):
     return map_hve_bk
 
 
-def find_links(root_view, root_model):
+def find_links(root_view, root_model, changed=None):
     """
     Traverses the supplied Viewable searching for Links between any
     HoloViews based panes.
     """
+    if changed is not None and not any(c.select(HoloViews) for c in changed):
+        return
     hv_views = root_view.select(HoloViews)
     root_plots = [plot for view in hv_views for plot, _ in view._plots.values()
                   if getattr(plot, 'root', None) is root_model]
@@ -576,11 +578,13 @@ def find_links(root_view, root_model):
     return callbacks
 
 
-def link_axes(root_view, root_model):
+def link_axes(root_view, root_model, changed=None):
     """
     Pre-processing hook to allow linking axes across HoloViews bokeh
     plots.
     """
+    if changed is not None and not any(c.select(HoloViews) for c in changed):
+        return
     panes = root_view.select(HoloViews)
 
     if not panes:
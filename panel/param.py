@@ -899,17 +899,27 @@ class JSONInit(param.Parameterized):
                 warnobj.warning(str(e))
 
 
-def link_param_method(root_view, root_model):
+def link_param_method(root_view, root_model, changed=None):
     """
     This preprocessor jslinks ParamMethod loading parameters to any
     widgets generated from those parameters ensuring that the loading
     indicator is enabled client side.
     """
-    methods = root_view.select(lambda p: isinstance(p, ParamMethod) and p.loading_indicator)
-    widgets = root_view.select(lambda w: isinstance(w, Widget) and getattr(w, '_param_pane', None) is not None)
+    is_method = lambda p: isinstance(p, ParamMethod) and p.loading_indicator
+    is_widget = lambda w: isinstance(w, Widget) and getattr(w, '_param_pane', None) is not None
+    if changed is None:
+        updated = None
+    else:
+        updated = {id(obj) for c in changed for obj in c.select(lambda o: is_method(o) or is_widget(o))}
+        if not updated:
+            return
+    methods = root_view.select(is_method)
+    widgets = root_view.select(is_widget)
 
     for widget in widgets:
         for method in methods:
+            if updated is not None and id(widget) not in updated and id(method) not in updated:
+                continue
             for cb in method._callbacks:
                 pobj = cb.cls if cb.inst is None else cb.inst
                 if widget._param_pane.object is pobj:
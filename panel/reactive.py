@@ -5,8 +5,10 @@ models rendered on the frontend.
 """
 
 import difflib
+import logging
 import sys
 import threading
+import time
 
 from collections import Counter, defaultdict, namedtuple
 from functools import partial
@@ -15,15 +17,17 @@ import bleach
 import numpy as np
 import param
 
-from bokeh.models import LayoutDOM
+from bokeh.models import ColumnDataSource, LayoutDOM
 from param.parameterized import ParameterizedMetaclass
 from tornado import gen
+from tornado.ioloop import IOLoop
 
 from .config import config
 from .io.callbacks import PeriodicCallback
+from .io.metrics import metrics
 from .io.model import hold
 from .io.notebook import push, push_on_root
-from .io.server import unlocked
+from .io.server import _SharedData, unlocked
 from .io.state import state
 from .models.reactive_html import (
     ReactiveHTML as _BkReactiveHTML, ReactiveHTMLParser, construct_data_model
@@ -31,6 +35,8 @@ from .models.reactive_html import (
 from .util import edit_readonly, escape, updating
 from .viewable import Layoutable, Renderable, Viewable
 
+log = logging.getLogger(__name__)
+
 LinkWatcher = namedtuple("Watcher","inst cls fn mode onlychanged parameter_names what queued target links transformed bidirectional_watcher")
 
 
@@ -82,6 +88,12 @@ class Syncable(Renderable):
         # A dictionary of current property change events
         self._events = {}
 
+        # The batch of events currently processed on the thread pool
+        self._change_future = None
+
+        # Pending debounced property changes indexed by (ref, attr)
+        self._debounced = {}
+
         # Any watchers associated with links between two objects
         self._links = []
         self._link_params()
@@ -184,7 +196,7 @@ class Syncable(Renderable):
             else:
                 cb = partial(self._manual_update, events, model, doc, root, parent, comm)
                 if doc.session_context:
-                    doc.add_next_tick_callback(cb)
+                    state._schedule_update(doc, cb)
                 else:
                     cb()
 
@@ -237,21 +249,50 @@ class Syncable(Renderable):
                     push(doc, comm)
             else:
                 cb = partial(self._update_model, events, msg, root, model, doc, comm)
-                doc.add_next_tick_callback(cb)
+                state._schedule_update(doc, cb)
 
     def _process_events(self, events):
-        with edit_readonly(state):
-            state.busy = True
+        state._set_busy(True)
         try:
             with edit_readonly(self):
                 self.param.set_param(**self._process_property_change(events))
         finally:
-            with edit_readonly(state):
-                state.busy = False
+            state._set_busy(False)
 
     @gen.coroutine
     def _change_coroutine(self, doc=None):
-        self._change_event(doc)
+        thread_pool = state._get_thread_pool()
+        if thread_pool is None:
+            self._change_event(doc)
+        elif self._events:
+            # Process batches one at a time so updates apply in order,
+            # leaving the events pending until the current batch is done
+            if self._change_future is not None and not self._change_future.done():
+                return
+            # Take the batch on the event loop, which owns self._events
+            events, self._events = self._events, {}
+            loop = IOLoop.current()
+            future = self._change_future = thread_pool.submit(
+                self._threaded_change_event, doc, events
+            )
+            future.add_done_callback(
+                lambda f: loop.add_callback(self._change_coroutine, doc)
+            )
+
+    def _threaded_change_event(self, doc, events):
+        """
+        Processes a batch of queued events on a thread pool thread.
+        Since the thread does not hold the Document lock any resulting
+        model updates are scheduled back onto the event loop.
+        """
+        try:
+            state.curdoc = doc
+            with metrics.time_callback(self, doc):
+                self._process_events(events)
+        except Exception:
+            log.exception("Failed to process events on thread pool.")
+        finally:
+            state.curdoc = None
 
     def _change_event(self, doc=None):
         try:
@@ -261,7 +302,8 @@ class Syncable(Renderable):
             state._thread_id = thread_id
             events = self._events
             self._events = {}
-            self._process_events(events)
+            with metrics.time_callback(self, doc):
+                self._process_events(events)
         finally:
             state.curdoc = None
             state._thread_id = None
@@ -280,6 +322,17 @@ class Syncable(Renderable):
             return
 
         state._locks.clear()
+        self._schedule_change(doc, ref, attr, new)
+
+    def _schedule_change(self, doc, ref, attr, new):
+        """
+        Queues a change to a model property originating in the
+        frontend, applying the debounce policy declared for it.
+        """
+        policy = self._debounce_policy(attr) if doc.session_context else None
+        if policy is not None:
+            self._debounce_change(doc, ref, attr, new, policy)
+            return
         processing = bool(self._events)
         self._events.update({attr: new})
         if not processing:
@@ -288,6 +341,59 @@ class Syncable(Renderable):
             else:
                 self._change_event(doc)
 
+    def _debounce_policy(self, attr):
+        """
+        Returns the debounce policy for the supplied model property as
+        a dictionary with 'delay', 'leading', 'trailing' and 'max_wait'
+        keys or None if events should be processed with the default
+        debounce timeout.
+        """
+        return None
+
+    def _debounce_change(self, doc, ref, attr, new, policy):
+        """
+        Records a property change and schedules it to be processed
+        according to the supplied debounce policy.
+        """
+        key = (ref, attr)
+        now = time.monotonic() * 1000
+        pending = self._debounced.get(key)
+        if pending is None:
+            pending = self._debounced[key] = {
+                'first': now, 'last': now, 'value': new, 'pending': True
+            }
+            if policy['leading']:
+                pending['pending'] = False
+                self._dispatch_change(doc, attr, new)
+            doc.add_timeout_callback(
+                partial(self._debounce_timeout, doc, key, policy), policy['delay']
+            )
+        else:
+            pending.update(last=now, value=new, pending=True)
+
+    def _debounce_timeout(self, doc, key, policy):
+        pending = self._debounced.get(key)
+        if pending is None:
+            return
+        due = pending['last'] + policy['delay']
+        if policy['max_wait'] is not None:
+            due = min(due, pending['first'] + policy['max_wait'])
+        remaining = due - time.monotonic() * 1000
+        if remaining > 0:
+            doc.add_timeout_callback(
+                partial(self._debounce_timeout, doc, key, policy), remaining
+            )
+            return
+        del self._debounced[key]
+        if pending['pending'] and policy['trailing']:
+            self._dispatch_change(doc, key[1], pending['value'])
+
+    def _dispatch_change(self, doc, attr, new):
+        processing = bool(self._events)
+        self._events.update({attr: new})
+        if not processing:
+            doc.add_next_tick_callback(partial(self._change_coroutine, doc))
+
 
 class Reactive(Syncable, Viewable):
     """
@@ -577,6 +683,66 @@ class Reactive(Syncable, Viewable):
                     bidirectional=bidirectional)
 
 
+class _ColumnBuffer(object):
+    """
+    A preallocated buffer backing a single streamed column. Appending
+    writes into spare capacity and rollover only advances the start
+    offset, so the amortized cost of a stream event is proportional
+    to the number of new rows rather than the total length. The
+    buffer is compacted (or grown) into a newly allocated array once
+    the spare capacity runs out, leaving arrays previously returned by
+    ``append`` untouched.
+    """
+
+    def __init__(self, array, capacity):
+        array = np.asarray(array)
+        self.buffer = np.empty(max(capacity, len(array), 1), dtype=array.dtype)
+        self.buffer[:len(array)] = array
+        self.start = 0
+        self.end = len(array)
+        self.view = self.buffer[self.start:self.end]
+
+    def append(self, array, rollover=None):
+        array = np.asarray(array)
+        if rollover is not None:
+            array = array[len(array)-rollover:] if len(array) > rollover else array
+        dtype = np.result_type(self.buffer, array)
+        if dtype != self.buffer.dtype:
+            self._reallocate(len(self.buffer), dtype)
+        nrows = len(array)
+        if self.end + nrows > len(self.buffer):
+            current = self.end - self.start
+            keep = current if rollover is None else min(current, rollover-nrows)
+            capacity = len(self.buffer)
+            if keep + nrows > capacity // 2:
+                capacity = 2 * (keep + nrows)
+            self.start = self.end - keep
+            self._reallocate(capacity, self.buffer.dtype)
+        self.buffer[self.end:self.end+nrows] = array
+        self.end += nrows
+        if rollover is not None:
+            self.start = max(self.start, self.end-rollover)
+        self.view = self.buffer[self.start:self.end]
+        return self.view
+
+    def matches(self, array):
+        """
+        Whether the supplied array is the current view of the buffer.
+        """
+        array = np.asarray(array)
+        return (
+            array.dtype == self.view.dtype and len(array) == len(self.view) and
+            array.__array_interface__['data'][0] == self.view.__array_interface__['data'][0]
+        )
+
+    def _reallocate(self, capacity, dtype):
+        current = self.buffer[self.start:self.end]
+        buffer = np.empty(capacity, dtype=dtype)
+        buffer[:len(current)] = current
+        self.buffer = buffer
+        self.start, self.end = 0, len(current)
+
+
 class SyncableData(Reactive):
     """
     A baseclass for components which sync one or more data parameters
@@ -597,6 +763,10 @@ class SyncableData(Reactive):
         super().__init__(**params)
         self._data = None
         self._processed = None
+        # Buffers backing columns of streamed dictionary data
+        self._buffers = {}
+        # Buffers backing the index and columns of streamed DataFrames
+        self._frame_buffers = {}
         self.param.watch(self._validate, self._data_params)
         if self._data_params:
             self.param.watch(self._update_cds, self._data_params)
@@ -664,18 +834,101 @@ class SyncableData(Reactive):
             m.source.selected.indices = indices
             push_on_root(ref)
 
+    def _shared_payload(self, data):
+        """
+        Wraps a stream or patch payload which is sent to the models of
+        multiple sessions, ensuring it is only serialized once.
+        """
+        if len(self._models) < 2:
+            return data
+        if 'pandas' in sys.modules:
+            import pandas as pd
+            if isinstance(data, pd.DataFrame):
+                data = ColumnDataSource._data_from_df(data)
+        if not isinstance(data, dict):
+            return data
+        return _SharedData(data)
+
     @updating
     def _stream(self, stream, rollover=None):
+        stream = self._shared_payload(stream)
         for ref, (m, _) in self._models.items():
             m.source.stream(stream, rollover)
             push_on_root(ref)
 
     @updating
     def _patch(self, patch):
+        patch = self._shared_payload(patch)
         for ref, (m, _) in self._models.items():
             m.source.patch(patch)
             push_on_root(ref)
 
+    def _patch_dataframe(self, data, patch_value):
+        """
+        Applies a DataFrame patch to the data with a single block
+        assignment per column, aligning the patch on the index. If
+        the index of the data is not unique the patch is applied
+        row by row to all rows sharing a label instead.
+
+        Arguments
+        ---------
+        data: pandas.DataFrame
+          The DataFrame to update in place.
+        patch_value: pandas.DataFrame
+          The DataFrame containing the new values.
+
+        Returns
+        -------
+        patch: dict
+          A ColumnDataSource patch with one entry per column, using a
+          single slice when the patched rows are contiguous.
+        """
+        if not data.index.is_unique:
+            return self._patch_dataframe_labels(data, patch_value)
+        positions = data.index.get_indexer(patch_value.index)
+        if (positions < 0).any():
+            missing = list(patch_value.index[positions < 0])
+            raise ValueError(f"Cannot patch rows which are not in the "
+                             f"index of the data: {missing}.")
+        contiguous = len(positions) > 0 and (np.diff(positions) == 1).all()
+        patch = {}
+        for column in patch_value.columns:
+            values = patch_value[column].values
+            data.iloc[positions, data.columns.get_loc(column)] = values
+            if contiguous:
+                patch[column] = [(slice(positions[0], positions[-1]+1), values)]
+            else:
+                patch[column] = list(zip(positions.tolist(), values))
+        return patch
+
+    def _patch_dataframe_labels(self, data, patch_value):
+        """
+        Applies a DataFrame patch to data with a non-unique index,
+        updating every row sharing a label of the patch.
+        """
+        patch = {column: [] for column in patch_value.columns}
+        for label, row in zip(patch_value.index, patch_value.itertuples(index=False)):
+            positions = np.flatnonzero(data.index == label)
+            if not len(positions):
+                raise ValueError(f"Cannot patch rows which are not in the "
+                                 f"index of the data: {[label]}.")
+            for column, value in zip(patch_value.columns, row):
+                data.iloc[positions, data.columns.get_loc(column)] = value
+                patch[column].extend((int(i), value) for i in positions)
+        return patch
+
+    @staticmethod
+    def _dataframe_patch_dict(patch_value):
+        """
+        Converts a DataFrame patch into a dictionary of (row label,
+        value) pairs per column, used to patch data which is not a
+        DataFrame.
+        """
+        return {
+            column: list(zip(patch_value.index, patch_value[column].values))
+            for column in patch_value.columns
+        }
+
     def stream(self, stream_value, rollover=None, reset_index=True):
         """
         Streams (appends) the `stream_value` provided to the existing
@@ -744,11 +997,12 @@ class SyncableData(Reactive):
                 value_index_start = self._processed.index.max() + 1
                 stream_value = stream_value.reset_index(drop=True)
                 stream_value.index += value_index_start
-            combined = pd.concat([self._processed, stream_value])
             if rollover is not None:
-                combined = combined.iloc[-rollover:]
+                stream_value = stream_value.iloc[len(stream_value)-rollover:]
+            combined = self._stream_frame(self._processed, stream_value, rollover)
             with param.discard_events(self):
                 self._update_data(combined)
+            self._processed = combined
             try:
                 self._updating = True
                 self.param.trigger(self._data_params[0])
@@ -777,10 +1031,14 @@ class SyncableData(Reactive):
                 if not all(col in stream_value for col in self._data):
                     raise ValueError("Stream update must append to all columns.")
                 for col, array in stream_value.items():
-                    combined = np.concatenate([self._data[col], array])
-                    if rollover is not None:
-                        combined = combined[-rollover:]
+                    current = self._data[col]
+                    buffer = self._buffers.get(col)
+                    if buffer is None or buffer.view is not current:
+                        capacity = 2 * max(len(current)+len(array), rollover or 0)
+                        buffer = self._buffers[col] = _ColumnBuffer(current, capacity)
+                    combined = buffer.append(array, rollover)
                     self._update_column(col, combined)
+                    self._data[col] = combined
                 self._updating = True
                 try:
                     self._stream(stream_value, rollover)
@@ -795,6 +1053,57 @@ class SyncableData(Reactive):
         else:
             raise ValueError("The stream value provided is not a DataFrame, Series or Dict!")
 
+    def _stream_frame(self, processed, stream_value, rollover=None):
+        """
+        Appends the stream_value to the processed DataFrame. Where
+        the index and all columns are plain numpy arrays they are
+        written into preallocated buffers, so the cost of each stream
+        event is proportional to the number of new rows, otherwise
+        the DataFrames are concatenated.
+        """
+        import pandas as pd
+        columns = list(processed.columns)
+        bufferable = (
+            list(stream_value.columns) == columns and
+            not isinstance(processed.index, pd.MultiIndex) and
+            isinstance(processed.index.dtype, np.dtype) and
+            isinstance(stream_value.index.dtype, np.dtype) and
+            all(isinstance(dt, np.dtype) for dt in processed.dtypes) and
+            all(isinstance(dt, np.dtype) for dt in stream_value.dtypes)
+        )
+        if not bufferable:
+            self._frame_buffers = {}
+            if rollover is not None:
+                # Discard rows which roll over before concatenating so
+                # the cost is bounded by the rollover, not the length
+                keep = max(rollover-len(stream_value), 0)
+                processed = processed.iloc[len(processed)-keep:] if keep else processed.iloc[:0]
+                stream_value = stream_value.iloc[len(stream_value)-rollover:]
+            return pd.concat([processed, stream_value])
+
+        arrays = [('index', processed.index.values, stream_value.index.values)]
+        arrays += [
+            (i, processed.iloc[:, i].values, stream_value.iloc[:, i].values)
+            for i in range(len(columns))
+        ]
+        buffers = self._frame_buffers
+        if (len(buffers) != len(arrays) or
+            not all(k in buffers and buffers[k].matches(current)
+                    for k, current, _ in arrays)):
+            buffers = self._frame_buffers = {
+                k: _ColumnBuffer(current, 2 * max(len(current)+len(new), rollover or 0))
+                for k, current, new in arrays
+            }
+        combined = {k: buffers[k].append(new, rollover) for k, _, new in arrays}
+        index = pd.Index(
+            combined.pop('index'), name=processed.index.name, copy=False
+        )
+        frame = pd.DataFrame(
+            {i: combined[i] for i in range(len(columns))}, index=index, copy=False
+        )
+        frame.columns = processed.columns
+        return frame
+
     def patch(self, patch_value):
         """
         Efficiently patches (updates) the existing value with the `patch_value`.
@@ -853,12 +1162,15 @@ class SyncableData(Reactive):
             pd = None
         data = getattr(self, self._data_params[0])
         if pd and isinstance(patch_value, pd.DataFrame):
-            patch_value_dict = {}
-            for column in patch_value.columns:
-                patch_value_dict[column] = []
-                for index in patch_value.index:
-                    patch_value_dict[column].append((index, patch_value.loc[index, column]))
-            self.patch(patch_value_dict)
+            if not isinstance(data, pd.DataFrame):
+                self.patch(self._dataframe_patch_dict(patch_value))
+                return
+            patch = self._patch_dataframe(data, patch_value)
+            self._updating = True
+            try:
+                self._patch(patch)
+            finally:
+                self._updating = False
         elif pd and isinstance(patch_value, pd.Series):
             if "index" in patch_value:  # Series orient is row
                 patch_value_dict = {
@@ -0,0 +1,73 @@
+import asyncio
+
+from panel.io.callbacks import PeriodicFeed
+from panel.io.state import state
+
+
+def test_periodic_feed_shared_by_subscribers():
+    calls = []
+
+    def producer():
+        calls.append(len(calls))
+        return len(calls)
+
+    feed = PeriodicFeed(producer=producer, period=20)
+    received1, received2 = [], []
+
+    async def run():
+        feed.subscribe(received1.append)
+        feed.subscribe(received2.append)
+        await asyncio.sleep(0.1)
+        feed.unsubscribe(received1.append)
+        assert feed.running
+        feed.unsubscribe(received2.append)
+        assert not feed.running
+
+    asyncio.run(run())
+
+    assert len(calls) >= 3
+    assert received1 == received2 == list(range(1, len(calls)+1))
+    assert feed.counter == len(calls)
+    assert feed.value == len(calls)
+
+
+def test_periodic_feed_subscribe_receives_latest_value():
+    feed = PeriodicFeed(producer=lambda: 'value', period=1000)
+    received = []
+
+    async def run():
+        feed.subscribe(lambda v: None)
+        await asyncio.sleep(0.05)
+        feed.subscribe(received.append)
+        feed.stop()
+
+    asyncio.run(run())
+
+    assert received == ['value']
+
+
+def test_periodic_feed_skips_tick_while_running():
+    async def producer():
+        await asyncio.sleep(0.05)
+        return 1
+
+    feed = PeriodicFeed(producer=producer, period=10)
+
+    async def run():
+        feed.start()
+        await asyncio.sleep(0.12)
+        feed.stop()
+
+    asyncio.run(run())
+
+    assert 1 <= feed.counter <= 3
+    assert feed._skipped > 0
+
+
+def test_state_add_periodic_feed_shared_by_key():
+    try:
+        feed = state.add_periodic_feed('test-feed', lambda: 1, period=100)
+        assert state.add_periodic_feed('test-feed', lambda: 2) is feed
+        assert feed.period == 100
+    finally:
+        state._feeds.pop('test-feed', None)
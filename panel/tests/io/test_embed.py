@@ -516,3 +516,155 @@ def test_save_embed_json(tmpdir):
         assert event['kind'] == 'ModelChanged'
         assert event['attr'] == 'text'
         assert event['new'] == '&lt;pre&gt;%s&lt;/pre&gt;' % v
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_save_embed_json_packed(tmpdir, compress):
+    import gzip
+
+    from bokeh.document import Document
+
+    select = Select(options=['A', 'B', 'C'])
+    checkbox = Checkbox()
+    string = Str()
+    def link(target, event):
+        target.object = str(checkbox.value)
+    checkbox.link(string, callbacks={'value': link})
+    select.link(string, callbacks={'value': link})
+    panel = Row(select, checkbox, string)
+    document = Document()
+    with config.set(embed=True, safe_embed=True):
+        model = panel.get_root(document)
+        embed_state(panel, model, document, json=True, save_path=str(tmpdir),
+                    load_path='https://example.com/states', progress=False,
+                    packed=True, compress=compress)
+    _, state = document.roots
+
+    blobs = glob.glob(os.path.join(str(tmpdir), '*.bin'))
+    assert len(blobs) == 1
+    assert os.listdir(str(tmpdir)) == [os.path.basename(blobs[0])]
+    assert state.blob == 'https://example.com/states/' + os.path.basename(blobs[0])
+    assert state.compression == ('gzip' if compress else None)
+
+    with open(blobs[0], 'rb') as f:
+        data = f.read()
+    slices = {tuple(s) for values in state.state.values() for s in values.values()}
+    # Six states but only two distinct payloads
+    assert len(slices) == 2
+    assert sum(length for _, length in slices) == len(data)
+
+    for value in ('false', 'true'):
+        offset, length = state.state['B'][value]
+        payload = data[offset:offset+length]
+        if compress:
+            payload = gzip.decompress(payload)
+        events = json.loads(json.loads(payload)['content'])['events']
+        text = [e['new'] for e in events if e.get('attr') == 'text']
+        assert text == ['&lt;pre&gt;%s&lt;/pre&gt;' % value.title()]
+
+
+def _embedded_contents(processes):
+    from bokeh.document import Document
+    from pyviz_comms import Comm
+
+    select = Select(options=['A', 'B', 'C'])
+    checkbox = Checkbox()
+    string = Str()
+    def link(target, event):
+        target.object = f'{select.value} {checkbox.value}'
+    select.link(string, callbacks={'value': link})
+    checkbox.link(string, callbacks={'value': link})
+    panel = Row(select, checkbox, string)
+    document = Document()
+    with config.set(embed=True):
+        model = panel.get_root(document, Comm())
+    embed_state(panel, model, document, processes=processes, progress=False)
+    _, state = document.roots
+    # Strip model ids which differ between the two apps
+    return {
+        (k1, k2): [
+            {k: v for k, v in event.items() if k != 'model'}
+            for event in json.loads(events['content'])['events']
+        ]
+        for k1, values in state.state.items() for k2, events in values.items()
+    }
+
+
+@pytest.mark.skipif(
+    'fork' not in __import__('multiprocessing').get_all_start_methods(),
+    reason='Parallel embedding requires the fork start method'
+)
+def test_embed_state_parallel_matches_serial():
+    serial = _embedded_contents(1)
+    parallel = _embedded_contents(2)
+    assert set(serial) == {(v, c) for v in 'ABC' for c in ('false', 'true')}
+    assert parallel == serial
+
+
+def test_embed_state_dedupes_identical_payloads(document, comm):
+    select = Select(options=['A', 'B', 'C'])
+    checkbox = Checkbox()
+    string = Str()
+    def link(target, event):
+        target.object = str(checkbox.value)
+    checkbox.link(string, callbacks={'value': link})
+    select.link(string, callbacks={'value': link})
+    panel = Row(select, checkbox, string)
+    with config.set(embed=True, safe_embed=True):
+        model = panel.get_root(document, comm)
+        embed_state(panel, model, document, progress=False)
+    _, state = document.roots
+    assert state.state['A']['true'] is state.state['B']['true']
+
+
+@pytest.mark.skipif(
+    'fork' not in __import__('multiprocessing').get_all_start_methods(),
+    reason='Parallel embedding requires the fork start method'
+)
+def test_embed_state_parallel_falls_back_with_live_threads(monkeypatch):
+    import multiprocessing
+    import threading
+
+    import param
+
+    warnings = []
+    monkeypatch.setattr(param.main, 'warning', warnings.append)
+    def get_context(method):
+        raise AssertionError('Worker processes must not be forked')
+    monkeypatch.setattr(multiprocessing, 'get_context', get_context)
+
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, name='live-thread')
+    thread.start()
+    try:
+        contents = _embedded_contents(2)
+    finally:
+        stop.set()
+        thread.join()
+    assert len(contents) == 6
+    assert any('live-thread' in w and 'single process' in w for w in warnings)
+
+
+@pytest.mark.skipif(
+    'fork' not in __import__('multiprocessing').get_all_start_methods(),
+    reason='Parallel embedding requires the fork start method'
+)
+def test_embed_state_parallel_warns_with_daemon_threads(monkeypatch):
+    import threading
+
+    import param
+
+    from panel.io import embed
+
+    warnings = []
+    monkeypatch.setattr(param.main, 'warning', warnings.append)
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, name='daemon-thread', daemon=True)
+    thread.start()
+    try:
+        monkeypatch.setattr(embed, '_live_threads', lambda: [thread])
+        assert _embedded_contents(2) == _embedded_contents(1)
+    finally:
+        stop.set()
+        thread.join()
+    assert any('daemon-thread' in w for w in warnings)
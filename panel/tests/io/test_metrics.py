@@ -0,0 +1,108 @@
+import time
+
+import pytest
+
+from bokeh.document import Document
+from bokeh.document.events import ModelChangedEvent
+from bokeh.protocol import Protocol
+
+from panel.io.metrics import Counter, Gauge, Histogram, metrics
+from panel.io.server import _patch_message
+from panel.widgets import TextInput
+
+
+@pytest.fixture
+def enable_metrics():
+    metrics.enabled = True
+    try:
+        yield metrics
+    finally:
+        metrics.enabled = False
+        metrics.callback_duration.clear()
+        metrics.render_duration.clear()
+        metrics.app_callback_duration.clear()
+        metrics.patch_messages.clear()
+        metrics.patch_bytes.clear()
+
+
+def test_counter_render():
+    counter = Counter('requests_total', 'Number of requests.', ['path'])
+    counter.inc(1, '/')
+    counter.inc(2, '/')
+    counter.inc(1, '/app')
+    assert counter.render() == [
+        '# HELP requests_total Number of requests.',
+        '# TYPE requests_total counter',
+        'requests_total{path="/"} 3.0',
+        'requests_total{path="/app"} 1.0'
+    ]
+
+
+def test_gauge_function():
+    values = [1]
+    gauge = Gauge('items', 'Number of items.', function=lambda: len(values))
+    assert gauge.render()[-1] == 'items 1.0'
+    values.append(2)
+    assert gauge.render()[-1] == 'items 2.0'
+
+
+def test_histogram_render():
+    histogram = Histogram('latency_seconds', 'Latency.', ['component'], buckets=(0.1, 1))
+    histogram.observe(0.05, 'Button')
+    histogram.observe(0.5, 'Button')
+    histogram.observe(5, 'Button')
+    assert histogram.render()[2:] == [
+        'latency_seconds_bucket{component="Button",le="0.1"} 1.0',
+        'latency_seconds_bucket{component="Button",le="1.0"} 2.0',
+        'latency_seconds_bucket{component="Button",le="+Inf"} 3.0',
+        'latency_seconds_sum{component="Button"} 5.55',
+        'latency_seconds_count{component="Button"} 3.0'
+    ]
+
+
+def test_histogram_remove_label():
+    histogram = Histogram('latency_seconds', 'Latency.', ['session'])
+    histogram.observe(0.05, 'a')
+    histogram.observe(0.05, 'b')
+    histogram.remove('a')
+    assert not any('session="a"' in line for line in histogram.render())
+
+
+def test_metrics_disabled_records_nothing():
+    text_input = TextInput()
+    with metrics.time_callback(text_input):
+        pass
+    assert metrics.callback_duration.samples() == []
+
+
+def test_metrics_time_callback(enable_metrics):
+    text_input = TextInput()
+    doc = Document()
+    model = text_input.get_root(doc)
+    text_input._server_change(doc, model.ref['id'], 'value', '', 'A')
+
+    assert text_input.value == 'A'
+    samples = {
+        (name, labels): value for name, labels, value in metrics.callback_duration.samples()
+    }
+    assert samples[('panel_callback_duration_seconds_count', (('component', 'TextInput'),))] == 1
+
+
+def test_metrics_time_render(enable_metrics):
+    with metrics.time_render(TextInput()):
+        time.sleep(0.01)
+    rendered = metrics.render()
+    assert 'panel_render_duration_seconds_count{component="TextInput"} 1.0' in rendered
+    assert 'panel_live_sessions 0.0' in rendered
+
+
+def test_metrics_record_patch_message(enable_metrics):
+    text_input = TextInput()
+    doc = Document()
+    model = text_input.get_root(doc)
+    event = ModelChangedEvent(doc, model, 'value', '', 'A', 'A')
+    msg = _patch_message(Protocol(), [event])
+
+    assert metrics.patch_messages.samples() == [('panel_patch_doc_messages_total', (), 1)]
+    nbytes = len(msg.header_json) + len(msg.metadata_json) + len(msg.content_json)
+    assert metrics.patch_bytes.samples() == [('panel_patch_doc_bytes_total', (), nbytes)]
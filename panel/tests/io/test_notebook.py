@@ -1,8 +1,44 @@
-from panel.io.notebook import ipywidget
+import json
+
+import numpy as np
+
+from bokeh.document import Document
+from bokeh.models import ColumnDataSource
+
+from panel.io.model import hold
+from panel.io.notebook import ipywidget, push
 from panel.pane import Str
 
 from ..util import jb_available
 
+
+class _MockComm:
+
+    def __init__(self):
+        self.messages = []
+
+    def send(self, data=None, metadata=None, buffers=[]):
+        self.messages.append((data, metadata, buffers))
+
+
+def test_push_packs_buffers_into_single_message():
+    doc = Document()
+    cds = ColumnDataSource(data={'x': np.arange(10), 'y': np.arange(10.)})
+    doc.add_root(cds)
+    comm = _MockComm()
+    with hold(doc):
+        cds.data = {'x': np.arange(100), 'y': np.arange(100.)}
+        push(doc, comm)
+
+    assert len(comm.messages) == 1
+    data, metadata, buffers = comm.messages[0]
+    header = json.loads(metadata['header'])
+    assert metadata['msg_type'] == 'packed'
+    assert header['msgtype'] == 'PATCH-DOC'
+    assert header['num_buffers'] == len(buffers) == len(metadata['buffers']) == 1
+    assert bytes(buffers[0]) == np.arange(100.).tobytes()
+    assert json.loads(data)['events'][0]['kind'] == 'ColumnDataChanged'
+
 @jb_available
 def test_ipywidget():
     pane = Str('A')
@@ -1,9 +1,17 @@
+import asyncio
 import os
+import sys
+import time
+import types
+
+from bokeh.document import Document
+from tornado.ioloop import IOLoop
 
 from panel.io.location import Location
 from panel.io.reload import (
-     _check_file, _modules, _reload_on_update, _watched_files,
-    in_blacklist, record_modules, watch
+    _FileWatcher, _affected, _check_file, _dependents, _libc_inotify,
+    _modules, _reload_on_update, _sessions, _watched_files, _watchers,
+    in_blacklist, record_modules, start_watcher, stop_watcher, watch
 )
 from panel.io.state import state
 
@@ -35,14 +43,87 @@ def test_watch():
     _watched_files.clear()
 
 def test_reload_on_update():
+    doc = Document()
     location = Location()
-    state._location = location
+    state._locations[doc] = location
+    _sessions.add(doc)
     filepath = os.path.abspath(__file__)
     watch(filepath)
     modify_times = {filepath: os.stat(__file__).st_mtime-1}
-    _reload_on_update(modify_times)
+    assert _reload_on_update(modify_times) == {filepath}
     assert location.reload
+    assert doc not in _sessions
 
     # Cleanup
     _watched_files.clear()
-    state._location = None
+    del state._locations[doc]
+
+def _make_module(name, path, **namespace):
+    module = types.ModuleType(name)
+    module.__file__ = path
+    module.__dict__.update(namespace)
+    return module
+
+def test_dependents_and_affected_sessions():
+    base = _make_module('_reload_base', '/tmp/_reload_base.py')
+    derived = _make_module('_reload_derived', '/tmp/_reload_derived.py', base=base)
+    other = _make_module('_reload_other', '/tmp/_reload_other.py')
+    modules = {m.__name__: m for m in (base, derived, other)}
+    sys.modules.update(modules)
+    _modules.update(modules)
+    try:
+        stale = _dependents({'_reload_base'})
+        assert stale == {'_reload_base', '_reload_derived'}
+
+        app_doc, other_doc = Document(), Document()
+        app_doc._modules.append(_make_module('bokeh_app_1', '/tmp/app.py', derived=derived))
+        other_doc._modules.append(_make_module('bokeh_app_2', '/tmp/other.py', other=other))
+        assert _affected(app_doc, {'/tmp/_reload_base.py'}, stale)
+        assert not _affected(other_doc, {'/tmp/_reload_base.py'}, stale)
+        assert _affected(other_doc, {'/tmp/other.py'}, set())
+        assert _affected(Document(), {'/tmp/_reload_base.py'}, stale)
+    finally:
+        _modules.clear()
+        for name in modules:
+            del sys.modules[name]
+
+def test_file_watcher_detects_change(tmpdir):
+    path = str(tmpdir.join('app.py'))
+    with open(path, 'w') as f:
+        f.write('a = 1')
+    watch(path)
+    watcher = _FileWatcher()
+    notified = []
+    watcher._notify = notified.append
+    watcher.start()
+    try:
+        with open(path, 'w') as f:
+            f.write('a = 2')
+        mtime = time.time() + 10
+        os.utime(path, (mtime, mtime))
+        if _libc_inotify() is not None and watcher._fd is not None:
+            watcher._on_events(watcher._fd, None)
+            assert notified == [{path}]
+        else:
+            assert watcher._changed(watcher._paths) == {path}
+    finally:
+        watcher.stop()
+        _watched_files.clear()
+
+def test_watcher_lifetime_tied_to_loop():
+    async def run():
+        loop = IOLoop.current()
+        watcher = start_watcher()
+        try:
+            assert _watchers[loop] is watcher
+            assert start_watcher() is watcher
+        finally:
+            stop_watcher()
+        assert loop not in _watchers
+        assert watcher._stopped.is_set()
+        assert watcher._fd is None and watcher._thread is None
+        return watcher
+
+    first = asyncio.run(run())
+    second = asyncio.run(run())
+    assert first is not second
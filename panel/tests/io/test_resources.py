@@ -0,0 +1,106 @@
+import gzip
+import os
+import time
+
+from panel.config import config
+from bokeh.model import Model
+from bokeh.models import Div
+
+from panel.io import resources as resources_module
+from panel.io.resources import DIST_DIR, AssetCache, Resources
+
+
+def test_asset_cache_reads_once(tmpdir):
+    path = str(tmpdir.join('test.css'))
+    with open(path, 'w') as f:
+        f.write('.a { color: red; }')
+    cache = AssetCache()
+    asset = cache.get(path)
+    assert asset.text == '.a { color: red; }'
+    assert cache.get(path) is asset
+
+
+def test_asset_cache_invalidates_on_mtime(tmpdir):
+    path = str(tmpdir.join('test.css'))
+    with open(path, 'w') as f:
+        f.write('.a { color: red; }')
+    cache = AssetCache()
+    asset = cache.get(path)
+    with open(path, 'w') as f:
+        f.write('.a { color: blue; }')
+    mtime = time.time() + 10
+    os.utime(path, (mtime, mtime))
+    new_asset = cache.get(path)
+    assert new_asset is not asset
+    assert new_asset.text == '.a { color: blue; }'
+    assert new_asset.hash != asset.hash
+
+
+def test_asset_cache_missing_file(tmpdir):
+    assert AssetCache().get(str(tmpdir.join('missing.css'))) is None
+
+
+def test_asset_precompressed(tmpdir):
+    path = str(tmpdir.join('test.css'))
+    content = '.a { color: red; }\n' * 100
+    with open(path, 'w') as f:
+        f.write(content)
+    encodings = AssetCache().get(path).encodings
+    assert gzip.decompress(encodings['gzip']).decode('utf-8') == content
+
+
+def test_asset_versioned_url(tmpdir):
+    path = str(tmpdir.join('test.css'))
+    with open(path, 'w') as f:
+        f.write('.a { color: red; }')
+    cache = AssetCache()
+    assert cache.versioned('test.css', path) == f'test.css?v={cache.get(path).hash}'
+    assert cache.versioned('test.css?a=1', path) == 'test.css?a=1'
+
+
+def test_resources_server_css_files_versioned():
+    resources = Resources(mode='server', root_url='http://localhost/')
+    dist_css = [f for f in resources.css_files if 'extensions/panel/css' in f]
+    assert len(dist_css) == len(os.listdir(DIST_DIR / 'css'))
+    assert all('?v=' in f for f in dist_css)
+
+
+def test_resources_inline_css_raw_includes_css_files(tmpdir):
+    path = str(tmpdir.join('test.css'))
+    with open(path, 'w') as f:
+        f.write('.custom { color: red; }')
+    with config.set(css_files=[path]):
+        raw = Resources(mode='inline').css_raw
+    assert '.custom { color: red; }' in raw
+    with open(DIST_DIR / 'css' / 'card.css', encoding='utf-8') as f:
+        assert f.read() in raw
+
+
+def test_resources_js_files_cached_respects_config():
+    resources = Resources(mode='cdn')
+    files = resources.js_files
+    assert resources.js_files == files
+    with config.set(js_files={'custom': 'https://example.com/custom.js'}):
+        assert Resources(mode='cdn').js_files[-1] == 'https://example.com/custom.js'
+    assert Resources(mode='cdn').js_files == files
+
+
+def test_resources_js_files_cached_respects_model_registry():
+    files = Resources(mode='cdn').js_files
+
+    class CustomResourceModel(Div):
+        __javascript__ = ['https://example.com/model.js']
+
+    try:
+        assert 'https://example.com/model.js' not in files
+        assert 'https://example.com/model.js' in Resources(mode='cdn').js_files
+    finally:
+        Model.model_class_reverse_map.pop(CustomResourceModel.__qualified_model__)
+    assert Resources(mode='cdn').js_files == files
+
+
+def test_resources_js_files_cache_bounded():
+    for i in range(resources_module._JS_FILES_SIZE+5):
+        with config.set(js_files={'custom': f'https://example.com/custom{i}.js'}):
+            Resources(mode='cdn').js_files
+    assert len(resources_module._JS_FILES) == resources_module._JS_FILES_SIZE
@@ -1,3 +1,10 @@
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+from panel.config import config
 from panel.io.state import state
 
 
@@ -31,3 +38,267 @@ def test_as_cached_key_and_kwarg():
     assert state.as_cached('test', test_fn, a=1) == 1
     assert state.as_cached('test', test_fn, a=2) == 2
     state.cache.clear()
+
+
+def test_as_cached_max_items_lru():
+    calls = []
+
+    def test_fn(a):
+        calls.append(a)
+        return a
+
+    with config.set(cache_max_items=2):
+        state.as_cached('test', test_fn, a=1)
+        state.as_cached('test', test_fn, a=2)
+        state.as_cached('test', test_fn, a=1)
+        state.as_cached('test', test_fn, a=3)
+        assert calls == [1, 2, 3]
+        assert ('test', ('a', 2)) not in state.cache
+        state.as_cached('test', test_fn, a=1)
+        assert calls == [1, 2, 3]
+    state.cache.clear()
+
+
+def test_as_cached_max_bytes():
+    def test_fn(a):
+        return np.zeros(100)
+
+    with config.set(cache_max_bytes=1000):
+        state.as_cached('test', test_fn, a=1)
+        state.as_cached('test', test_fn, a=2)
+        info = state.cache_info()
+    assert info['items'] == 1
+    assert info['bytes'] == 800
+    assert ('test', ('a', 2)) in state.cache
+    state.cache.clear()
+
+
+def test_as_cached_ttl(monkeypatch):
+    now = [0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    calls = []
+
+    def test_fn():
+        calls.append(None)
+        return len(calls)
+
+    assert state.as_cached('test', test_fn, cache_ttl=10) == 1
+    now[0] = 5
+    assert state.as_cached('test', test_fn, cache_ttl=10) == 1
+    now[0] = 10
+    assert state.as_cached('test', test_fn, cache_ttl=10) == 2
+    state.cache.clear()
+
+
+def test_as_cached_single_flight_threads():
+    calls = []
+
+    def test_fn():
+        calls.append(None)
+        time.sleep(0.2)
+        return len(calls)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(state.as_cached('test', test_fn)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [1, 1, 1, 1]
+    assert len(calls) == 1
+    state.cache.clear()
+
+
+def test_as_cached_does_not_block_event_loop():
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fn():
+        started.set()
+        release.wait()
+        return 'slow'
+
+    thread = threading.Thread(target=lambda: state.as_cached('test', slow_fn))
+    thread.start()
+    started.wait()
+
+    async def run():
+        return state.as_cached('test', lambda: 'fast')
+
+    try:
+        assert asyncio.new_event_loop().run_until_complete(run()) == 'fast'
+    finally:
+        release.set()
+        thread.join()
+    state.cache.clear()
+
+
+def test_as_cached_ttl_not_passed_to_fn():
+    def test_fn(**kwargs):
+        return kwargs
+
+    assert state.as_cached('test', test_fn, cache_ttl=10, ttl=1) == {'ttl': 1}
+    state.cache.clear()
+
+
+def test_as_cached_single_flight_async():
+    calls = []
+
+    async def test_fn(a):
+        calls.append(a)
+        await asyncio.sleep(0.1)
+        return a
+
+    async def run():
+        return await asyncio.gather(*(
+            state.as_cached('test', test_fn, a=1) for _ in range(3)
+        ))
+
+    assert asyncio.new_event_loop().run_until_complete(run()) == [1, 1, 1]
+    assert calls == [1]
+    state.cache.clear()
+
+
+def test_as_cached_cache_info():
+    stats = state.cache_info()
+    state.as_cached('test', lambda: 1)
+    state.as_cached('test', lambda: 1)
+    info = state.cache_info()
+    assert info['hits'] == stats['hits'] + 1
+    assert info['misses'] == stats['misses'] + 1
+    state.cache.clear()
+
+
+def test_collect_session_info_across_workers(tmpdir):
+    import json
+    import os
+
+    from collections import OrderedDict
+
+    session_info = state.session_info
+    state.session_info = {'total': 2, 'live': 1, 'sessions': OrderedDict([
+        ('a', {'launched': 1, 'started': 1, 'rendered': 1, 'ended': None}),
+        ('b', {'launched': 3, 'started': None, 'rendered': None, 'ended': None}),
+    ])}
+    state._session_info_dir = str(tmpdir)
+    other = {'total': 2, 'live': 1, 'sessions': {
+        'b': {'launched': 4, 'started': 4, 'rendered': 4, 'ended': None},
+        'c': {'launched': 2, 'started': 2, 'rendered': None, 'ended': 2},
+    }}
+    try:
+        tmpdir.join('%d.json' % os.getppid()).write(json.dumps(other))
+        tmpdir.join('ignored.txt').write('')
+        state._publish_session_info()
+        assert json.loads(tmpdir.join('%d.json' % os.getpid()).read()) == state.session_info
+
+        info = state._collect_session_info()
+    finally:
+        state.session_info = session_info
+        state._session_info_dir = None
+
+    assert info['total'] == 3
+    assert info['live'] == 2
+    assert list(info['sessions']) == ['a', 'c', 'b']
+    assert info['sessions']['b']['rendered'] == 4
+
+
+def test_collect_session_info_removes_dead_workers(tmpdir):
+    import json
+    import subprocess
+    import sys
+
+    proc = subprocess.Popen([sys.executable, '-c', 'pass'])
+    proc.wait()
+    dead = tmpdir.join('%d.json' % proc.pid)
+    dead.write(json.dumps({'total': 1, 'live': 1, 'sessions': {
+        'a': {'launched': 1, 'started': 1, 'rendered': 1, 'ended': None}
+    }}))
+    state._session_info_dir = str(tmpdir)
+    try:
+        info = state._collect_session_info()
+    finally:
+        state._session_info_dir = None
+
+    assert 'a' not in info['sessions']
+    assert not dead.exists()
+
+
+def test_publish_session_info_throttled_on_loop(tmpdir):
+    import asyncio
+    import json
+    import os
+
+    path = tmpdir.join('%d.json' % os.getpid())
+
+    async def publish():
+        state._publish_session_info()
+        state._publish_session_info()
+        assert state._session_info_pending
+        assert not path.exists()
+        await asyncio.sleep(0.1)
+        for _ in range(50):
+            if path.exists():
+                break
+            await asyncio.sleep(0.01)
+
+    state._session_info_dir = str(tmpdir)
+    state._session_info_interval = 0.05
+    try:
+        asyncio.run(publish())
+    finally:
+        state._session_info_dir = None
+        del state._session_info_interval
+
+    assert json.loads(path.read()) == state.session_info
+    assert not state._session_info_pending
+
+
+def test_busy_cleared_after_concurrent_callbacks():
+    state._set_busy(True)
+    state._set_busy(True)
+    state._set_busy(False)
+    assert state.busy
+    state._set_busy(False)
+    assert not state.busy
+
+
+def test_thread_id_local_to_thread():
+    import threading
+
+    state._thread_id = 1
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(state._thread_id))
+    thread.start()
+    thread.join()
+    state._thread_id = None
+
+    assert seen == [None]
+
+
+def test_session_info_missing_directory(tmpdir):
+    import json
+    import os
+
+    path = tmpdir.join('missing')
+    state._session_info_dir = str(path)
+    try:
+        info = state._collect_session_info()
+        assert info['sessions'] == state.session_info['sessions']
+        state._publish_session_info()
+    finally:
+        state._session_info_dir = None
+    assert json.loads(path.join('%d.json' % os.getpid()).read()) == state.session_info
+
+
+def test_session_info_directory_only_removed_by_parent(tmpdir):
+    import os
+
+    from panel.io.rest import _remove_session_info_dir
+
+    path = tmpdir.mkdir('session_info')
+    _remove_session_info_dir(str(path), os.getppid())
+    assert path.exists()
+    _remove_session_info_dir(str(path), os.getpid())
+    assert not path.exists()
@@ -137,3 +137,24 @@ def test_accordion_set_card_collapsed(document, comm, accordion):
     c1.collapsed = True
     c2.collapsed = True
     assert accordion.active == []
+
+
+def test_accordion_dynamic(document, comm):
+    div1, div2, div3 = Div(), Div(), Div()
+    accordion = Accordion(div1, div2, div3, dynamic=True, max_rendered=2)
+    model = accordion.get_root(document, comm=comm)
+    card1, card2, card3 = model.children
+    assert [len(c.children) for c in model.children] == [1, 1, 1]
+
+    accordion.active = [0]
+    assert card1.children[1] is div1
+    assert len(card2.children) == 1
+
+    accordion.active = [1]
+    assert card1.children[1] is div1
+    assert card2.children[1] is div2
+
+    accordion.active = [2]
+    assert len(card1.children) == 1
+    assert card2.children[1] is div2
+    assert card3.children[1] is div3
@@ -343,6 +343,25 @@ def test_layout_setitem_replace_slice_out_of_bounds(panel, document, comm):
         layout[3:4] = [div3]
 
 
+@pytest.mark.parametrize('panel', [Column, Row])
+def test_layout_move_and_replace_reuses_models(panel, document, comm):
+    layout = panel(*(Div() for _ in range(5)))
+    p1, p2, p3, p4, p5 = layout.objects
+
+    model = layout.get_root(document, comm=comm)
+    ref = model.ref['id']
+    children = list(model.children)
+
+    div = Div()
+    layout[:] = [p5, p3, div, p1, p4]
+
+    assert model.children[:2] == [children[4], children[2]]
+    assert model.children[3:] == [children[0], children[3]]
+    assert model.children[2] is div
+    assert ref in p5._models and ref in p1._models
+    assert p2._models == {}
+
+
 @pytest.mark.parametrize('panel', [Column, Row])
 def test_layout_pop(panel, document, comm):
     div1 = Div()
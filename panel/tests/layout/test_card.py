@@ -69,3 +69,26 @@ def test_card_get_root_header(document, comm):
     assert isinstance(model, CardModel)
     assert model.children == [header, div1, div2]
     assert header.children[0] is div3
+
+
+def test_card_dynamic(document, comm):
+    div = Div()
+    html = HTML('Content')
+    layout = Card(div, html, dynamic=True, collapsed=True)
+
+    model = layout.get_root(document, comm=comm)
+    ref = model.ref['id']
+    assert len(model.children) == 1
+    assert ref not in html._models
+
+    layout.collapsed = False
+    header, div_model, html_model = model.children
+    assert div_model is div
+    assert html._models[ref][0] is html_model
+
+    layout.collapsed = True
+    assert model.children[1:] == [div_model, html_model]
+
+    layout._release()
+    assert len(model.children) == 1
+    assert ref not in html._models
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import pytest
 
 from bokeh.models import Div
@@ -286,3 +288,66 @@ def test_gridspec_fixed_nrows():
     grid = GridSpec(nrows=3)
     for index in range(5):
         grid[:, index] = "Hello World"
+
+
+def test_gridbox_append_reuses_models(document, comm):
+    div1, div2, div3 = Div(), Div(), Div()
+    grid_box = GridBox(div1, div2, ncols=2)
+
+    model = grid_box.get_root(document, comm=comm)
+    grid_box.append(div3)
+
+    assert model.children == [
+        (div1, 0, 0, 1, 1), (div2, 0, 1, 1, 1), (div3, 1, 0, 1, 1)
+    ]
+
+
+def test_gridspec_replace_cell_only_updates_cell(document, comm):
+    gspec = GridSpec(width=400, height=400)
+    gspec[0, 0] = Spacer()
+    gspec[0, 1] = Spacer()
+    gspec[1, :] = Spacer()
+
+    model = gspec.get_root(document, comm=comm)
+    s1, s2, s3 = gspec
+    before = {tuple(pos): child for child, *pos in model.children}
+    s1.width = 50
+
+    div = Div()
+    gspec[0, 1] = div
+
+    after = {tuple(pos): child for child, *pos in model.children}
+    assert after[(0, 0, 1, 1)] is before[(0, 0, 1, 1)]
+    assert after[(1, 0, 1, 2)] is before[(1, 0, 1, 2)]
+    assert after[(0, 1, 1, 1)] is div
+    assert (div.width, div.height) == (200, 200)
+    assert s1.width == 200
+    assert before[(0, 0, 1, 1)].width == 200
+    assert model.ref['id'] not in s2._models
+
+
+def test_gridspec_reapplies_sizing_changed_on_object(document, comm):
+    gspec = GridSpec(width=400, height=400)
+    gspec[0, 0] = Spacer()
+    gspec[1, 0] = Spacer()
+
+    model = gspec.get_root(document, comm=comm)
+    s1, s2 = gspec
+    s1.height = 20
+    assert model.children[0][0].height == 20
+
+    gspec[1, 0] = Spacer()
+
+    assert s1.height == 200
+    assert model.children[0][0].height == 200
+
+
+def test_gridbox_positions_cache_bounded(monkeypatch):
+    monkeypatch.setattr(GridBox, '_positions', OrderedDict())
+    monkeypatch.setattr(GridBox, '_positions_size', 2)
+    first = GridBox._get_positions(1, ncols=1)
+    GridBox._get_positions(2, ncols=1)
+    assert GridBox._get_positions(1, ncols=1) is first
+    GridBox._get_positions(3, ncols=1)
+
+    assert list(GridBox._positions) == [(1, None, 1), (3, None, 1)]
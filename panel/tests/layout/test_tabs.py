@@ -298,6 +298,35 @@ def test_dynamic_tabs(document, comm, tabs):
     assert isinstance(tab2.child, BkSpacer)
 
 
+def test_dynamic_tabs_max_rendered(document, comm):
+    div1, div2, div3 = Div(), Div(), Div()
+    tabs = Tabs(div1, div2, div3, dynamic=True, max_rendered=2)
+    p1, p2, p3 = tabs
+    model = tabs.get_root(document, comm=comm)
+    ref = model.ref['id']
+
+    tabs.active = 1
+    tab1, tab2, tab3 = model.tabs
+    assert tab1.child is div1
+    assert tab2.child is div2
+    assert isinstance(tab3.child, BkSpacer)
+
+    tabs.active = 2
+    tab1, tab2, tab3 = model.tabs
+    assert isinstance(tab1.child, BkSpacer)
+    assert ref not in p1._models
+    assert tab2.child is div2
+    assert tab3.child is div3
+
+    tabs.active = 1
+    assert model.tabs[1] is tab2
+    assert model.tabs[2] is tab3
+
+    tabs.max_rendered = None
+    tabs.active = 0
+    assert [t.child for t in model.tabs] == [div1, div2, div3]
+
+
 def test_tabs_append_uses_object_name(document, comm, tabs):
     model = tabs.get_root(document, comm=comm)
     tab1_before, tab2_before = model.tabs
@@ -49,3 +49,28 @@ def test_pane_signature(pane):
     assert len(parameters) == 2
     assert 'object' in parameters
     assert parameters['object'] == Parameter('object', Parameter.POSITIONAL_OR_KEYWORD, default=None)
+
+
+def test_pane_type_dispatch_cached_by_type():
+    PaneBase._type_dispatch.clear()
+    pane_type = PaneBase.get_pane_type(1)
+    assert PaneBase._type_dispatch == {int: pane_type}
+    assert PaneBase.get_pane_type(2) is pane_type
+    PaneBase.get_pane_type('text')
+    assert str not in PaneBase._type_dispatch
+
+
+def test_pane_type_dispatch_cache_invalidated_by_subclass():
+    PaneBase.get_pane_type(1)
+    assert PaneBase._pane_types is not None
+
+    class _NeverApplies(PaneBase):
+
+        @classmethod
+        def applies(cls, obj):
+            return False
+
+    assert PaneBase._type_dispatch == {}
+    assert PaneBase._pane_types is None
+    PaneBase.get_pane_type(1)
+    assert _NeverApplies in PaneBase._pane_types
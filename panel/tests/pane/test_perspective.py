@@ -42,3 +42,15 @@ def test_perspective_int_cols():
     assert psp2.aggregates == {0: 'mean'}
     assert psp2.sort == [[0, 'desc']]
     assert psp2.filters == [[0, '==', 'None']]
+
+
+def test_perspective_stream_dataframe_rollover():
+    import pandas as pd
+
+    psp = Perspective(pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]}))
+
+    psp.stream(pd.DataFrame({'x': [7, 8], 'y': [9, 10]}))
+    psp.stream(pd.DataFrame({'x': [11], 'y': [13]}), rollover=4)
+
+    assert list(psp.object.index) == [2, 3, 4, 5]
+    assert list(psp.object.x) == [3, 7, 8, 11]
@@ -1,3 +1,5 @@
+import weakref
+
 try:
     import holoviews as hv
 except ImportError:
@@ -7,7 +9,7 @@ import pytest
 
 from bokeh.plotting import figure
 from panel.layout import Row
-from panel.links import Link
+from panel.links import Callback, Link
 from panel.pane import Bokeh, HoloViews
 from panel.widgets import FloatSlider, RangeSlider, ColorPicker, TextInput, DatetimeInput
 from panel.tests.util import hv_available
@@ -49,6 +51,125 @@ def test_widget_jslink_bidirectional(document, comm):
     assert link2_customjs.args['target'] is tm1
 
 
+def test_widget_jslink_added_after_render(document, comm):
+    t1 = TextInput()
+    t2 = TextInput()
+    t3 = TextInput()
+
+    t3.jslink(t1, value='value')
+
+    row = Row(t1, t2)
+    model = row.get_root(document, comm)
+    tm1, tm2 = model.children
+    t2_callbacks = dict(tm2.js_property_callbacks)
+
+    row.append(t3)
+    tm3 = model.children[2]
+
+    link_customjs = tm3.js_property_callbacks['change:value'][-1]
+    assert link_customjs.args['source'] is tm3
+    assert link_customjs.args['target'] is tm1
+    assert len(tm3.js_property_callbacks['change:value']) == 1
+    assert tm2.js_property_callbacks == t2_callbacks
+
+
+def test_preprocess_changed_subtrees(document, comm):
+    t1, t2 = TextInput(), TextInput()
+    row = Row(t1)
+    row.get_root(document, comm)
+
+    calls = []
+    def hook(root_view, root_model, changed=None):
+        calls.append(changed)
+
+    row._hooks.append(hook)
+    try:
+        row.append(t2)
+    finally:
+        row._hooks.remove(hook)
+
+    assert calls == [[t2]]
+
+
+def test_preprocess_batch_reset_after_error(document, comm):
+    from panel.layout.base import _batch_changed, _update_batched
+
+    row = Row(TextInput())
+    model = row.get_root(document, comm)
+
+    def update():
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        _update_batched(model, [row[0]], update)
+
+    assert _batch_changed.get() is None
+
+
+def test_preprocess_nested_updates_batched(document, comm):
+    t1, t2 = TextInput(), TextInput()
+    inner = Row(t1)
+    row = Row(inner)
+    row.get_root(document, comm)
+
+    calls = []
+    def hook(root_view, root_model, changed=None):
+        calls.append(changed)
+
+    row._hooks.append(hook)
+    try:
+        row.objects = [inner, Row(t2)]
+    finally:
+        row._hooks.remove(hook)
+
+    assert len(calls) == 1
+    assert [type(obj) for obj in calls[0]] == [Row]
+
+
+def test_process_callbacks_full_pass_only_visits_root(document, comm):
+    t1, t2 = TextInput(), TextInput()
+    t1.jslink(t2, value='value')
+    other1, other2 = TextInput(), TextInput()
+    other1.jslink(other2, value='value')
+
+    class Registry(weakref.WeakKeyDictionary):
+        def values(self):
+            raise AssertionError('Full registry scanned')
+
+    registry = Callback.registry
+    Callback.registry = Registry(registry)
+    try:
+        model = Row(t1, t2).get_root(document, comm)
+    finally:
+        Callback.registry = registry
+
+    tm1 = model.children[0]
+    link_customjs = tm1.js_property_callbacks['change:value'][-1]
+    assert link_customjs.args['target'] is model.children[1]
+
+def test_widget_jslink_target_added_after_render(document, comm):
+    t1, t2 = TextInput(), TextInput()
+
+    link = t1.jslink(t2, value='value')
+    assert Link._links_for(t2) == [link]
+
+    row = Row(t1)
+    model = row.get_root(document, comm)
+    tm1 = model.children[0]
+    assert 'change:value' not in tm1.js_property_callbacks
+
+    row.append(t2)
+    tm2 = model.children[1]
+
+    link_customjs = tm1.js_property_callbacks['change:value'][-1]
+    assert link_customjs.args['source'] is tm1
+    assert link_customjs.args['target'] is tm2
+
+    link.unlink()
+    assert Link._links_for(t1) == []
+    assert Link._links_for(t2) == []
+
+
 def test_widget_link_source_param_not_found():
     t1 = TextInput()
     t2 = TextInput()
@@ -276,3 +276,48 @@ def test_reactive_html_children():
     test.children = [widget_new]
     assert len(widget._models) == 0
     assert root.children == {'div': [widget_new._models[root.ref['id']][0]]}
+
+
+def test_threaded_change_events_processed_in_order():
+    import asyncio
+    import threading
+
+    from bokeh.document import Document
+    from panel.config import config
+
+    text_input = TextInput()
+    doc = Document()
+    text_input.get_root(doc)
+    release = threading.Event()
+    applied, running = [], []
+
+    def block(event):
+        running.append(event.new)
+        assert len(running) == 1
+        applied.append(event.new)
+        if event.new == 'A':
+            release.wait(5)
+        running.remove(event.new)
+
+    text_input.param.watch(block, 'value')
+
+    async def run():
+        text_input._events = {'value': 'A'}
+        text_input._change_coroutine(doc)
+        await asyncio.sleep(0.05)
+        text_input._events = {'value': 'B'}
+        text_input._change_coroutine(doc)
+        await asyncio.sleep(0.05)
+        # Second batch waits for the first one to complete
+        assert applied == ['A']
+        assert text_input._events == {'value': 'B'}
+        release.set()
+        start = asyncio.get_running_loop().time()
+        while text_input.value != 'B' and (asyncio.get_running_loop().time()-start) < 5:
+            await asyncio.sleep(0.05)
+
+    with config.set(nthreads=2):
+        asyncio.run(run())
+
+    assert applied == ['A', 'B']
+    assert text_input._events == {}
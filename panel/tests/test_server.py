@@ -1,7 +1,10 @@
 import os
 import pathlib
+import threading
 import time
 
+from functools import partial
+
 import param
 import pytest
 import requests
@@ -33,6 +36,24 @@ def test_server_update(html_server_session):
     assert root.text == '&lt;h1&gt;New Title&lt;/h1&gt;'
 
 
+def test_server_update_batched(html_server_session):
+    html, server, session = html_server_session
+
+    ref = list(html._models)[0]
+    doc = state._views[ref][2]
+
+    html.object = '<h1>New Title</h1>'
+    html.width = 300
+
+    assert len(state._pending_updates[doc]) == 2
+
+    session.pull()
+    root = session.document.roots[0]
+    assert doc not in state._pending_updates
+    assert root.text == '&lt;h1&gt;New Title&lt;/h1&gt;'
+    assert root.width == 300
+
+
 def test_server_change_io_state(html_server_session):
     html, server, session = html_server_session
 
@@ -97,6 +118,50 @@ def test_server_async_callbacks():
         server.stop()
 
 
+def test_server_thread_pool_callbacks():
+    button = Button(name='Click')
+
+    calls = []
+
+    def cb(event):
+        calls.append((threading.current_thread().name, state.curdoc))
+        button.name = 'Clicked'
+
+    button.on_click(cb)
+
+    with config.set(nthreads=2):
+        server = serve(button, port=5011, threaded=True, show=False)
+
+        # Wait for server to start
+        time.sleep(1)
+
+        requests.get("http://localhost:5011/")
+
+        model, _ = list(button._models.values())[0]
+        doc = model.document
+        ref = list(button._models)[0]
+        try:
+            # Schedule from the server thread since Bokeh replaces its
+            # global curdoc while adding the callback
+            server.io_loop.add_callback(
+                doc.add_next_tick_callback, partial(button._server_click, doc, ref, None)
+            )
+
+            # Wait for callback to be processed
+            start = time.time()
+            while model.label != 'Clicked' and (time.time()-start) < 5:
+                time.sleep(0.1)
+
+            assert len(calls) == 1
+            thread_name, curdoc = calls[0]
+            assert thread_name.startswith('panel-callback')
+            assert curdoc is doc
+            assert state._curdoc.get() is None
+            assert model.label == 'Clicked'
+        finally:
+            server.stop()
+
+
 def test_server_session_info():
     with config.set(session_history=-1):
         html = Markdown('# Title')
@@ -129,6 +194,298 @@ def test_server_session_info():
     assert state.session_info['live'] == 0
 
 
+def test_server_session_pool():
+    docs = []
+
+    def app():
+        docs.append(state.curdoc)
+        return Markdown('# Title')
+
+    with config.set(session_pool=1, session_history=-1):
+        server = serve(app, port=5012, threaded=True, show=False)
+
+        # Wait for server to start and fill the pool
+        time.sleep(1)
+
+        try:
+            assert len(docs) == 1
+            pooled = docs[0]
+
+            requests.get("http://localhost:5012/")
+
+            session_context = pooled.session_context
+            sessions = state.session_info['sessions']
+            assert session_context.id in sessions
+            assert sessions[session_context.id]['user_agent'].startswith('python-requests')
+
+            # Wait for the pool to be replenished
+            start = time.time()
+            while len(docs) < 2 and (time.time()-start) < 5:
+                time.sleep(0.1)
+            assert len(docs) == 2
+
+            requests.get("http://localhost:5012/?arg=1")
+            time.sleep(0.5)
+            assert len(docs) == 3
+            assert docs[2].session_context.request.arguments == {'arg': [b'1']}
+        finally:
+            server.stop()
+            server.join(5)
+
+    # Pooled documents are cleaned up when the server stops
+    pooled = docs[1]
+    assert pooled.session_destroyed_callbacks == set()
+    assert not any(view[2] is pooled for view in state._views.values())
+
+
+def test_server_session_pool_request_dependent():
+    docs = []
+
+    def app():
+        docs.append(state.curdoc)
+        return Markdown(state.headers.get('User-Agent', ''))
+
+    with config.set(session_pool=1):
+        server = serve(app, port=5016, threaded=True, show=False)
+
+        # Wait for server to start and attempt to fill the pool
+        time.sleep(1)
+
+        try:
+            assert len(docs) == 1
+            requests.get("http://localhost:5016/")
+            time.sleep(0.5)
+            assert len(docs) == 2
+            assert docs[1].session_context.request.headers['User-Agent'].startswith('python-requests')
+        finally:
+            server.stop()
+
+    # The pre-rendered document was discarded
+    assert not any(view[2] is docs[0] for view in state._views.values())
+
+
+def test_server_session_pool_session_hooks():
+    docs = []
+
+    def app():
+        docs.append(state.curdoc)
+        return Markdown('# Title')
+
+    def hook(session_context):
+        pass
+
+    state.on_session_created(hook)
+    try:
+        with config.set(session_pool=1):
+            server = serve(app, port=5017, threaded=True, show=False)
+            time.sleep(1)
+            try:
+                assert docs == []
+                requests.get("http://localhost:5017/")
+                assert len(docs) == 1
+            finally:
+                server.stop()
+    finally:
+        state._on_session_created.remove(hook)
+
+
+def test_server_metrics():
+    from panel.io.metrics import metrics
+
+    button = Button(name='Click')
+    button.on_click(lambda event: setattr(button, 'name', 'Clicked'))
+
+    server = serve(button, port=5013, threaded=True, show=False, metrics=True)
+
+    # Wait for server to start
+    time.sleep(1)
+
+    try:
+        requests.get("http://localhost:5013/")
+
+        model, _ = list(button._models.values())[0]
+        doc = model.document
+        ref = list(button._models)[0]
+        server.io_loop.add_callback(
+            doc.add_next_tick_callback, partial(button._server_click, doc, ref, None)
+        )
+
+        # Wait for callback to be processed
+        start = time.time()
+        while model.label != 'Clicked' and (time.time()-start) < 5:
+            time.sleep(0.1)
+
+        response = requests.get("http://localhost:5013/rest/metrics")
+        assert response.headers['Content-Type'].startswith('text/plain')
+        text = response.text
+        assert 'panel_callback_duration_seconds_count{component="Button"} 1.0' in text
+        assert 'panel_render_duration_seconds_count{component="Button"} 1.0' in text
+        assert 'panel_patch_doc_messages_total' in text
+        assert 'panel_event_loop_lag_seconds' in text
+        assert server.io_loop in metrics._lag_probes
+    finally:
+        server.stop()
+        server.join(5)
+        for metric in metrics._metrics:
+            metric.clear()
+
+    # The loop probe is stopped and collection disabled with the server
+    assert server.io_loop not in metrics._lag_probes
+    assert not metrics.enabled
+
+
+def test_server_static_extensions_precompressed():
+    from panel.io.resources import DIST_DIR, assets
+
+    html = Markdown('# Title')
+    server = serve(html, port=5014, threaded=True, show=False)
+
+    # Wait for server to start
+    time.sleep(1)
+
+    url = "http://localhost:5014/static/extensions/panel/css/widgets.css"
+    with open(DIST_DIR / 'css' / 'widgets.css', encoding='utf-8') as f:
+        css = f.read()
+    try:
+        response = requests.get(url, headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert 'Cache-Control' not in response.headers
+        assert response.text == css
+
+        response = requests.get(url, headers={'Accept-Encoding': 'identity'})
+        assert 'Content-Encoding' not in response.headers
+        assert response.text == css
+
+        version = assets.get(DIST_DIR / 'css' / 'widgets.css').hash
+        response = requests.get(f'{url}?v={version}')
+        assert 'immutable' in response.headers['Cache-Control']
+
+        etag = response.headers['Etag']
+        response = requests.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+    finally:
+        server.stop()
+
+
+class RestParameterized(param.Parameterized):
+
+    a = param.Integer(default=1)
+
+    b = param.Integer(default=2)
+
+    @param.depends('a', watch=True)
+    def _update_b(self):
+        self._threads.append(threading.current_thread())
+        self.b = self.a * 2
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._threads = []
+
+
+@pytest.fixture
+def rest_server():
+    from panel.io.rest import ParamHandler, param_rest_provider
+
+    obj = RestParameterized()
+    state.publish('values', obj, ['a', 'b'])
+    server = serve(
+        Markdown('# Title'), port=5015, threaded=True, show=False,
+        extra_patterns=param_rest_provider([], 'rest')
+    )
+
+    # Wait for server to start
+    start = time.time()
+    while (time.time()-start) < 5:
+        try:
+            requests.get("http://localhost:5015/")
+            break
+        except requests.ConnectionError:
+            time.sleep(0.1)
+
+    try:
+        yield obj, "http://localhost:5015/rest/values"
+    finally:
+        server.stop()
+        server.join(5)
+        state._rest_endpoints.pop('values', None)
+        ParamHandler._caches.clear()
+
+
+def test_server_rest_get(rest_server):
+    obj, url = rest_server
+
+    response = requests.get(url, params={'a': '3'})
+    assert response.json() == {'a': 3, 'b': 6}
+    assert obj.b == 6
+
+    etag = response.headers['Etag']
+    response = requests.get(url, params={'a': '3'}, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+    response = requests.get(url, params={'a': '4'}, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json() == {'a': 4, 'b': 8}
+
+    response = requests.get(url, params={'c': '4'})
+    assert response.status_code == 400
+
+    # Parameters are set on the event loop rather than the executor
+    assert obj._threads
+    assert not any(t.name.startswith('panel-rest') for t in obj._threads)
+    assert threading.main_thread() not in obj._threads
+
+
+def test_server_rest_post_batch(rest_server):
+    obj, url = rest_server
+
+    response = requests.post(url, json={'a': 2})
+    assert response.json() == {'a': 2, 'b': 4}
+
+    response = requests.post(url, json=[{'a': 3}, {'a': 5}, {'b': 1}])
+    assert response.json() == [{'a': 3, 'b': 6}, {'a': 5, 'b': 10}, {'a': 5, 'b': 1}]
+    assert obj.a == 5 and obj.b == 1
+
+    response = requests.post(url, json=[{'a': 'foo'}])
+    assert response.status_code == 400
+
+
+def test_server_rest_post_stream(rest_server):
+    import json
+
+    _, url = rest_server
+
+    response = requests.post(
+        url, json=[{'a': 1}, {'a': 2.5}, {'c': 1}, 'a', {'a': 3}],
+        headers={'Accept': 'application/x-ndjson'}
+    )
+    assert response.headers['Content-Type'] == 'application/x-ndjson'
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0] == {'a': 1, 'b': 2}
+    assert [line['error']['code'] for line in lines[1:4]] == [400, 400, 400]
+    assert lines[4] == {'a': 3, 'b': 6}
+
+
+def test_server_rest_replaced_endpoint_unwatched(rest_server):
+    from panel.io.rest import ParamHandler
+
+    obj, url = rest_server
+    requests.get(url)
+    cache = ParamHandler._caches['values']
+
+    new_obj = RestParameterized()
+    state._rest_endpoints.pop('values')
+    state.publish('values', new_obj, ['a', 'b'])
+    response = requests.get(url, params={'a': '2'})
+    assert response.json() == {'a': 2, 'b': 4}
+    assert ParamHandler._caches['values'] is not cache
+
+    version = cache._version
+    obj.a = 10
+    assert cache._version == version
+
+
 def test_show_server_info(html_server_session, markdown_server_session):
     server_info = repr(state)
     assert "localhost:5006 - HTML" in server_info
@@ -164,4 +521,134 @@ def test_serve_can_serve_panel_app_from_file():
 def test_serve_can_serve_bokeh_app_from_file():
     path = pathlib.Path(__file__).parent / "io"/"bk_app.py"
     server = get_server({"bk-app": path})
-    assert "/bk-app" in server._tornado.applications
\ No newline at end of file
+    assert "/bk-app" in server._tornado.applications
+
+def test_server_shared_stream_serialized_once():
+    import json
+    import pandas as pd
+    from bokeh.document import Document
+    from bokeh.protocol import Protocol
+    from panel.io.server import (
+        _SharedData, _SharedPatchDocMessage, _patch_message, send_patch_document
+    )
+    from panel.widgets import Tabulator
+
+    table = Tabulator(pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}))
+    docs = [Document(), Document()]
+    events = []
+    for doc in docs:
+        model = table.get_root(doc)
+        doc.add_root(model)
+        doc.on_change(events.append)
+
+    table.stream(pd.DataFrame({'a': [3], 'b': ['z']}))
+    table.patch({'a': [(0, 4)]})
+
+    assert len(events) == 4
+    streams, patches = events[:2], events[2:]
+    assert isinstance(streams[0].hint.data, _SharedData)
+    assert streams[0].hint.data is streams[1].hint.data
+    assert patches[0].hint.patches is patches[1].hint.patches
+
+    class MockSocket:
+        def send_message(self, msg):
+            return msg
+
+    class MockConnection:
+        _socket = MockSocket()
+        protocol = Protocol()
+
+    protocol = Protocol()
+    for event in events:
+        msg = send_patch_document(MockConnection(), event)
+        expected = protocol.create('PATCH-DOC', [event])
+        assert json.loads(msg.content_json) == json.loads(expected.content_json)
+        # The unlocked write path creates the same message
+        unlocked_msg = _patch_message(protocol, [event])
+        assert isinstance(unlocked_msg, _SharedPatchDocMessage)
+        assert unlocked_msg.content_json == msg.content_json
+
+
+def test_server_shared_stream_in_batch_serialized_once():
+    import json
+    import pandas as pd
+    from bokeh.document import Document
+    from bokeh.document.events import ModelChangedEvent
+    from bokeh.protocol import Protocol
+    from panel.io.server import _SharedPatchDocMessage, _patch_message
+    from panel.widgets import Tabulator
+
+    table = Tabulator(pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}))
+    events = []
+    for doc in (Document(), Document()):
+        model = table.get_root(doc)
+        doc.add_root(model)
+        doc.on_change(events.append)
+
+    # The stream payload is shared between the models of both documents
+    table.stream(pd.DataFrame({'a': [3], 'b': ['z']}))
+    stream = events[-1]
+    changed = ModelChangedEvent(doc, model, 'page_size', 20, 10, 10)
+
+    protocol = Protocol()
+    batch = [changed, stream]
+    msg = _patch_message(protocol, batch)
+    expected = protocol.create('PATCH-DOC', batch)
+
+    assert isinstance(msg, _SharedPatchDocMessage)
+    assert stream.hint.data.json in msg.content_json
+    assert json.loads(msg.content_json) == json.loads(expected.content_json)
+    assert len(msg.buffers) == len(expected.buffers)
+
+
+def test_server_stop_clears_periodic_feeds():
+    values = []
+
+    def app():
+        feed = state.add_periodic_feed('server-feed', lambda: 1, period=50)
+        feed.subscribe(values.append)
+        return Markdown('# Title')
+
+    server = serve(app, port=5018, threaded=True, show=False)
+
+    # Wait for server to start
+    time.sleep(1)
+
+    try:
+        requests.get("http://localhost:5018/")
+        feed = state._feeds['server-feed']
+        assert feed.running
+    finally:
+        server.stop()
+        server.join(5)
+
+    assert 'server-feed' not in state._feeds
+    assert not feed.running
+    assert feed._handle is None
+    assert feed._subscribers == []
+
+
+def test_kill_all_servers_clears_periodic_feeds():
+    feed = state.add_periodic_feed('killed-feed', lambda: 1, period=100)
+    state.kill_all_servers()
+    assert 'killed-feed' not in state._feeds
+    assert not feed.running
+
+
+def test_server_autoreload_watcher_stopped():
+    from panel.io.reload import _watchers
+
+    with config.set(autoreload=True):
+        server = serve(Markdown('# Title'), port=5019, threaded=True, show=False)
+
+        # Wait for server to start
+        time.sleep(1)
+
+        try:
+            watcher = _watchers[server.io_loop]
+        finally:
+            server.stop()
+            server.join(5)
+
+    assert server.io_loop not in _watchers
+    assert watcher._stopped.is_set()
@@ -1,10 +1,12 @@
+import gc
+
 import param
 import pytest
 
 from panel import config
 from panel.interact import interactive
 from panel.pane import Str
-from panel.viewable import Viewable
+from panel.viewable import Viewable, _accepts_changed, _hook_signatures
 
 from .util import jb_available, py3_only
 
@@ -27,3 +29,23 @@ def test_viewable_signature(viewable):
     parameters = signature(viewable).parameters
     assert 'params' in parameters
     assert parameters['params'] == Parameter('params', Parameter.VAR_KEYWORD)
+
+
+def test_accepts_changed_does_not_keep_hooks_alive():
+    def hook(viewable, root, changed=None):
+        pass
+
+    assert _accepts_changed(hook)
+    assert hook in _hook_signatures
+    del hook
+    gc.collect()
+    assert not any(h.__name__ == 'hook' for h in _hook_signatures.keys())
+
+
+def test_accepts_changed_hook_without_weakref():
+    class Hook:
+        __slots__ = ()
+        def __call__(self, viewable, root):
+            pass
+
+    assert not _accepts_changed(Hook())
@@ -1,9 +1,12 @@
 import param
 import pytest
 
+from bokeh.document import Document
+
 from panel.io import block_comm
 from panel.widgets import (
-    CompositeWidget, Dial, FileDownload, FloatSlider, TextInput, ToggleGroup, Widget
+    Button, CompositeWidget, Dial, FileDownload, FloatSlider, TextInput,
+    ToggleGroup, Widget
 )
 from panel.widgets.tables import BaseTable
 from panel.tests.util import check_layoutable_properties, py3_only
@@ -149,3 +152,136 @@ def test_widget_from_param_instance_with_kwargs():
 
     widget.value = 4.3
     assert test.a == 4.3
+
+
+class _MockServerDocument(Document):
+
+    session_context = True
+
+    def __init__(self):
+        super().__init__()
+        self.callbacks = []
+
+    def add_timeout_callback(self, callback, timeout):
+        self.callbacks.append((callback, timeout))
+
+    def add_next_tick_callback(self, callback):
+        self.callbacks.append((callback, 0))
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback, _ in callbacks:
+            callback()
+
+
+def test_widget_debounce_invalid_policy():
+    with pytest.raises(ValueError):
+        TextInput(debounce={'foo': 100})
+    with pytest.raises(ValueError):
+        TextInput(debounce={'value': {'wait': 100}})
+    text = TextInput(debounce=100)
+    with pytest.raises(ValueError):
+        text.debounce = {'value': -1}
+    assert text.debounce == 100
+
+
+@pytest.mark.parametrize('debounce', [
+    True, {'value': False}, {'value': {'delay': True}},
+    {'value': {'delay': 100, 'leading': 1}},
+    {'value': {'delay': 100, 'trailing': 'yes'}},
+    {'value': {'delay': 100, 'max_wait': -1}},
+    {'value': {'delay': 100, 'max_wait': '100'}},
+    {'value': {'delay': 100, 'max_wait': True}},
+])
+def test_widget_debounce_invalid_policy_values(debounce):
+    with pytest.raises(ValueError):
+        TextInput(debounce=debounce)
+
+
+def test_widget_debounce_valid_policy_values():
+    TextInput(debounce={'value': {
+        'delay': 100, 'leading': True, 'trailing': False, 'max_wait': 150.5
+    }})
+    TextInput(debounce={'value': {'delay': 100, 'max_wait': None}})
+
+
+def test_widget_debounce_not_synced(document, comm):
+    text = TextInput(debounce=100)
+    model = text.get_root(document, comm)
+
+    assert 'debounce' not in model.properties_with_values()
+    text.debounce = {'value': 200}
+
+
+def test_widget_debounce_trailing(monkeypatch):
+    now = [0]
+    monkeypatch.setattr('panel.reactive.time.monotonic', lambda: now[0])
+    doc = _MockServerDocument()
+    text = TextInput(debounce={'value': 100})
+
+    for i, value in enumerate('abc'):
+        now[0] = i * 0.05
+        text._server_change(doc, 'ref', 'value', None, value)
+    assert text.value == ''
+    assert doc.callbacks[0][1] == 100
+
+    doc.run()
+    assert text.value == ''
+    assert doc.callbacks[0][1] == 100
+
+    now[0] = 0.2
+    doc.run()
+    doc.run()
+    assert text.value == 'c'
+    assert text._debounced == {}
+
+
+def test_widget_debounce_leading_max_wait(monkeypatch):
+    now = [0]
+    monkeypatch.setattr('panel.reactive.time.monotonic', lambda: now[0])
+    doc = _MockServerDocument()
+    slider = FloatSlider(debounce={'value': {'delay': 100, 'leading': True, 'max_wait': 100}})
+
+    slider._server_change(doc, 'ref', 'value', None, 0.1)
+    doc.callbacks.sort(key=lambda cb: cb[1])
+    doc.run()
+    assert slider.value == 0.1
+
+    now[0] = 0.05
+    slider._server_change(doc, 'ref', 'value', None, 0.2)
+    now[0] = 0.1
+    slider._server_change(doc, 'ref', 'value', None, 0.3)
+    doc.run()
+    doc.run()
+    assert slider.value == 0.3
+    assert slider._debounced == {}
+
+
+def test_widget_debounce_other_property_unaffected():
+    doc = _MockServerDocument()
+    text = TextInput(debounce={'placeholder': 100})
+
+    text._server_change(doc, 'ref', 'value', None, 'a')
+    assert doc.callbacks[0][1] == text._debounce
+    doc.run()
+    assert text.value == 'a'
+
+
+def test_button_click_debounce(monkeypatch):
+    now = [0]
+    monkeypatch.setattr('panel.reactive.time.monotonic', lambda: now[0])
+    doc = _MockServerDocument()
+    button = Button(debounce={'clicks': 100})
+    events = []
+    button.param.watch(events.append, 'value')
+
+    button._server_click(doc, 'ref', None)
+    button._server_click(doc, 'ref', None)
+    assert button.clicks == 0
+    assert events == []
+
+    now[0] = 0.1
+    doc.run()
+    doc.run()
+    assert button.clicks == 1
+    assert len(events) == 1
@@ -359,6 +359,27 @@ def test_tabulator_pagination(document, comm):
         np.testing.assert_array_equal(values, expected[col])
 
 
+def test_tabulator_pagination_page_change_reuses_processed(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df, pagination='remote', page_size=2)
+    table.add_filter((1, 4), 'A')
+
+    model = table.get_root(document, comm)
+
+    processed = table._processed
+    table.page = 2
+
+    assert table._processed is processed
+    np.testing.assert_array_equal(model.source.data['A'], np.array([3, 4]))
+
+    table.stream(pd.DataFrame({'A': [3.5], 'B': [0.], 'C': ['foo6'],
+                               'D': [dt.datetime(2009, 1, 8)]}), follow=False)
+    table.page = 1
+
+    assert table._processed is not processed
+    assert len(table._processed) == 5
+
+
 def test_tabulator_pagination_selection(document, comm):
     df = makeMixedDataFrame()
     table = Tabulator(df, pagination='remote', page_size=2)
@@ -556,6 +577,56 @@ def test_tabulator_patch_ranges(document, comm):
         np.testing.assert_array_equal(values, expected[col])
 
 
+def test_tabulator_patch_dataframe(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df)
+
+    model = table.get_root(document, comm)
+
+    table.patch(pd.DataFrame({'A': [5., 6.], 'C': ['foo6', 'foo7']}, index=[1, 2]))
+    table.patch(pd.DataFrame({'A': [7., 8.]}, index=[0, 4]))
+
+    np.testing.assert_array_equal(table.value.A.values, np.array([7, 5, 6, 3, 8]))
+    np.testing.assert_array_equal(model.source.data['A'], np.array([7, 5, 6, 3, 8]))
+    np.testing.assert_array_equal(
+        model.source.data['C'], np.array(['foo1', 'foo6', 'foo7', 'foo4', 'foo5'])
+    )
+
+
+def test_tabulator_patch_dataframe_non_unique_index(document, comm):
+    df = pd.DataFrame({'A': [1., 2., 3.]}, index=[0, 0, 2])
+    table = Tabulator(df)
+
+    model = table.get_root(document, comm)
+
+    table.patch(pd.DataFrame({'A': [5., 6.]}, index=[2, 0]))
+
+    np.testing.assert_array_equal(table.value.A.values, np.array([6, 6, 5]))
+    np.testing.assert_array_equal(model.source.data['A'], np.array([6, 6, 5]))
+
+    with pytest.raises(ValueError):
+        table.patch(pd.DataFrame({'A': [5.]}, index=[1]))
+
+
+def test_tabulator_patch_dataframe_missing_index(document, comm):
+    table = Tabulator(makeMixedDataFrame())
+
+    with pytest.raises(ValueError):
+        table.patch(pd.DataFrame({'A': [5.]}, index=[10]))
+
+
+def test_tabulator_patch_dataframe_paginated(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df, pagination='remote', page_size=2, page=2)
+
+    model = table.get_root(document, comm)
+
+    table.patch(pd.DataFrame({'A': [5., 6., 7.]}, index=[1, 2, 3]))
+
+    np.testing.assert_array_equal(table.value.A.values, np.array([0, 5, 6, 7, 4]))
+    np.testing.assert_array_equal(model.source.data['A'], np.array([6, 7]))
+
+
 def test_tabulator_stream_series_paginated_not_follow(document, comm):
     df = makeMixedDataFrame()
     table = Tabulator(df, pagination='remote', page_size=2)
@@ -675,6 +746,25 @@ def test_tabulator_stream_dataframe(document, comm):
         np.testing.assert_array_equal(values, expected[col])
 
 
+
+def test_tabulator_stream_dataframe_buffered(document, comm):
+    table = Tabulator(pd.DataFrame({'A': [0, 1], 'C': ['foo0', 'foo1']}))
+
+    model = table.get_root(document, comm)
+
+    previous = []
+    for i in range(2, 40):
+        previous.append(table.value)
+        table.stream(pd.DataFrame({'A': [i], 'C': ['foo%d' % i]}))
+
+    assert list(table._frame_buffers) == ['index', 0, 1]
+    assert len(table.value) == 40
+    np.testing.assert_array_equal(table.value.index, np.arange(40))
+    np.testing.assert_array_equal(model.source.data['A'], np.arange(40))
+    for i, value in enumerate(previous):
+        np.testing.assert_array_equal(value['A'], np.arange(i+2))
+        assert list(value['C']) == ['foo%d' % j for j in range(i+2)]
+
 def test_tabulator_constant_scalar_filter(document, comm):
     df = makeMixedDataFrame()
     table = Tabulator(df)
@@ -809,6 +899,66 @@ def test_tabulator_constant_tuple_filter(document, comm):
         np.testing.assert_array_equal(values, expected[col])
 
 
+def test_tabulator_filter_masks_cached(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df)
+
+    model = table.get_root(document, comm)
+
+    c_widget = TextInput(value='foo3')
+    table.add_filter((1, 4), 'A')
+    table.add_filter(c_widget, 'C')
+
+    a_mask = table._filter_cache[(0, 'A')][2]
+
+    c_widget.value = 'foo2'
+
+    assert table._filter_cache[(0, 'A')][2] is a_mask
+    np.testing.assert_array_equal(model.source.data['index'], np.array([1]))
+
+    table.value = df.copy()
+
+    assert table._filter_cache[(0, 'A')][2] is not a_mask
+    np.testing.assert_array_equal(model.source.data['index'], np.array([1]))
+
+
+def test_tabulator_paginated_sort_order_cached(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df, pagination='remote', page_size=2)
+    table.add_filter([0.0], 'B')
+
+    model = table.get_root(document, comm)
+
+    table.sorters = [{'field': 'A', 'dir': 'desc'}]
+
+    assert list(table._sort_cache) == [(('A', 'desc'),)]
+    np.testing.assert_array_equal(model.source.data['index'], np.array([4, 2]))
+
+    table.sorters = [{'field': 'A', 'dir': 'asc'}]
+    table.sorters = [{'field': 'A', 'dir': 'desc'}]
+
+    assert len(table._sort_cache) == 2
+    np.testing.assert_array_equal(model.source.data['index'], np.array([4, 2]))
+
+    table.page = 2
+    np.testing.assert_array_equal(model.source.data['index'], np.array([0]))
+
+
+
+def test_tabulator_sort_order_cache_bounded(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df, pagination='remote', page_size=2)
+    table._sort_cache_size = 2
+
+    table.get_root(document, comm)
+
+    table.sorters = [{'field': 'A', 'dir': 'desc'}]
+    table.sorters = [{'field': 'B', 'dir': 'desc'}]
+    table.sorters = [{'field': 'A', 'dir': 'desc'}]
+    table.sorters = [{'field': 'C', 'dir': 'desc'}]
+
+    assert list(table._sort_cache) == [(('A', 'desc'),), (('C', 'desc'),)]
+
 def test_tabulator_stream_dataframe_with_filter(document, comm):
     df = makeMixedDataFrame()
     table = Tabulator(df)
@@ -1,5 +1,8 @@
 import random
 
+import numpy as np
+import pandas as pd
+
 from panel import Column, Param, Row, WidgetBox, state
 from panel.pane import HTML
 from panel.widgets import Trend, IntSlider
@@ -35,6 +38,49 @@ def test_trend_auto_value_stream():
     assert model.source.data['x'][-1] == 6
 
 
+def test_trend_stream_rollover_buffer():
+    data = {"x": [1, 2, 3], "y": [3800, 3700, 3800]}
+
+    trend = Trend(data=data)
+
+    trend.get_root()
+
+    for i in range(4, 50):
+        trend.stream({'x': [i], 'y': [i*1.5]}, rollover=5)
+        assert list(trend.data['x']) == list(range(max(1, i-4), i+1))
+
+    buffer = trend._buffers['x'].buffer
+    trend.stream({'x': [50], 'y': [75.]}, rollover=5)
+
+    assert trend._buffers['x'].buffer is buffer
+    assert trend.data['y'].dtype.kind == 'f'
+    assert list(trend.data['y']) == [69., 70.5, 72., 73.5, 75.]
+
+
+
+def test_trend_stream_rollover_preserves_previous_data():
+    trend = Trend(data={"x": np.array([1, 2, 3]), "y": np.array([1, 2, 3])})
+
+    trend.get_root()
+
+    previous = []
+    for i in range(4, 50):
+        previous.append((i, trend.data['x']))
+        trend.stream({'x': [i], 'y': [i]}, rollover=5)
+
+    for i, data in previous:
+        assert list(data) == list(range(max(1, i-5), i))
+
+def test_trend_stream_replaced_data():
+    trend = Trend(data={"x": [1, 2], "y": [1, 2]})
+
+    trend.stream({'x': [3], 'y': [3]})
+    trend.data = {"x": [10], "y": [10]}
+    trend.stream({'x': [11], 'y': [11]})
+
+    assert list(trend.data['x']) == [10, 11]
+
+
 def test_app():
     data = {"x": [1, 2, 3, 4, 5], "y": [3800, 3700, 3800, 3900, 4000]}
 
@@ -94,3 +140,16 @@ def test_app():
 
 if __name__.startswith("bokeh"):
     test_app().servable()
+
+
+def test_trend_patch_dict_data_with_dataframe():
+    data = {"x": [1, 2, 3], "y": [3800, 3700, 3800]}
+
+    trend = Trend(data=data)
+
+    model = trend.get_root()
+
+    trend.patch(pd.DataFrame({'y': [4000]}, index=[2]))
+
+    assert trend.data['y'] == [3800, 3700, 4000]
+    assert list(model.source.data['y']) == [3800, 3700, 4000]
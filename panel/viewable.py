@@ -9,12 +9,14 @@ and become viewable including:
   notebook, on the server or in static exports
 """
 import datetime as dt
+import inspect
 import logging
 import sys
 import traceback
 import uuid
 
 from functools import partial
+from weakref import WeakKeyDictionary
 
 import param
 
@@ -25,6 +27,7 @@ from pyviz_comms import JupyterCommManager
 from .config import config, panel_extension
 from .io.embed import embed_state
 from .io.loading import start_loading_spinner, stop_loading_spinner
+from .io.metrics import metrics
 from .io.model import add_to_doc, patch_cds_msg
 from .io.notebook import (
     ipywidget, render_mimebundle, render_model, show_embed, show_server
@@ -35,6 +38,30 @@ from .io.server import init_doc, serve
 from .util import escape, param_reprs
 
 
+# Weakly keyed so that cached hooks can still be garbage collected
+_hook_signatures = WeakKeyDictionary()
+
+def _accepts_changed(hook):
+    """
+    Whether a preprocessing hook supports processing only the changed
+    subtrees of a view.
+    """
+    key = getattr(hook, '__func__', hook)
+    try:
+        return _hook_signatures[key]
+    except KeyError:
+        pass
+    except TypeError:
+        key = None
+    try:
+        accepts = 'changed' in inspect.signature(hook).parameters
+    except (TypeError, ValueError):
+        accepts = False
+    if key is not None:
+        _hook_signatures[key] = accepts
+    return accepts
+
+
 class Layoutable(param.Parameterized):
     """
     Layoutable defines shared style and layout related parameters
@@ -411,13 +438,26 @@ class Renderable(param.Parameterized):
         if ref in state._handles:
             del state._handles[ref]
 
-    def _preprocess(self, root):
+    def _preprocess(self, root, changed=None):
         """
         Applies preprocessing hooks to the model.
+
+        Arguments
+        ---------
+        root: bokeh.model.Model
+          Bokeh model for the view being preprocessed
+        changed: list(Viewable) or None
+          Viewables whose models were added or replaced since the
+          last time the view was preprocessed. Hooks which accept a
+          changed argument only have to process these subtrees, while
+          None requests that the whole tree is processed.
         """
         hooks = self._preprocessing_hooks+self._hooks
         for hook in hooks:
-            hook(self, root)
+            if changed is not None and _accepts_changed(hook):
+                hook(self, root, changed=changed)
+            else:
+                hook(self, root)
 
     def _render_model(self, doc=None, comm=None):
         if doc is None:
@@ -451,6 +491,7 @@ class Renderable(param.Parameterized):
             if session['rendered'] is not None:
                 state.session_info['live'] -= 1
             session['ended'] = dt.datetime.now().timestamp()
+            state._publish_session_info()
         doc = session_context._document
         root = self._documents[doc]
         ref = root.ref['id']
@@ -666,7 +707,8 @@ class Viewable(Renderable, Layoutable, ServableMixin):
         return show_server(self, notebook_url, port)
 
     def embed(self, max_states=1000, max_opts=3, json=False, json_prefix='',
-              save_path='./', load_path=None, progress=False, states={}):
+              save_path='./', load_path=None, progress=False, states={},
+              processes=1):
         """
         Renders a static version of a panel in a notebook by evaluating
         the set of states defined by the widgets in the model. Note
@@ -691,16 +733,21 @@ class Viewable(Renderable, Layoutable, ServableMixin):
           Whether to report progress
         states: dict (default={})
           A dictionary specifying the widget values to embed for each widget
+        processes: int (default=1)
+          The number of processes to explore the states with, falls
+          back to a single process if other non-daemon threads are
+          running since forking them may deadlock the workers
         """
         show_embed(
             self, max_states, max_opts, json, json_prefix, save_path,
-            load_path, progress, states
+            load_path, progress, states, processes
         )
 
     def save(self, filename, title=None, resources=None, template=None,
              template_variables=None, embed=False, max_states=1000,
              max_opts=3, embed_json=False, json_prefix='', save_path='./',
-             load_path=None, progress=True, embed_states={}):
+             load_path=None, progress=True, embed_states={},
+             embed_processes=1, embed_packed=False, embed_compress=False):
         """
         Saves Panel objects to file.
 
@@ -734,11 +781,21 @@ class Viewable(Renderable, Layoutable, ServableMixin):
           Whether to report progress
         embed_states: dict (default={})
           A dictionary specifying the widget values to embed for each widget
+        embed_processes: int (default=1)
+          The number of processes to explore the embedded states with,
+          falls back to a single process if other non-daemon threads
+          are running since forking them may deadlock the workers
+        embed_packed: boolean (default=False)
+          Whether to export the data to a single packed file storing
+          identical states only once (requires embed_json=True)
+        embed_compress: boolean (default=False)
+          Whether to gzip compress the states in the packed file
         """
         return save(self, filename, title, resources, template,
                     template_variables, embed, max_states, max_opts,
                     embed_json, json_prefix, save_path, load_path,
-                    progress, embed_states)
+                    progress, embed_states, embed_processes, embed_packed,
+                    embed_compress)
 
     def server_doc(self, doc=None, title=None, location=True):
         """
@@ -763,7 +820,8 @@ class Viewable(Renderable, Layoutable, ServableMixin):
         doc = init_doc(doc)
         title = title or 'Panel Application'
         doc.title = title
-        model = self.get_root(doc)
+        with metrics.time_render(self):
+            model = self.get_root(doc)
         if hasattr(doc, 'on_session_destroyed'):
             doc.on_session_destroyed(self._server_destroy)
             self._documents[doc] = model
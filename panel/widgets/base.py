@@ -33,7 +33,19 @@ class Widget(Reactive):
         be specified as a two-tuple of the form (vertical, horizontal)
         or a four-tuple (top, right, bottom, left).""")
 
+    debounce = param.ClassSelector(default=None, class_=(int, dict), doc="""
+        Debounce policy applied on the server to changes originating
+        in the frontend. May be an integer delay in milliseconds
+        applied to all parameters or a dictionary mapping from
+        parameter name to a delay or a policy dictionary with 'delay',
+        'leading', 'trailing' and 'max_wait' keys. Setting 'max_wait'
+        to the same value as the 'delay' throttles events.""")
+
     _rename = {'name': 'title'}
+
+    _debounce_defaults = {
+        'delay': 0, 'leading': False, 'trailing': True, 'max_wait': None
+    }
     
     # Whether the widget supports embedding
     _supports_embed = False
@@ -53,6 +65,74 @@ class Widget(Reactive):
         else:
             self._param_pane = None
         super().__init__(**params)
+        self._validate_debounce()
+        self._callbacks.append(
+            self.param.watch(self._validate_debounce, 'debounce')
+        )
+
+    def _validate_debounce(self, *events):
+        try:
+            self._check_debounce(self.debounce)
+        except ValueError:
+            # Restore the previous, valid policy before raising
+            if events:
+                with param.discard_events(self):
+                    self.debounce = events[0].old
+            raise
+
+    def _check_debounce(self, debounce):
+        name = type(self).__name__
+        if isinstance(debounce, bool):
+            raise ValueError(
+                f'{name} debounce must be an integer delay or a '
+                f'dictionary, not a bool.'
+            )
+        elif debounce is None or isinstance(debounce, int):
+            policies = {} if debounce is None else {None: debounce}
+        else:
+            policies = debounce
+            unknown = [p for p in policies if p not in self.param]
+            if unknown:
+                raise ValueError(
+                    f'{name} debounce policy declared for '
+                    f'unknown parameter(s) {unknown}.'
+                )
+        for policy in policies.values():
+            if isinstance(policy, int) and not isinstance(policy, bool):
+                policy = {'delay': policy}
+            elif not isinstance(policy, dict):
+                raise ValueError(
+                    f'{name} debounce policy must be an '
+                    f'integer delay or a dictionary, not {type(policy).__name__}.'
+                )
+            unknown = [k for k in policy if k not in self._debounce_defaults]
+            if unknown:
+                raise ValueError(
+                    f'{name} debounce policy has unknown '
+                    f'key(s) {unknown}, valid keys are '
+                    f'{list(self._debounce_defaults)}.'
+                )
+            delay = policy.get('delay', 0)
+            if not isinstance(delay, int) or isinstance(delay, bool) or delay < 0:
+                raise ValueError(
+                    f'{name} debounce delay must be a '
+                    f'non-negative integer, not {delay!r}.'
+                )
+            for key in ('leading', 'trailing'):
+                if not isinstance(policy.get(key, False), bool):
+                    raise ValueError(
+                        f'{name} debounce {key!r} option must be a '
+                        f'bool, not {policy[key]!r}.'
+                    )
+            max_wait = policy.get('max_wait')
+            if max_wait is not None and (
+                not isinstance(max_wait, (int, float)) or
+                isinstance(max_wait, bool) or max_wait < 0
+            ):
+                raise ValueError(
+                    f'{name} debounce max_wait must be None or a '
+                    f'non-negative number, not {max_wait!r}.'
+                )
 
     @classmethod
     def from_param(cls, parameter, **params):
@@ -87,9 +167,27 @@ class Widget(Reactive):
         return model
 
     def _filter_properties(self, properties):
-        ignored = list(Layoutable.param)+['loading']
+        ignored = list(Layoutable.param)+['loading', 'debounce']
         return [p for p in properties if p not in ignored]
 
+    @property
+    def _synced_params(self):
+        return [p for p in super()._synced_params if p != 'debounce']
+
+    def _debounce_policy(self, attr):
+        if self.debounce is None:
+            return None
+        if isinstance(self.debounce, dict):
+            inverted = {v: k for k, v in self._rename.items()}
+            policy = self.debounce.get(inverted.get(attr, attr))
+            if policy is None:
+                return None
+        else:
+            policy = self.debounce
+        if isinstance(policy, int):
+            policy = {'delay': policy}
+        return dict(self._debounce_defaults, **policy)
+
     def _get_embed_state(self, root, values=None, max_opts=3):
         """
         Returns the bokeh model and a discrete set of value states
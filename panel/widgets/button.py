@@ -107,14 +107,12 @@ class Button(_ClickButton):
     jslink.__doc__ = Widget.jslink.__doc__
 
     def _server_click(self, doc, ref, event):
-        processing = bool(self._events)
-        self._events.update({"clicks": self.clicks+1})
-        self.param.trigger('value')
-        if not processing:
-            if doc.session_context:
-                doc.add_timeout_callback(partial(self._change_coroutine, doc), self._debounce)
-            else:
-                self._change_event(doc)
+        self._schedule_change(doc, ref, 'clicks', self.clicks+1)
+
+    def _process_events(self, events):
+        if 'clicks' in events:
+            self.param.trigger('value')
+        super()._process_events(events)
 
     def _process_property_change(self, msg):
         msg = super()._process_property_change(msg)
@@ -164,13 +162,7 @@ class MenuButton(_ClickButton):
         self.param.watch(callback, 'clicked', onlychanged=False)
 
     def _server_click(self, doc, ref, event):
-        processing = bool(self._events)
         if isinstance(event, MenuItemClick):
-            self._events.update({"clicked": event.item})
+            self._schedule_change(doc, ref, 'clicked', event.item)
         elif isinstance(event, ButtonClick):
-            self._events.update({"clicked": self.name})
-        if not processing:
-            if doc.session_context:
-                doc.add_timeout_callback(partial(self._change_coroutine, doc), self._debounce)
-            else:
-                self._change_event(doc)
+            self._schedule_change(doc, ref, 'clicked', self.name)
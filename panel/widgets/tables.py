@@ -1,5 +1,7 @@
 import datetime as dt
 
+from collections import OrderedDict
+
 from types import FunctionType, MethodType
 
 import numpy as np
@@ -27,6 +29,19 @@ from .button import Button
 from .input import TextInput
 
 
+def _equal(a, b):
+    """
+    Compares two filter values, treating failed or ambiguous
+    comparisons as inequality.
+    """
+    if type(a) is not type(b):
+        return False
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
 class BaseTable(ReactiveData, Widget):
 
     editors = param.Dict(default={}, doc="""
@@ -61,14 +76,24 @@ class BaseTable(ReactiveData, Widget):
 
     _rename = {'disabled': 'editable', 'selection': None}
 
+    # Number of sort orders to cache
+    _sort_cache_size = 4
+
     __abstract = True
 
     def __init__(self, value=None, **params):
         self._renamed_cols = {}
         self._filters = []
+        # Whether the processed data is out of sync with the value
+        self._processed_stale = True
+        # Caches of filter masks and sort orders computed on the value
+        self._filter_cache = {}
+        self._sort_cache = OrderedDict()
         super().__init__(value=value, **params)
 
     def _validate(self, event):
+        if event is None or event.name == 'value':
+            self._invalidate_cache()
         if self.value is None:
             return
         cols = self.value.columns
@@ -185,16 +210,52 @@ class BaseTable(ReactiveData, Widget):
             else:
                 self._update_columns(event, model)
 
-    def _filter_dataframe(self, df, ):
+    def _invalidate_cache(self):
+        """
+        Discards the processed data and any cached filter masks and
+        sort orders, e.g. after the value was replaced or edited.
+        """
+        self._processed_stale = True
+        self._filter_cache = {}
+        self._sort_cache = OrderedDict()
+
+    def _compute_filter_mask(self, column, val, col_name):
+        """
+        Computes the boolean mask of a constant filter value applied
+        to the supplied column, returning None if the filter is a no-op.
+        """
+        if np.isscalar(val):
+            return column == val
+        elif isinstance(val, (list, set)):
+            if not val:
+                return None
+            return column.isin(val)
+        elif isinstance(val, tuple):
+            start, end = val
+            if start is None and end is None:
+                return None
+            elif start is None:
+                return column<=end
+            elif end is None:
+                return column>=start
+            else:
+                return (column>=start) & (column<=end)
+        raise ValueError(f"'{col_name} filter value not "
+                         "understood. Must be either a scalar, "
+                         "tuple or list.")
+
+    def _filter_dataframe(self, df):
         """
         Filter the DataFrame.
 
+        When filtering the current value the mask computed by each
+        filter is cached alongside the filter value, ensuring that
+        only filters whose value changed have to be recomputed.
+
         Parameters
         ----------
         df : DataFrame
            The DataFrame to filter
-        query : dict
-            A dictionary containing all the query parameters
 
         Returns
         -------
@@ -202,40 +263,39 @@ class BaseTable(ReactiveData, Widget):
             The filtered DataFrame
         """
         filters = []
-        for col_name, filt in self._filters:
+        cacheable = df is self.value
+        cache = {}
+        for i, (col_name, filt) in enumerate(self._filters):
             if isinstance(filt, (FunctionType, MethodType)):
                 df = filt(df)
+                # Subsequent masks apply to the transformed DataFrame
+                cacheable = False
                 continue
             if isinstance(filt, param.Parameter):
                 val = getattr(filt.owner, filt.name)
             else:
                 val = filt
-            column = df[col_name]
-            if np.isscalar(val):
-                mask = column == val
-            elif isinstance(val, (list, set)):
-                if not val:
-                    continue
-                mask = column.isin(val)
-            elif isinstance(val, tuple):
-                start, end = val
-                if start is None and end is None:
-                    continue
-                elif start is None:
-                    mask = column<=end
-                elif end is None:
-                    mask = column>=start
-                else:
-                    mask = (column>=start) & (column<=end)
+            if isinstance(val, list):
+                key = tuple(val)
+            elif isinstance(val, set):
+                key = frozenset(val)
+            else:
+                key = val
+            cached = self._filter_cache.get((i, col_name)) if cacheable else None
+            if cached is not None and cached[0] is filt and _equal(cached[1], key):
+                mask = cached[2]
             else:
-                raise ValueError(f"'{col_name} filter value not "
-                                 "understood. Must be either a scalar, "
-                                 "tuple or list.")
-            filters.append(mask)
+                mask = self._compute_filter_mask(df[col_name], val, col_name)
+            if cacheable:
+                cache[(i, col_name)] = (filt, key, mask)
+            if mask is not None:
+                filters.append(mask)
+        if cacheable:
+            self._filter_cache = cache
         if filters:
             mask = filters[0]
-            for f in filters:
-                mask &= f
+            for f in filters[1:]:
+                mask = mask & f
             df = df[mask]
         return df
 
@@ -307,6 +367,7 @@ class BaseTable(ReactiveData, Widget):
         return df, {k if isinstance(k, str) else str(k): v for k, v in data}
 
     def _update_column(self, column, array):
+        self._invalidate_cache()
         self.value[column] = array
 
     #----------------------------------------------------------------
@@ -385,9 +446,7 @@ class BaseTable(ReactiveData, Widget):
             if reset_index:
                 stream_value = stream_value.reset_index(drop=True)
                 stream_value.index += value_index_start
-            combined = pd.concat([self.value, stream_value])
-            if rollover is not None:
-                combined = combined.iloc[-rollover:]
+            combined = self._stream_frame(self.value, stream_value, rollover)
             with param.discard_events(self):
                 self.value = combined
             try:
@@ -403,6 +462,7 @@ class BaseTable(ReactiveData, Widget):
                 self._updating = False
         elif isinstance(stream_value, pd.Series):
             self.value.loc[value_index_start] = stream_value
+            self._invalidate_cache()
             if rollover is not None and len(self.value) > rollover:
                 with param.discard_events(self):
                     self.value = self.value.iloc[-rollover:]
@@ -470,6 +530,7 @@ class BaseTable(ReactiveData, Widget):
         >>> tabulator.value.to_dict("list")
         {'x': [3, 4], 'y': ['c', 'd']}
         """
+        self._invalidate_cache()
         if self.value is None or isinstance(patch_value, dict):
             self._patch(patch_value)
             return
@@ -482,12 +543,7 @@ class BaseTable(ReactiveData, Widget):
             )
 
         if isinstance(patch_value, pd.DataFrame):
-            patch_value_dict = {}
-            for column in patch_value.columns:
-                patch_value_dict[column] = []
-                for index in patch_value.index:
-                    patch_value_dict[column].append((index, patch_value.loc[index, column]))
-            self.patch(patch_value_dict)
+            self._patch(self._patch_dataframe(self.value, patch_value))
         elif isinstance(patch_value, pd.Series):
             if "index" in patch_value:  # Series orient is row
                 patch_value_dict = {
@@ -730,6 +786,9 @@ class Tabulator(BaseTable):
 
     _data_params = ['value', 'page', 'page_size', 'pagination', 'sorters']
 
+    # Parameters which only change the window of rows being displayed
+    _window_params = ['page', 'page_size']
+
     _config_params = ['frozen_columns', 'groups', 'selectable']
 
     _manual_params = BaseTable._manual_params + _config_params
@@ -780,24 +839,66 @@ class Tabulator(BaseTable):
                 return
         model.configuration = self._get_configuration(model.columns)
 
-    def _sort_df(self, df):
-        if not self.sorters:
-            return df
-        return df.sort_values(
+    def _get_sort_order(self):
+        """
+        Returns the positional order of the rows in the value for the
+        current sorters, caching the orders of the most recently used
+        sorter definitions. Returns None if the order cannot be cached.
+        """
+        key = tuple((s['field'], s['dir']) for s in self.sorters)
+        if key in self._sort_cache:
+            self._sort_cache.move_to_end(key)
+            return self._sort_cache[key]
+        value = self.value
+        functions = any(isinstance(filt, (FunctionType, MethodType))
+                        for _, filt in self._filters)
+        if functions or not value.index.is_unique:
+            # Function filters may transform the data so the order of
+            # the value does not necessarily apply to the filtered data
+            return None
+        sorted_df = value.sort_values(
             [s['field'] for s in self.sorters],
             ascending=[s['dir'] == 'asc' for s in self.sorters]
         )
+        order = value.index.get_indexer(sorted_df.index)
+        self._sort_cache[key] = order
+        while len(self._sort_cache) > self._sort_cache_size:
+            self._sort_cache.popitem(last=False)
+        return order
+
+    def _sort_df(self, df):
+        if not self.sorters:
+            return df
+        order = self._get_sort_order()
+        positions = None if order is None else self.value.index.get_indexer(df.index)
+        if positions is None or (positions < 0).any():
+            return df.sort_values(
+                [s['field'] for s in self.sorters],
+                ascending=[s['dir'] == 'asc' for s in self.sorters]
+            )
+        # Restrict the cached order of the value to the filtered rows
+        lookup = np.full(len(self.value), -1)
+        lookup[positions] = np.arange(len(positions))
+        selected = lookup[order]
+        return df.iloc[selected[selected >= 0]]
 
     def _get_data(self):
         if self.pagination != 'remote' or self.value is None:
             return super()._get_data()
         df = self._filter_dataframe(self.value)
         df = self._sort_df(df)
+        return df, self._get_window_data(df)
+
+    def _get_window_data(self, df):
+        """
+        Serializes only the rows in the currently requested window
+        (i.e. the current page) of the processed DataFrame.
+        """
         nrows = self.page_size
         start = (self.page-1)*nrows
         page_df = df.iloc[start: start+nrows]
         data = ColumnDataSource.from_df(page_df).items()
-        return df, {k if isinstance(k, str) else str(k): v for k, v in data}
+        return {k if isinstance(k, str) else str(k): v for k, v in data}
 
     @property
     def _length(self):
@@ -860,10 +961,19 @@ class Tabulator(BaseTable):
             end = start+nrows
             filtered = {}
             for c, values in patch.items():
-                values = [(ind, val) for (ind, val) in values
-                          if ind >= start and ind < end]
-                if values:
-                    filtered[c] = values
+                page_values = []
+                for ind, val in values:
+                    if isinstance(ind, slice):
+                        ind_start = 0 if ind.start is None else ind.start
+                        ind_stop = self._length if ind.stop is None else ind.stop
+                        lower, upper = max(ind_start, start), min(ind_stop, end)
+                        if lower < upper:
+                            val = val[lower-ind_start:upper-ind_start]
+                            page_values.append((slice(lower-start, upper-start), val))
+                    elif ind >= start and ind < end:
+                        page_values.append((ind-start, val))
+                if page_values:
+                    filtered[c] = page_values
             patch = filtered
         if not patch:
             return
@@ -874,7 +984,20 @@ class Tabulator(BaseTable):
     def _update_cds(self, *events):
         if self._updating:
             return
-        super()._update_cds(*events)
+        window_only = (
+            events and self.pagination == 'remote' and not self._processed_stale
+            and all(e.obj is self and e.name in self._window_params for e in events)
+        )
+        if window_only:
+            # The filtered and sorted data is unchanged so we only
+            # have to slice and serialize the requested window
+            self._data = self._get_window_data(self._processed)
+            for ref, (m, _) in self._models.items():
+                m.source.data = self._data
+                push_on_root(ref)
+        else:
+            super()._update_cds(*events)
+            self._processed_stale = False
         if self.pagination:
             self._update_max_page()
             self._update_selected()
@@ -909,6 +1032,7 @@ class Tabulator(BaseTable):
         super()._update_selected(*events, **kwargs)
 
     def _update_column(self, column, array):
+        self._invalidate_cache()
         if self.pagination != 'remote':
             self.value[column] = array
             return